@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Minify and fingerprint static assets.
+
+Each entry of ASSETS is (optionally) minified and written to assets/dist/
+under a content-hashed name, e.g. /assets/css/styles.css becomes
+/assets/dist/styles.1a2b3c4d5e.css. assets/dist/manifest.json maps the
+source URLs to the fingerprinted ones. Templates resolve their references
+through the manifest when they are compiled, and hand-written pages are
+rewritten in place, so every page links to immutable, cacheable files.
+
+A local .css/.js/.wasm reference that is neither in the manifest nor on disk
+is an error and fails the build.
+"""
+import sys
+import os
+import re
+import json
+import hashlib
+import posixpath
+from pathlib import Path
+
+import compress
+
+DIST_DIR = Path('assets/dist')
+MANIFEST_PATH = DIST_DIR / 'manifest.json'
+HASH_LENGTH = 10
+
+# Source URL -> (minifier name or None, {literal in the file: URL it refers to})
+# Assets that refer to other assets come after them.
+ASSETS = {
+    '/assets/css/styles.css': ('css', {}),
+    '/assets/theme.js': ('js', {}),
+    '/assets/search.js': ('js', {}),
+    '/games/pong/pong.wasm': (None, {}),
+    # Emscripten output: already minified; it loads pong.wasm from its own directory
+    '/games/pong/pong.js': (None, {'"pong.wasm"': '/games/pong/pong.wasm'}),
+}
+
+# Hand-written pages outside the shared layout whose references are rewritten
+REWRITTEN_PAGES = ['games/pong/index.html']
+
+REFERENCE = re.compile(r'''(\b(?:href|src)=["'])([^"'#?]+\.(?:css|js|wasm))(["'])''')
+FINGERPRINTED = re.compile(rf'^/assets/dist/(.+)\.[0-9a-f]{{{HASH_LENGTH}}}(\.\w+)$')
+
+class MissingAssetError(Exception):
+    pass
+
+def minify_css(text):
+    """Drop comments and whitespace that carries no meaning."""
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.DOTALL)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\s*([{};,>])\s*', r'\1', text)
+    # Not before ':', where a space separates a descendant from a pseudo-class
+    text = re.sub(r':\s+', ':', text)
+    return text.replace(';}', '}').strip() + '\n'
+
+# A '/' after one of these starts a regex literal; after anything else it divides
+REGEX_AFTER = set('(,=:[!&|?{};+-*%<>~^') | {'', 'return', 'typeof', 'case', 'do', 'else', 'in',
+                                             'instanceof', 'new', 'delete', 'void', 'throw', 'of',
+                                             'yield', 'await'}
+
+def scan_quoted(text, i, end):
+    """Index just past the string or regex literal opening at i, which ends at an unescaped end."""
+    j, in_class = i + 1, False
+    while j < len(text) and text[j] != '\n':
+        ch = text[j]
+        if ch == '\\':
+            j += 2
+            continue
+        j += 1
+        if end == '/' and ch in '[]':
+            in_class = ch == '['
+        elif ch == end and not in_class:
+            break
+    return j
+
+def scan_template(text, i):
+    """(index past the template text starting at i, whether a `${` substitution opened there)."""
+    j = i
+    while j < len(text):
+        if text[j] == '\\':
+            j += 2
+        elif text[j] == '`':
+            return j + 1, False
+        elif text.startswith('${', j):
+            return j + 2, True
+        else:
+            j += 1
+    return j, False
+
+def minify_js(text):
+    """Drop comments, indentation, blank lines and repeated spaces outside literals.
+
+    Strings, template literals and regexes are copied as they are, and line
+    breaks between statements are kept, so automatic semicolon insertion
+    behaves exactly as in the source.
+    """
+    out = []
+    substitutions = []  # brace depth outside each open template's ${...}
+    depth = 0
+    last = ''  # last code token, to tell a regex from a division
+    space = ''  # whitespace since the last token: '', ' ' or '\n'
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if ch.isspace():
+            space = '\n' if ch == '\n' or space == '\n' else ' '
+            i += 1
+            continue
+        if text.startswith('//', i):
+            end = text.find('\n', i)
+            i = len(text) if end == -1 else end
+            continue
+        if text.startswith('/*', i):
+            end = text.find('*/', i + 2)
+            end = len(text) if end == -1 else end + 2
+            space = '\n' if '\n' in text[i:end] or space == '\n' else ' '
+            i = end
+            continue
+        if out and space:
+            out.append(space)
+        space = ''
+
+        if ch == '}' and substitutions and depth == 0:
+            # The end of a ${...}: the template text resumes
+            depth = substitutions.pop()
+            end, opened = scan_template(text, i + 1)
+        elif ch == '`':
+            end, opened = scan_template(text, i + 1)
+        else:
+            opened = None
+        if opened is not None:
+            out.append(text[i:end])
+            if opened:
+                substitutions.append(depth)
+                depth = 0
+                last = '{'
+            else:
+                last = '`'
+            i = end
+            continue
+
+        if ch in '\'"' or (ch == '/' and last in REGEX_AFTER):
+            end = scan_quoted(text, i, ch)
+            if ch == '/':
+                while end < len(text) and (text[end].isalnum() or text[end] in '_$'):
+                    end += 1  # flags
+            last = text[i:end]
+        elif ch.isalnum() or ch in '_$':
+            end = i + 1
+            while end < len(text) and (text[end].isalnum() or text[end] in '_$'):
+                end += 1
+            last = text[i:end]
+        else:
+            end = i + 1
+            depth += {'{': 1, '}': -1}.get(ch, 0)
+            last = ch
+        out.append(text[i:end])
+        i = end
+    return ''.join(out) + '\n'
+
+MINIFIERS = {'css': minify_css, 'js': minify_js}
+
+def fingerprinted_url(url, data):
+    stem, ext = posixpath.splitext(posixpath.basename(url))
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    return f'/{DIST_DIR.as_posix()}/{stem}.{digest}{ext}'
+
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def build_assets():
+    """Write every fingerprinted asset and the manifest. Returns True if the manifest changed."""
+    manifest = {}
+    for url, (minifier, refs) in ASSETS.items():
+        source = Path(url.lstrip('/'))
+        if not source.exists():
+            raise MissingAssetError(f"Asset not found: {source}")
+        data = source.read_bytes()
+        if minifier:
+            data = MINIFIERS[minifier](data.decode('utf-8')).encode('utf-8')
+        for literal, target in refs.items():
+            # Same directory in dist/, so only the file name changes
+            name = posixpath.basename(manifest[target])
+            data = data.replace(literal.encode(), literal.replace(posixpath.basename(target), name).encode())
+
+        manifest[url] = fingerprinted_url(url, data)
+        output = Path(manifest[url].lstrip('/'))
+        if not output.exists():
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_bytes(data)
+
+    # Old fingerprints (and their sidecars) are no longer linked from anywhere
+    current = {Path(url.lstrip('/')).name for url in manifest.values()} | {MANIFEST_PATH.name}
+    for path in DIST_DIR.iterdir():
+        if path.name.split('.gz')[0].split('.br')[0] not in current:
+            path.unlink()
+
+    if manifest == load_manifest():
+        return False
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return True
+
+def source_url(url, page_url='/'):
+    """The source URL a (possibly relative or fingerprinted) reference points at."""
+    url = posixpath.normpath(posixpath.join(posixpath.dirname(page_url), url))
+    match = FINGERPRINTED.match(url)
+    if match:
+        stem, ext = match.groups()
+        for source in ASSETS:
+            if posixpath.basename(source) == stem + ext:
+                return source
+    return url
+
+def rewrite_refs(html, page_url='/', manifest=None):
+    """Point every asset reference in html at its fingerprinted file."""
+    manifest = load_manifest() if manifest is None else manifest
+
+    def replace(match):
+        url = source_url(match.group(2), page_url)
+        return match.group(1) + manifest.get(url, match.group(2)) + match.group(3)
+    return REFERENCE.sub(replace, html)
+
+def missing_refs(html, page_url='/'):
+    """Local asset references in html that do not resolve to a file."""
+    missing = []
+    for match in REFERENCE.finditer(html):
+        url = match.group(2)
+        if '://' in url or url.startswith('//'):
+            continue
+        resolved = posixpath.normpath(posixpath.join(posixpath.dirname(page_url), url))
+        if not Path(resolved.lstrip('/')).is_file():
+            missing.append(url)
+    return missing
+
+def page_url(path):
+    """Site URL of a page file, e.g. games/pong/index.html -> /games/pong/index.html."""
+    return '/' + Path(path).as_posix()
+
+def rewrite_page(path):
+    """Rewrite a hand-written page's references in place. Returns True if it changed."""
+    with open(path, 'r', encoding='utf-8') as f:
+        html = f.read()
+    updated = rewrite_refs(html, page_url(path))
+    if updated == html:
+        return False
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(updated)
+    os.replace(tmp_path, path)
+    compress.refresh_sidecars(path)
+    return True
+
+def check_pages(paths):
+    """Raise MissingAssetError listing every page with a dangling asset reference."""
+    problems = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for url in missing_refs(f.read(), page_url(path)):
+                problems.append(f"{path}: {url}")
+    if problems:
+        raise MissingAssetError("Missing assets:\n  " + "\n  ".join(problems))
+
+def main():
+    try:
+        changed = build_assets()
+        for path in REWRITTEN_PAGES:
+            if rewrite_page(path):
+                print(f"Updated {path}")
+        check_pages(REWRITTEN_PAGES)
+    except MissingAssetError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print("✅ Assets are up to date" + (" (manifest changed; run build.py)" if changed else ""))
+
+if __name__ == '__main__':
+    main()
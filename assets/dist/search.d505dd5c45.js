@@ -0,0 +1,90 @@
+const SEARCH_ROOT = '/assets/search/';
+const DOCS_PER_BUCKET = 500;
+const cache = new Map();
+const tokenize = (text) => text.toLowerCase().match(/[\p{L}\p{N}_]+/gu) || [];
+const shardName = (term) => [...term].slice(0, 2).map((c) => (/[a-z0-9]/.test(c) ? c : '_')).join('');
+const fetchJSON = (path) => {
+if (!cache.has(path)) {
+cache.set(path, fetch(SEARCH_ROOT + path)
+.then((response) => (response.ok ? response.json() : {}))
+.catch(() => ({})));
+}
+return cache.get(path);
+};
+const postingsFor = async (term, isPrefix) => {
+const shard = await fetchJSON(`${shardName(term)}.json`);
+if (!isPrefix) {
+return shard[term] || {};
+}
+const merged = {};
+for (const [candidate, docs] of Object.entries(shard)) {
+if (candidate.startsWith(term)) {
+for (const [id, positions] of Object.entries(docs)) {
+merged[id] = (merged[id] || []).concat(positions);
+}
+}
+}
+return merged;
+};
+const search = async (query) => {
+const terms = tokenize(query);
+if (!terms.length) {
+return [];
+}
+const postings = await Promise.all(terms.map((term, i) => postingsFor(term, i === terms.length - 1)));
+const scores = new Map();
+for (const id of Object.keys(postings[0])) {
+if (!postings.every((docs) => id in docs)) {
+continue;
+}
+let score = postings.reduce((sum, docs) => sum + docs[id].length, 0);
+if (postings.length > 1) {
+const next = postings.slice(1).map((docs) => new Set(docs[id]));
+for (const start of postings[0][id]) {
+if (next.every((positions, i) => positions.has(start + i + 1))) {
+score += 10;
+}
+}
+}
+scores.set(id, score);
+}
+const ranked = [...scores.entries()].sort((a, b) => b[1] - a[1]).slice(0, 50);
+const buckets = await Promise.all(ranked.map(([id]) => fetchJSON(`docs/${Math.floor(id / DOCS_PER_BUCKET)}.json`)));
+return ranked.map(([id], i) => buckets[i][id]).filter(Boolean);
+};
+document.addEventListener('DOMContentLoaded', () => {
+const input = document.getElementById('search-input');
+const status = document.getElementById('search-status');
+const results = document.getElementById('search-results');
+let latest = 0;
+const run = async () => {
+const query = input.value.trim();
+const request = ++latest;
+const found = await search(query);
+if (request !== latest) {
+return;
+}
+results.replaceChildren(...found.map(([url, title, excerpt]) => {
+const article = document.createElement('article');
+article.className = 'post-preview';
+const heading = document.createElement('h4');
+const link = document.createElement('a');
+link.href = url;
+link.textContent = title;
+heading.appendChild(link);
+article.appendChild(heading);
+if (excerpt) {
+const summary = document.createElement('p');
+summary.className = 'excerpt';
+summary.textContent = excerpt;
+article.appendChild(summary);
+}
+return article;
+}));
+status.textContent = query ? `${found.length} result${found.length === 1 ? '' : 's'}` : '';
+history.replaceState(null, '', query ? `?q=${encodeURIComponent(query)}` : location.pathname);
+};
+input.addEventListener('input', run);
+input.value = new URLSearchParams(location.search).get('q') || '';
+run();
+});
@@ -0,0 +1,26 @@
+const getPreferredTheme = () => {
+const savedTheme = localStorage.getItem('theme');
+if (savedTheme) {
+return savedTheme;
+}
+return window.matchMedia('(prefers-color-scheme: dark)').matches ? 'dark' : 'light';
+};
+const setTheme = (theme) => {
+document.documentElement.setAttribute('data-theme', theme);
+localStorage.setItem('theme', theme);
+};
+setTheme(getPreferredTheme());
+document.addEventListener('DOMContentLoaded', () => {
+const themeToggle = document.querySelector('.theme-toggle');
+themeToggle.textContent = 'Toggle theme';
+themeToggle.addEventListener('click', () => {
+const currentTheme = document.documentElement.getAttribute('data-theme');
+const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+setTheme(newTheme);
+});
+window.matchMedia('(prefers-color-scheme: dark)').addEventListener('change', (e) => {
+if (!localStorage.getItem('theme')) {
+setTheme(e.matches ? 'dark' : 'light');
+}
+});
+});
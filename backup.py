@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Content-addressed backup store for files the scripts overwrite or delete.
+
+Every backed-up version is stored once under .backups/objects/, keyed by its
+SHA-256, so identical versions cost nothing extra. .backups/index.json keeps
+the last KEEP_GENERATIONS versions of each path, each tagged with the batch
+(one run of a script) that replaced it, so a bad run can be undone in one
+step with `python backup.py restore --batch ID`.
+"""
+import sys
+import os
+import json
+import time
+import hashlib
+from pathlib import Path
+from datetime import datetime
+
+import timings
+import compress
+
+STORE_DIR = Path('.backups')
+OBJECTS_DIR = STORE_DIR / 'objects'
+INDEX_PATH = STORE_DIR / 'index.json'
+KEEP_GENERATIONS = 10
+
+# One batch per process: everything a single script run replaced
+BATCH_ID = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+def load_index():
+    try:
+        with open(INDEX_PATH, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_index(index):
+    STORE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = INDEX_PATH.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, INDEX_PATH)
+
+def object_path(digest):
+    return OBJECTS_DIR / digest[:2] / digest
+
+def store_version(index, path, batch, stage):
+    """Add path's current contents to the store and to index (not saved).
+
+    Returns (content hash or None if path does not exist, whether a new
+    generation was added, whether old generations expired).
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None, False, False
+    digest = hashlib.sha256(data).hexdigest()
+
+    generations = index.setdefault(str(path), [])
+    if generations and generations[-1]['hash'] == digest:
+        return digest, False, False
+
+    target = object_path(digest)
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_suffix('.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, target)
+        stage.wrote(len(data))
+
+    generations.append({'hash': digest, 'time': time.time(), 'batch': batch, 'size': len(data)})
+    expired = len(generations) > KEEP_GENERATIONS
+    del generations[:-KEEP_GENERATIONS]
+    return digest, True, expired
+
+def backup_file(path, batch=BATCH_ID):
+    """Back up path's current contents before it is overwritten or deleted.
+
+    Returns the content hash, or None if path does not exist. Nothing is
+    written when the latest backup of path already has the same content.
+    """
+    return backup_files([path], batch)[0]
+
+def backup_files(paths, batch=BATCH_ID):
+    """Back up several files with a single update of the index. Returns their hashes."""
+    paths = [Path(path) for path in paths]
+    with timings.stage('backup', reads=paths) as stage:
+        index = load_index()
+        digests = []
+        changed = expired = False
+        for path in paths:
+            digest, added, path_expired = store_version(index, path, batch, stage)
+            digests.append(digest)
+            changed = changed or added
+            expired = expired or path_expired
+        if changed:
+            save_index(index)
+        if expired:
+            collect_garbage(index)
+    return digests
+
+def restore_file(path, generation=1):
+    """Restore path to its n-th most recent backup (1 = latest)."""
+    generations = load_index().get(str(path), [])
+    if not 1 <= generation <= len(generations):
+        raise ValueError(f"No backup generation {generation} for {path}")
+    entry = generations[-generation]
+
+    # Read first: the safety backup can expire this generation and collect its object
+    data = object_path(entry['hash']).read_bytes()
+    path = Path(path)
+    backup_file(path)  # the restore itself can be undone
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = Path(f'{path}.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    compress.refresh_sidecars(path)
+    return entry
+
+def restore_batch(batch):
+    """Put back every file as it was before the given batch touched it."""
+    restored = []
+    for path, generations in sorted(load_index().items()):
+        # The batch's first backup of a file is its state before the batch
+        for i, entry in enumerate(generations):
+            if entry['batch'] == batch:
+                restore_file(path, len(generations) - i)
+                restored.append(path)
+                break
+    if not restored:
+        raise ValueError(f"No backups recorded for batch {batch}")
+    return restored
+
+def collect_garbage(index=None):
+    """Delete objects no generation refers to any more."""
+    index = load_index() if index is None else index
+    live = {entry['hash'] for generations in index.values() for entry in generations}
+    for path in OBJECTS_DIR.glob('*/*'):
+        if path.name not in live:
+            path.unlink()
+
+def prune(max_age_days=None, max_bytes=None):
+    """Drop generations older than max_age_days, then the oldest ones until
+    the store holds at most max_bytes. Returns the number dropped."""
+    index = load_index()
+    entries = sorted(((entry['time'], path, entry) for path, generations in index.items()
+                      for entry in generations), key=lambda e: (e[0], e[1]))
+    cutoff = time.time() - max_age_days * 86400 if max_age_days is not None else None
+
+    sizes = {entry['hash']: entry['size'] for _, _, entry in entries}
+    total = sum(sizes.values())
+    refs = {}
+    for _, _, entry in entries:
+        refs[entry['hash']] = refs.get(entry['hash'], 0) + 1
+
+    dropped = 0
+    for timestamp, path, entry in entries:
+        too_old = cutoff is not None and timestamp < cutoff
+        too_big = max_bytes is not None and total > max_bytes
+        if not (too_old or too_big):
+            break
+        index[path].remove(entry)
+        if not index[path]:
+            del index[path]
+        refs[entry['hash']] -= 1
+        if not refs[entry['hash']]:
+            total -= sizes[entry['hash']]
+        dropped += 1
+
+    save_index(index)
+    collect_garbage(index)
+    return dropped
+
+def print_backups(path=None):
+    index = load_index()
+    for name in sorted(index):
+        if path and name != str(Path(path)):
+            continue
+        print(name)
+        for n, entry in enumerate(reversed(index[name]), start=1):
+            when = datetime.fromtimestamp(entry['time']).strftime('%Y-%m-%d %H:%M:%S')
+            print(f"  {n:>2}. {when}  batch {entry['batch']}  {entry['size']} bytes  {entry['hash'][:12]}")
+
+def usage():
+    print("Usage: python backup.py list [path]")
+    print("       python backup.py restore <path> [generation]")
+    print("       python backup.py restore --batch <batch-id>")
+    print("       python backup.py prune [--max-age DAYS] [--max-size MB]")
+    sys.exit(1)
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        usage()
+    command, args = args[0], args[1:]
+
+    try:
+        if command == 'list' and len(args) <= 1:
+            print_backups(*args)
+        elif command == 'restore' and len(args) == 2 and args[0] == '--batch':
+            for path in restore_batch(args[1]):
+                print(f"Restored {path}")
+            print("Run python build.py to bring the index pages and search index up to date.")
+        elif command == 'restore' and len(args) in (1, 2):
+            generation = int(args[1]) if len(args) == 2 else 1
+            entry = restore_file(args[0], generation)
+            print(f"Restored {args[0]} from batch {entry['batch']}")
+        elif command == 'prune':
+            options = dict(zip(args[::2], args[1::2]))
+            if len(args) % 2 or set(options) - {'--max-age', '--max-size'}:
+                usage()
+            max_age = float(options['--max-age']) if '--max-age' in options else None
+            max_size = float(options['--max-size']) * 1024 * 1024 if '--max-size' in options else None
+            print(f"Pruned {prune(max_age, max_size)} backup generation(s)")
+        else:
+            usage()
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
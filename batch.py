@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""Apply a plan of create, update, re-date and delete operations in one run.
+
+    python update.py batch PLAN [--check]
+
+Plan lines are those in SYNTAX; '#' starts a comment. The whole plan is
+validated before anything changes, and a failure rolls every file back.
+"""
+import sys
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+import build
+import compress
+import feeds
+import search
+import taxonomy
+import timings
+from backup import BATCH_ID, backup_files, object_path
+from create1 import decode_text, import_post, slugify, validate_book_name
+from posts import SECTIONS, Post, file_hash, read_post_date
+
+LOCK_PATH = Path('.build/batch.lock')
+SYNTAX = {
+    'create': 'create <type> <draft.txt> [YYYY-MM-DD]',
+    'update': 'update <type> <year/post-name> [draft.txt]',
+    'date': 'date <type> <year/post-name> <YYYY-MM-DD>',
+    'delete': 'delete <type> <year/post-name>',
+}
+# (fewest, most) arguments after the post type
+ARGUMENTS = {'create': (1, 2), 'update': (1, 2), 'date': (2, 2), 'delete': (1, 1)}
+# Repository state, and the backups a rollback reads from
+SKIPPED_DIRS = {'.git', '.backups', '__pycache__'}
+
+class Operation(NamedTuple):
+    action: str
+    post: Post
+    draft: Path = None
+    date: datetime = None
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise ValueError(f"invalid date '{value}', expected YYYY-MM-DD")
+
+def parse_target(post_type, target):
+    parts = target.rstrip('/').split('/')
+    if len(parts) != 2 or not all(parts):
+        raise ValueError(f"'{target}': expected year/post-name")
+    return Post(post_type, parts[0], parts[1])
+
+def parse_operation(fields):
+    """One plan line, already split into fields, as an Operation. Raises ValueError."""
+    action, args = fields[0].lower(), fields[1:]
+    if action not in SYNTAX:
+        raise ValueError(f"unknown operation '{fields[0]}'")
+    fewest, most = ARGUMENTS[action]
+    if not args or args[0].lower() not in SECTIONS or not fewest <= len(args) - 1 <= most:
+        raise ValueError(f"expected {SYNTAX[action]}")
+    post_type, target, extra = args[0].lower(), args[1], args[2:]
+
+    if action == 'create':
+        draft = Path(target)
+        post = Post(post_type, str(datetime.now().year), slugify(draft.stem))
+        return Operation(action, post, draft, parse_date(extra[0]) if extra else None)
+    post = parse_target(post_type, target)
+    if action == 'update':
+        return Operation(action, post, Path(extra[0]) if extra else None)
+    if action == 'date':
+        return Operation(action, post, date=parse_date(extra[0]))
+    return Operation(action, post)
+
+def parse_plan(path):
+    """(operations, problems) of a plan file."""
+    operations, problems = [], []
+    with open(path, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, start=1):
+            fields = line.split('#', 1)[0].split()
+            if not fields:
+                continue
+            try:
+                operations.append(parse_operation(fields))
+            except ValueError as e:
+                problems.append(f"line {number}: {e}")
+    return operations, problems
+
+def validate(operations):
+    """Check every operation against the tree. Returns ({post key: draft bytes}, problems)."""
+    drafts, problems = {}, []
+    seen = set()
+    for op in operations:
+        key = op.post.key
+        if key in seen:
+            problems.append(f"{key}: appears in more than one operation")
+            continue
+        seen.add(key)
+
+        exists = (op.post.dir / 'source.txt').exists()
+        if op.action == 'create':
+            if op.post.post_type == 'book' and not validate_book_name(op.post.name):
+                problems.append(f"{op.draft}: book drafts must be named 'Book-Title-by-Author-Name.txt'")
+            if op.post.dir.exists():
+                problems.append(f"{op.draft}: post already exists at {op.post.dir}")
+        elif not exists:
+            problems.append(f"Post not found at {op.post.dir}")
+            continue
+        elif op.action == 'update':
+            try:
+                read_post_date(op.post.dir)
+            except ValueError:
+                problems.append(f"{op.post.dir / 'date.txt'}: not a YYYY-MM-DD date")
+
+        if op.draft:
+            try:
+                data = op.draft.read_bytes()
+            except OSError as e:
+                problems.append(f"{op.draft}: {e.strerror or e}")
+                continue
+            if decode_text(data) is None:
+                problems.append(f"{op.draft}: could not read file with any known encoding")
+                continue
+            drafts[key] = data
+    return drafts, problems
+
+def iter_site_files(root='.'):
+    """Every file in the tree a batch could change or create."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIPPED_DIRS)
+        for name in sorted(filenames):
+            yield Path(dirpath, name).relative_to(root).as_posix()
+
+def is_post_file(path):
+    parts = path.split('/')
+    return len(parts) > 2 and parts[0] in SECTIONS.values() and parts[1] == 'posts'
+
+def is_listing_file(path):
+    """Whether rendering a batch can write or remove path, outside the post directories.
+
+    Compressed sidecars are not included; they follow their file on rollback.
+    """
+    parts = path.split('/')
+    if parts[0] == '.build':
+        return path != LOCK_PATH.as_posix()
+    if parts[0] in SECTIONS.values():
+        return not is_post_file(path) and parts[-1] in ('index.html', 'feed.xml')
+    if parts[0] in taxonomy.KINDS:
+        return parts[-1] == 'index.html'
+    return (path == feeds.SITEMAP_PATH
+            or path.startswith(f'{search.SEARCH_DIR.as_posix()}/') and path.endswith('.json')
+            or path.startswith(f'{feeds.SITEMAP_DIR.as_posix()}/') and path.endswith('.xml'))
+
+def write_atomically(path, text):
+    tmp_path = Path(f'{path}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+class Transaction:
+    """Remembers the files a batch is about to change, so they can be put back."""
+
+    def __init__(self):
+        self.existing = set(iter_site_files())
+        self.saved = {}  # path -> content hash before the batch, None if it did not exist
+
+    def protect(self, paths):
+        """Back up paths that were not backed up yet in this batch, in one go."""
+        paths = sorted({Path(path).as_posix() for path in paths} - self.saved.keys())
+        if paths:
+            self.saved.update(zip(paths, backup_files(paths)))
+
+    def rollback(self):
+        """Put every protected file back and remove the files created since. Returns their paths."""
+        touched = []
+        with timings.stage('rollback') as stage:
+            for path, digest in sorted(self.saved.items()):
+                if digest is None or file_hash(path) == digest:
+                    continue  # files the batch created go with the rest below
+                data = object_path(digest).read_bytes()
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = Path(f'{path}.tmp')
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+                compress.refresh_sidecars(path)
+                stage.wrote(len(data))
+                touched.append(path)
+            for path in sorted(set(iter_site_files()) - self.existing):
+                if not os.path.exists(path):
+                    continue  # a sidecar already removed with its file
+                os.remove(path)
+                compress.refresh_sidecars(path)
+                touched.append(path)
+                try:
+                    os.removedirs(os.path.dirname(path))
+                except OSError:
+                    pass
+        return touched
+
+def apply_plan(operations, drafts, transaction):
+    """Carry out the operations, then render everything they touched. Raises on failure."""
+    transaction.protect([path for path in transaction.existing if is_listing_file(path)] +
+                        [path.as_posix() for op in operations if op.post.dir.is_dir()
+                         for path in op.post.dir.rglob('*') if path.is_file()])
+    keys = []
+    with timings.stage('apply'):
+        for op in operations:
+            if op.action == 'create':
+                post_dir = import_post(op.post.post_type, op.draft.name, drafts[op.post.key])
+                if op.date:
+                    write_atomically(post_dir / 'date.txt', op.date.strftime('%Y-%m-%d'))
+                keys.append(post_dir.as_posix())
+                continue
+            if op.action == 'update' and op.draft:
+                write_atomically(op.post.dir / 'source.txt', decode_text(drafts[op.post.key]))
+            elif op.action == 'date':
+                write_atomically(op.post.dir / 'date.txt', op.date.strftime('%Y-%m-%d'))
+            elif op.action == 'delete':
+                shutil.rmtree(op.post.dir)
+            keys.append(op.post.key)
+
+    # One index, search, feed and related update for the whole plan
+    failures = build.build_posts(keys, before_write=transaction.protect)
+    if failures:
+        raise ValueError(f"{failures} post(s) failed to render")
+
+def acquire_lock():
+    """Take the batch lock for the rest of the process, or exit if another batch holds it."""
+    LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    lock = open(LOCK_PATH, 'a+')
+    if not fcntl:
+        print("Note: file locking is not available here; make sure no other batch is running")
+        return lock
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.seek(0)
+        print(f"Error: Another batch is running ({lock.read().strip() or LOCK_PATH})")
+        sys.exit(1)
+    lock.seek(0)
+    lock.truncate()
+    lock.write(f"batch {BATCH_ID}\n")
+    lock.flush()
+    return lock
+
+def usage():
+    print("Usage: python update.py batch <plan-file> [--check] [--timings] [--trace FILE]")
+    print("Plan lines:")
+    for syntax in SYNTAX.values():
+        print(f"  {syntax}")
+    sys.exit(1)
+
+def main(args=None):
+    args = timings.parse_args(list(sys.argv[1:] if args is None else args))
+    check_only = '--check' in args
+    args = [arg for arg in args if arg != '--check']
+    if len(args) != 1:
+        usage()
+    plan_path = args[0]
+
+    lock = acquire_lock()
+    try:
+        operations, problems = parse_plan(plan_path)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error: Could not read {plan_path}: {e}")
+        sys.exit(1)
+    drafts, tree_problems = validate(operations)
+    problems += tree_problems
+    if problems:
+        print("Error: Nothing was changed:")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+
+    counts = {action: sum(op.action == action for op in operations) for action in SYNTAX}
+    summary = ', '.join(f"{count} {action}" for action, count in counts.items() if count)
+    if not operations:
+        print(f"Nothing to do in {plan_path}")
+        return
+    if check_only:
+        print(f"✅ {plan_path} is valid ({summary}); nothing was changed")
+        return
+
+    transaction = Transaction()
+    try:
+        apply_plan(operations, drafts, transaction)
+    except BaseException as e:
+        touched = transaction.rollback()
+        print(f"\n❌ Batch failed: {e or type(e).__name__}")
+        print(f"Rolled back {len(touched)} file(s); the site is as it was before the batch.")
+        if isinstance(e, (ValueError, OSError)):
+            sys.exit(1)
+        raise
+    finally:
+        lock.close()
+
+    print(f"\n✅ Batch applied ({summary}).")
+    print("Note: Every file it replaced or deleted was backed up. To put them back, run:")
+    print(f"python backup.py restore --batch {BATCH_ID}")
+
+if __name__ == '__main__':
+    main()
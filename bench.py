@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""Benchmark the publishing scripts against a synthetic archive of each size.
+
+Results go to --output as JSON; --compare OLD.json fails on any stage that
+got more than REGRESSION_THRESHOLD slower.
+"""
+import sys
+import os
+import json
+import time
+import random
+import platform
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+from datetime import datetime
+
+import create1
+import update1
+import delete1
+from site_index import write_index
+
+DEFAULT_SIZES = [100, 1000, 10000]
+REGRESSION_THRESHOLD = 1.25
+BOOK_SHARE = 0.25
+NON_UTF8_SHARE = 0.2
+MAX_DRAFTS = 1000
+
+WORDS = ('the of and to in is that it was for on are as with his they at be this from have or by '
+         'one had not but what all were when we there can an your which their said if do will each '
+         'about how up out them then she many some so these would other into has more her two like '
+         'him see time could no make than first been its who now people my made over did down only '
+         'way find use may water long little very after words called just where most know café '
+         'naïve façade résumé').split()
+
+# Slug words; 'by' would split a book name in the wrong place
+NAME_WORDS = [word for word in WORDS if word.isascii() and word != 'by']
+
+def paragraph(rng):
+    words = rng.choices(WORDS, k=rng.randint(20, 120))
+    return ' '.join(words).capitalize() + '.'
+
+def source_text(rng):
+    """A post body of 1 to 60 paragraphs (mostly short) with the odd heading."""
+    count = min(60, int(rng.expovariate(1 / 12)) + 1)
+    lines = []
+    for i in range(count):
+        if i and rng.random() < 0.1:
+            lines.append(f'# {paragraph(rng)[:40]}')
+        lines.append(paragraph(rng))
+    return '\n\n'.join(lines) + '\n'
+
+def post_name(rng, n, book):
+    title = '-'.join(rng.choices(NAME_WORDS, k=rng.randint(2, 5)))
+    if book:
+        return f'{title}-{n}-by-{rng.choice(NAME_WORDS)}-{rng.choice(NAME_WORDS)}'
+    return f'{title}-{n}'
+
+def generate_site(size, rng):
+    """Write a synthetic site into the current directory. Returns (post keys, sources)."""
+    keys = []
+    sources = []
+    for n in range(size):
+        book = rng.random() < BOOK_SHARE
+        section = 'books' if book else 'essays'
+        year = rng.randint(2015, 2024)
+        post_dir = Path(f'{section}/posts/{year}/{post_name(rng, n, book)}')
+        post_dir.mkdir(parents=True)
+        text = source_text(rng)
+        (post_dir / 'source.txt').write_text(text, encoding='utf-8')
+        (post_dir / 'date.txt').write_text(f'{year}-{rng.randint(1, 12):02}-{rng.randint(1, 28):02}')
+        # Stands in for the rendered page: the index only lists published posts
+        (post_dir / 'index.html').write_text('<h2>Synthetic</h2>\n')
+        keys.append((post_dir.as_posix(), 'book' if book else 'essay'))
+        sources.append((post_dir.name, 'book' if book else 'essay', text))
+    return keys, sources
+
+def generate_drafts(count, rng):
+    """Drafts for the importer; NON_UTF8_SHARE of them in legacy encodings."""
+    Path('drafts').mkdir()
+    drafts = []
+    for n in range(count):
+        encoding = 'utf-8'
+        text = source_text(rng)
+        if rng.random() < NON_UTF8_SHARE:
+            # Legacy drafts, with Windows line endings to normalize
+            encoding = rng.choice(['cp1252', 'latin-1'])
+            text = text.replace('\n', '\r\n')
+        path = Path(f'drafts/draft-{n}.txt')
+        path.write_bytes(text.encode(encoding))
+        drafts.append(path)
+    return drafts
+
+def time_runs(stage, repeat):
+    """Run stage() repeat times. Returns (seconds per run, ops per run)."""
+    runs = []
+    ops = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ops = stage()
+        runs.append(time.perf_counter() - start)
+    return runs, ops
+
+def stages(keys, sources, drafts, rng):
+    """The benchmarked stages, as name -> function returning its op count."""
+    date = datetime(2024, 1, 1)
+
+    def convert():
+        for path in drafts:
+            if not create1.convert_to_utf8(path, 'converted.txt'):
+                raise RuntimeError(f"Could not decode {path}")
+        return len(drafts)
+
+    def to_html():
+        for _, _, text in sources:
+            update1.text_to_html(text)
+        return len(sources)
+
+    def generate():
+        for name, post_type, text in sources:
+            title, author = update1.post_titles(post_type, name)
+            update1.generate_html(post_type, title, update1.text_to_html(text), date, author)
+        return len(sources)
+
+    def index():
+        write_index('essay')
+        write_index('book')
+        return 2
+
+    remaining = list(keys)
+    rng.shuffle(remaining)
+
+    def remove():
+        key, _ = remaining.pop()
+        for path in Path(key).iterdir():
+            path.unlink()
+        Path(key).rmdir()
+        delete1.remove_from_index(key)
+        return 1
+
+    return {
+        'convert_to_utf8': convert,
+        'text_to_html': to_html,
+        'generate_html': generate,
+        'write_index': index,
+        'remove_from_index': remove,
+    }
+
+def run_size(size, repeat, seed):
+    """Benchmark every stage on a synthetic site of size posts."""
+    rng = random.Random(seed)
+    results = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='bench-') as root:
+        os.chdir(root)
+        try:
+            start = time.perf_counter()
+            keys, sources = generate_site(size, rng)
+            drafts = generate_drafts(min(size, MAX_DRAFTS), rng)
+            print(f"Generated {size} posts in {time.perf_counter() - start:.1f} s")
+
+            for name, stage in stages(keys, sources, drafts, rng).items():
+                runs, ops = time_runs(stage, repeat)
+                best = min(runs)
+                results.append({
+                    'size': size,
+                    'stage': name,
+                    'ops': ops,
+                    'best': best,
+                    'median': statistics.median(runs),
+                    'per_op_us': best / ops * 1e6,
+                })
+                print(f"  {name:<18} {best * 1000:>10.2f} ms  {best / ops * 1e6:>10.1f} µs/op  ({ops} ops)")
+        finally:
+            os.chdir(cwd)
+    return results
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results, baseline_path):
+    """Print the change against a previous run. Returns the number of regressions."""
+    with open(baseline_path, 'r') as f:
+        baseline = {(r['size'], r['stage']): r for r in json.load(f)['results']}
+
+    regressions = 0
+    print(f"\nCompared with {baseline_path}:")
+    for result in results:
+        old = baseline.get((result['size'], result['stage']))
+        if not old:
+            continue
+        ratio = result['per_op_us'] / old['per_op_us']
+        flag = ''
+        if ratio > REGRESSION_THRESHOLD:
+            regressions += 1
+            flag = '  ❌ regression'
+        print(f"  {result['size']:>7} {result['stage']:<18} {ratio:>6.2f}x{flag}")
+    return regressions
+
+def usage():
+    print("Usage: python bench.py [--sizes N,N,...] [--repeat N] [--seed N] [--output FILE] [--compare FILE]")
+    print(f"Defaults: --sizes {','.join(map(str, DEFAULT_SIZES))} --repeat 3 --seed 0 --output bench.json")
+    sys.exit(1)
+
+def main():
+    args = sys.argv[1:]
+    options = {'--sizes': ','.join(map(str, DEFAULT_SIZES)), '--repeat': '3', '--seed': '0',
+               '--output': 'bench.json', '--compare': None}
+    while args:
+        arg = args.pop(0)
+        if arg not in options or not args:
+            usage()
+        options[arg] = args.pop(0)
+
+    try:
+        sizes = [int(size) for size in options['--sizes'].split(',')]
+        repeat = int(options['--repeat'])
+        seed = int(options['--seed'])
+    except ValueError:
+        usage()
+    if repeat < 1 or any(size < 1 for size in sizes):
+        usage()
+    # remove_from_index deletes one post per run
+    repeat = min(repeat, min(sizes))
+
+    results = []
+    for size in sizes:
+        print(f"\n{size} posts:")
+        results.extend(run_size(size, repeat, seed))
+
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'repeat': repeat,
+        'results': results,
+    }
+    with open(options['--output'], 'w') as f:
+        json.dump(report, f, indent=1)
+    print(f"\nResults written to {options['--output']}")
+
+    if options['--compare'] and compare(results, options['--compare']):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
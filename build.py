@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""Incremental whole-site build.
+
+Re-renders only the posts whose source, date, template version or related
+list changed since the last build (.build/manifest.json), then updates the
+index, tag, search, feed and compressed files that depend on them.
+"""
+import sys
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from datetime import datetime
+
+import update1
+import search
+import compress
+import assets
+import feeds
+import related
+import metadata
+import taxonomy
+import templates
+from posts import iter_posts, read_post_date, file_hash, post_from_key
+from site_index import write_index
+from templates import STATIC_PAGES, refresh_static_page
+
+MANIFEST_PATH = Path('.build/manifest.json')
+
+def load_manifest():
+    """Load the manifest from the previous build, or an empty one."""
+    try:
+        with open(MANIFEST_PATH, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {'posts': {}}
+
+def save_manifest(manifest):
+    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = MANIFEST_PATH.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+def post_inputs(post, template, related_keys=()):
+    """The hashes (and related posts) a post's rendered page depends on."""
+    return {
+        'source': file_hash(post.dir / 'source.txt'),
+        'date': file_hash(post.dir / 'date.txt'),
+        'template': template,
+        'related': list(related_keys),
+    }
+
+def ensure_date(post):
+    """Give undated posts today's date, like update1.py does."""
+    date_file = post.dir / 'date.txt'
+    if not date_file.exists():
+        with open(date_file, 'w') as f:
+            f.write(datetime.now().strftime('%Y-%m-%d'))
+
+def plan_build(posts, manifest, template, force=False, lists={}):
+    """Work out what needs rebuilding.
+
+    Returns (stale posts, post types whose index is stale, inputs of every
+    current post). A post is stale if any of its inputs changed or its page is
+    missing; an index page is stale if any post it lists was added, changed
+    or removed.
+    """
+    previous = manifest.get('posts', {})
+    inputs = {}
+    stale = []
+    for post in posts:
+        inputs[post.key] = post_inputs(post, template, lists.get(post.key, []))
+        if (force or previous.get(post.key) != inputs[post.key]
+                or not (post.dir / 'index.html').exists()):
+            stale.append(post)
+
+    removed = [post_from_key(key) for key in previous if key not in inputs]
+    indexes = sorted({post.post_type for post in stale + removed})
+    return stale, indexes, inputs
+
+def render(post, related_keys=()):
+    """Render one post. Returns (html, search terms, metadata, None) or (None, None, None, error).
+
+    Runs in worker processes, so it only reads; pages are written by the parent.
+    """
+    try:
+        with open(post.dir / 'source.txt', 'r', encoding='utf-8') as f:
+            content = f.read()
+        date = read_post_date(post.dir)
+        terms = search.TermCollector()
+        collector = metadata.MetadataCollector(terms)
+        html = update1.render_post(post.post_type, post.name, content, date, collector, related_keys)
+        return html, terms.terms, collector.metadata(post, date, file_hash(post.dir / 'source.txt')), None
+    except (ValueError, UnicodeDecodeError) as e:
+        return None, None, None, str(e)
+
+def write_page(post, html):
+    """Write a post's page through a temporary file, so a failed build never leaves half of one."""
+    html_path = post.dir / 'index.html'
+    tmp_path = html_path.with_suffix('.html.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(html)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, html_path)
+    compress.refresh_sidecars(html_path)
+
+def render_all(posts, jobs=None, chunksize=None, lists={}):
+    """Render posts, in parallel when jobs > 1.
+
+    lists maps post keys to their related posts. Yields (post, html, search
+    terms, metadata, error) in input order.
+    """
+    related_lists = [lists.get(post.key, []) for post in posts]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(posts) < 2:
+        for post, related_keys in zip(posts, related_lists):
+            yield (post, *render(post, related_keys))
+        return
+
+    if not chunksize:
+        # A few chunks per worker keeps them all busy without per-post IPC
+        chunksize = max(1, len(posts) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for post, result in zip(posts, pool.map(render, posts, related_lists, chunksize=chunksize)):
+            yield (post, *result)
+
+def build_assets():
+    """Fingerprint the assets and point the layout and hand-written pages at them."""
+    if assets.build_assets():
+        print(f"Updated {assets.MANIFEST_PATH}")
+        templates.compile_layout()
+    for page in assets.REWRITTEN_PAGES:
+        if assets.rewrite_page(page):
+            print(f"Updated {page}")
+
+def check_assets():
+    """Fail on asset references that do not resolve, in the layout and every page it does not render."""
+    missing = assets.missing_refs(templates.render_page('', ''))
+    if missing:
+        raise assets.MissingAssetError(f"Missing assets in the layout: {', '.join(missing)}")
+    assets.check_pages(STATIC_PAGES + assets.REWRITTEN_PAGES + [search.SEARCH_PAGE])
+
+def build(force=False, jobs=None, chunksize=None):
+    """Rebuild every stale post. Returns the number of failures."""
+    build_assets()
+    manifest = load_manifest()
+    posts = list(iter_posts())
+    for post in posts:
+        ensure_date(post)
+
+    # --force also recomputes every related list from scratch
+    lists, _ = related.update_related(force=force)
+    stale, indexes, inputs = plan_build(posts, manifest, update1.template_version(), force, lists)
+    changed_keys = [post.key for post in stale]
+    changed_keys += [key for key in manifest.get('posts', {}) if key not in inputs]
+
+    failures = 0
+    terms = {}
+    metas = {}
+    for post, html, post_terms, meta, error in render_all(stale, jobs, chunksize, lists):
+        if error:
+            print(f"Error: {post.dir}: {error}")
+            inputs.pop(post.key)
+            failures += 1
+            continue
+        write_page(post, html)
+        terms[post.key] = post_terms
+        metas[post.key] = meta
+        print(f"Rendered {post.dir}")
+
+    metadata.record(metas, keep=inputs)
+    # Heal entries whose source changed without a render (e.g. a failed one)
+    metadata.lookup(inputs, sources={key: value['source'] for key, value in inputs.items()})
+    search.update_index(terms, all_keys=inputs)
+
+    for post_type in indexes:
+        # --force rescans the sections, e.g. after site_index.py itself changed
+        for path in write_index(post_type, None if force else changed_keys):
+            print(f"Updated {path}")
+    for path in taxonomy.update_taxonomy(None if force else changed_keys):
+        print(f"Updated {path}")
+    regenerate_feeds = force or not Path(feeds.SITEMAP_PATH).exists()
+    if indexes or regenerate_feeds:
+        for path in feeds.write_feeds(None if regenerate_feeds else changed_keys):
+            print(f"Updated {path}")
+
+    # Hand-written pages share the layout; this only writes if the chrome changed
+    for page in STATIC_PAGES:
+        if refresh_static_page(page):
+            print(f"Updated {page}")
+    if search.write_search_page():
+        print(f"Updated {search.SEARCH_PAGE}")
+    check_assets()
+
+    compressed, _ = compress.compress_site(jobs=jobs)
+    if compressed:
+        print(f"Compressed {compressed} file(s)")
+
+    save_manifest({'posts': inputs})
+    print(f"\n✅ Build finished: {len(stale) - failures} rendered, "
+          f"{len(posts) - len(stale)} unchanged, {failures} failed")
+    return failures
+
+def build_posts(keys, before_write=None):
+    """Rebuild just the given posts (and those whose related list they changed) without walking the tree.
+
+    Keys of removed posts drop them from the manifest and listings. If given,
+    before_write is called with the post pages about to be written (see
+    batch.py). Returns the number of failures.
+    """
+    lists, related_changed = related.update_related(keys)
+    manifest = load_manifest()
+    manifest.setdefault('posts', {})
+    template = update1.template_version()
+    post_types = set()
+    failures = 0
+    terms = {}
+    metas = {}
+    removed = []
+
+    posts = sorted(post_from_key(key) for key in set(keys) | related_changed)
+    if before_write:
+        before_write([post.dir / 'index.html' for post in posts])
+    for post in posts:
+        post_types.add(post.post_type)
+        if not (post.dir / 'source.txt').exists():
+            manifest['posts'].pop(post.key, None)
+            removed.append(post.key)
+            metas[post.key] = None
+            print(f"Removed {post.dir}")
+            continue
+
+        ensure_date(post)
+        html, post_terms, meta, error = render(post, lists.get(post.key, []))
+        if error:
+            print(f"Error: {post.dir}: {error}")
+            manifest['posts'].pop(post.key, None)
+            failures += 1
+            continue
+        write_page(post, html)
+        manifest['posts'][post.key] = post_inputs(post, template, lists.get(post.key, []))
+        terms[post.key] = post_terms
+        metas[post.key] = meta
+        print(f"Rendered {post.dir}")
+
+    metadata.record(metas)
+    search.update_index(terms, removed)
+
+    for post_type in sorted(post_types):
+        for path in write_index(post_type, keys):
+            print(f"Updated {path}")
+    for path in taxonomy.update_taxonomy(keys):
+        print(f"Updated {path}")
+    for path in feeds.write_feeds(keys):
+        print(f"Updated {path}")
+    save_manifest(manifest)
+    return failures
+
+def usage():
+    print("Usage: python build.py [--force] [--jobs N] [--chunksize N] [--store FILE]")
+    print("Rebuilds every post whose source.txt, date.txt or template changed.")
+    sys.exit(1)
+
+def main(args=None):
+    args = list(sys.argv[1:] if args is None else args)
+    force = False
+    store_path = None
+    options = {'--jobs': None, '--chunksize': None}
+    while args:
+        arg = args.pop(0)
+        if arg == '--force':
+            force = True
+        elif arg == '--store' and args:
+            store_path = args.pop(0)
+        elif arg in options and args and args[0].isdigit() and int(args[0]) > 0:
+            options[arg] = int(args.pop(0))
+        else:
+            usage()
+
+    if store_path:
+        import store
+        if not Path(store_path).exists():
+            print(f"Error: No content store at {store_path}")
+            sys.exit(1)
+        content_store = store.ContentStore(store_path)
+        print(f"Exported {len(content_store.export_tree())} file(s) from {store_path}")
+        content_store.close()
+
+    try:
+        failures = build(force, options['--jobs'], options['--chunksize'])
+    except assets.MissingAssetError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if failures:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Check every generated page for broken internal links and assets, and orphaned posts.
+
+Each page's references are cached in .build/check.json by content hash.
+"""
+import sys
+import os
+import json
+import time
+import hashlib
+import posixpath
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urlsplit, unquote
+from concurrent.futures import ProcessPoolExecutor
+
+from posts import iter_posts
+
+CACHE_PATH = Path('.build/check.json')
+EXTERNAL_SCHEMES = ('http:', 'https:', 'mailto:', 'tel:', 'javascript:', 'data:')
+REFERENCE_ATTRS = {'href', 'src'}
+
+class ReferenceParser(HTMLParser):
+    """Collects the href and src values of a page."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.references = []
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name in REFERENCE_ATTRS and value:
+                self.references.append(value.strip())
+
+def iter_pages(root='.'):
+    """Every HTML page of the site, skipping dot-directories."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        for name in sorted(filenames):
+            if name.endswith('.html'):
+                yield Path(dirpath, name).relative_to(root).as_posix()
+
+def parse_page(path):
+    """(content hash, sorted unique references) of a page."""
+    data = Path(path).read_bytes()
+    parser = ReferenceParser()
+    parser.feed(data.decode('utf-8', errors='replace'))
+    parser.close()
+    return hashlib.sha256(data).hexdigest(), sorted(set(parser.references))
+
+def page_url(path):
+    """The URL a page is served at: a/index.html -> /a/, a/b.html -> /a/b.html."""
+    url = '/' + path
+    return url[:-len('index.html')] if url.endswith('/index.html') else url
+
+def resolve(reference, page):
+    """The site URL path a reference points at, or None if it is external or in-page."""
+    if reference.startswith(EXTERNAL_SCHEMES) or reference.startswith('//'):
+        return None
+    target = unquote(urlsplit(reference).path)
+    if not target:
+        return None  # '#fragment' or '?query' on the same page
+    if not target.startswith('/'):
+        base = page_url(page)
+        target = posixpath.join(base if base.endswith('/') else posixpath.dirname(base) + '/', target)
+    trailing = target.endswith('/')
+    target = posixpath.normpath(target)
+    return target + '/' if trailing and target != '/' else target
+
+def target_file(url, root='.'):
+    """The file a site URL path is served from, or None if there is none."""
+    path = Path(root, url.lstrip('/'))
+    if url.endswith('/') or path.is_dir():
+        path = path / 'index.html'
+    return path if path.is_file() else None
+
+def load_cache():
+    try:
+        with open(CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_cache(cache):
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_PATH, 'w') as f:
+        json.dump(cache, f, separators=(',', ':'), sort_keys=True)
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def collect_references(pages, jobs=None):
+    """{page: references}, parsing only pages whose content changed. Returns (refs, parsed count)."""
+    cache = load_cache()
+    references = {}
+    todo = []
+    for page in pages:
+        cached = cache.get(page)
+        if cached and cached[0] == file_digest(page):
+            references[page] = cached[1]
+        else:
+            todo.append(page)
+
+    if len(todo) > 1 and jobs != 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(parse_page, todo, chunksize=max(1, len(todo) // 32)))
+    else:
+        results = [parse_page(page) for page in todo]
+    for page, (digest, refs) in zip(todo, results):
+        cache[page] = [digest, refs]
+        references[page] = refs
+
+    save_cache({page: cache[page] for page in pages})
+    return references, len(todo)
+
+def check_site(jobs=None):
+    """Returns (dangling {target: [pages]}, orphaned post keys, pages, parsed count)."""
+    pages = list(iter_pages())
+    references, parsed = collect_references(pages, jobs)
+
+    dangling = {}
+    linked = {}
+    resolved = {}
+    for page, refs in references.items():
+        for reference in refs:
+            url = resolve(reference, page)
+            if url is None:
+                continue
+            if url not in resolved:
+                resolved[url] = target_file(url)
+            target = resolved[url]
+            if target is None:
+                dangling.setdefault(url, []).append(page)
+            elif target.as_posix() != page:
+                linked.setdefault(target.as_posix(), set()).add(page)
+
+    orphaned = [post.key for post in iter_posts()
+                if (post.dir / 'index.html').exists()
+                and not linked.get((post.dir / 'index.html').as_posix())]
+    return dangling, orphaned, pages, parsed
+
+def usage():
+    print("Usage: python check.py [--jobs N]")
+    print("Reports broken internal links and assets, and posts no page links to.")
+    sys.exit(1)
+
+def main(args=None):
+    args = list(sys.argv[1:] if args is None else args)
+    jobs = None
+    if args:
+        if len(args) != 2 or args[0] != '--jobs' or not args[1].isdigit() or int(args[1]) < 1:
+            usage()
+        jobs = int(args[1])
+
+    start = time.perf_counter()
+    dangling, orphaned, pages, parsed = check_site(jobs)
+    print(f"Checked {len(pages)} page(s), {parsed} parsed and {len(pages) - parsed} cached, "
+          f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    if dangling:
+        print(f"\n❌ {len(dangling)} dangling link target(s):")
+        for url in sorted(dangling):
+            print(f"  {url}")
+            for page in dangling[url]:
+                print(f"    from {page}")
+    if orphaned:
+        print(f"\n⚠️  {len(orphaned)} orphaned post(s), not linked from any page:")
+        for key in orphaned:
+            print(f"  {key}")
+    if not dangling and not orphaned:
+        print("✅ No broken links")
+    if dangling:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
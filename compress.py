@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Write precompressed .gz and .br sidecars next to every site asset.
+
+The preview server and the CDN origin can then serve the compressed bytes
+directly instead of compressing on every request. Files are compressed in
+parallel, and a file whose content hash has not changed since the last run
+(with its sidecars still in place) is skipped. Brotli output needs the
+optional 'brotli' package; without it only .gz sidecars are written.
+
+Scripts that write or remove a single output file call refresh_sidecars()
+right after, so a file is never served next to stale compressed bytes.
+"""
+import sys
+import os
+import gzip
+import json
+import hashlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STATE_PATH = Path('.build/compress.json')
+COMPRESSIBLE = {'.html', '.css', '.js', '.wasm', '.json', '.xml', '.svg'}
+MIN_SIZE = 256  # below this the headers cost more than compression saves
+
+_refreshed = {}  # path -> content hash, sidecars refreshed by this process
+
+def iter_site_files(root='.'):
+    """Yield every compressible file of the site, skipping dot-directories."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        for name in sorted(filenames):
+            path = Path(dirpath) / name
+            if path.suffix in COMPRESSIBLE:
+                yield path
+
+def sidecars(path):
+    """The sidecar paths a file should have, by encoding."""
+    paths = {'gzip': Path(f'{path}.gz')}
+    if brotli:
+        paths['br'] = Path(f'{path}.br')
+    return paths
+
+def write_if_smaller(path, data, original_size):
+    """Write a sidecar only if it actually saves bytes; otherwise remove it."""
+    if len(data) >= original_size:
+        path.unlink(missing_ok=True)
+        return
+    tmp_path = Path(f'{path}.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+def compress_file(path, data=None):
+    data = path.read_bytes() if data is None else data
+    if len(data) < MIN_SIZE:
+        for sidecar in sidecars(path).values():
+            sidecar.unlink(missing_ok=True)
+        return
+    paths = sidecars(path)
+    # mtime=0 keeps the .gz bytes deterministic between builds
+    write_if_smaller(paths['gzip'], gzip.compress(data, compresslevel=9, mtime=0), len(data))
+    if brotli:
+        write_if_smaller(paths['br'], brotli.compress(data, quality=11), len(data))
+
+def refresh_sidecars(path):
+    """Bring a file's sidecars in line with it after it was written, or remove them if it is gone."""
+    path = Path(path)
+    if path.suffix not in COMPRESSIBLE:
+        return
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        for suffix in ('.gz', '.br'):
+            Path(f'{path}{suffix}').unlink(missing_ok=True)
+        return
+    compress_file(path, data)
+    _refreshed[str(path)] = hashlib.sha256(data).hexdigest()
+
+def load_state():
+    try:
+        with open(STATE_PATH, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def compress_site(root='.', force=False, jobs=None):
+    """Bring every sidecar up to date. Returns (compressed, skipped) counts."""
+    state = load_state() if not force else {}
+    encodings = sorted(sidecars('').keys())
+    hashes = {}
+    todo = []
+    for path in iter_site_files(root):
+        # Recorded with the encodings used, so installing brotli redoes everything
+        hashes[str(path)] = [hashlib.sha256(path.read_bytes()).hexdigest(), encodings]
+        if state.get(str(path)) != hashes[str(path)] and _refreshed.get(str(path)) != hashes[str(path)][0]:
+            todo.append(path)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        list(pool.map(compress_file, todo))
+
+    # Sidecars whose original was removed are stale
+    for key in state.keys() - hashes.keys():
+        for suffix in ('.gz', '.br'):
+            Path(key + suffix).unlink(missing_ok=True)
+
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(STATE_PATH, 'w') as f:
+        json.dump(hashes, f, indent=1, sort_keys=True)
+    return len(todo), len(hashes) - len(todo)
+
+def main():
+    args = sys.argv[1:]
+    force = '--force' in args
+    jobs = None
+    if '--jobs' in args:
+        i = args.index('--jobs')
+        if i + 1 >= len(args) or not args[i + 1].isdigit():
+            print("Usage: python compress.py [--force] [--jobs N]")
+            sys.exit(1)
+        jobs = int(args[i + 1])
+
+    if not brotli:
+        print("Note: 'brotli' is not installed; writing .gz sidecars only")
+    compressed, skipped = compress_site(force=force, jobs=jobs)
+    print(f"✅ Compressed {compressed} file(s), {skipped} unchanged")
+
+if __name__ == '__main__':
+    main()
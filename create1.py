@@ -1,28 +1,45 @@
 #!/usr/bin/env python3
 import sys
 import shutil
+import zipfile
+from glob import glob
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import re
 
+import timings
+import store
+from posts import Post
+from site_index import write_index
+
+ENCODINGS = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+
 def slugify(title):
     """Convert title to URL-friendly slug."""
     return re.sub(r'[^\w\s-]', '', title.lower().strip()).replace(' ', '-')
 
-def convert_to_utf8(source_file, dest_file):
-    """Copy file and convert to UTF-8 encoding."""
-    encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-    
-    for encoding in encodings:
+def decode_text(data):
+    """Decode raw bytes with the first encoding that works, or return None."""
+    for encoding in ENCODINGS:
         try:
-            with open(source_file, 'r', encoding=encoding) as f:
-                content = f.read()
-                with open(dest_file, 'w', encoding='utf-8') as out:
-                    out.write(content)
-                return True
+            content = data.decode(encoding)
         except UnicodeDecodeError:
             continue
-    return False
+        # Match the universal-newline handling of text-mode reads
+        return content.replace('\r\n', '\n').replace('\r', '\n')
+    return None
+
+def convert_to_utf8(source_file, dest_file):
+    """Copy file and convert to UTF-8 encoding."""
+    with timings.stage('convert', reads=[source_file], writes=[dest_file]):
+        with open(source_file, 'rb') as f:
+            content = decode_text(f.read())
+        if content is None:
+            return False
+        with open(dest_file, 'w', encoding='utf-8') as out:
+            out.write(content)
+        return True
 
 def validate_book_name(name):
     """Validate that book post name follows the 'title-by-author' format."""
@@ -31,65 +48,177 @@ def validate_book_name(name):
         return False
     return all(part.strip() for part in parts)
 
-def create_post(post_type, source_file):
-    """Create a new post directory and copy source file."""
+def import_post(post_type, file_name, data, content_store=None):
+    """Create a post directory from a draft's name and raw bytes.
+
+    Returns the new post directory. Raises ValueError if the draft cannot be
+    imported; nothing is left on disk in that case. With a content_store the
+    post is added to it instead, and no directory is created.
+    """
     # Create directory name from file name
-    post_name = slugify(source_file.stem)
-    
+    post_name = slugify(Path(file_name).stem)
+
     # Validate book review naming convention
     if post_type == "book" and not validate_book_name(post_name):
-        print("Error: Book review filename must be in format: 'Book-Title-by-Author-Name.txt'")
-        print("Example: The-Great-Gatsby-by-F-Scott-Fitzgerald.txt")
-        sys.exit(1)
-    
-    current_year = str(datetime.now().year)
-    
+        raise ValueError("Book review filename must be in format: 'Book-Title-by-Author-Name.txt'\n"
+                         "Example: The-Great-Gatsby-by-F-Scott-Fitzgerald.txt")
+
     # Set base directory based on post type
     if post_type == "essay":
         base_dir = "essays"
     elif post_type == "book":
         base_dir = "books"
     else:
-        print(f"Error: Invalid post type '{post_type}'")
-        sys.exit(1)
-    
+        raise ValueError(f"Invalid post type '{post_type}'")
+
+    with timings.stage('decode'):
+        content = decode_text(data)
+    if content is None:
+        raise ValueError("Could not read file with any known encoding")
+
+    current_year = str(datetime.now().year)
     post_dir = Path(f'{base_dir}/posts/{current_year}/{post_name}')
 
-    # Check if post already exists
-    if post_dir.exists():
-        print(f"Error: Post already exists at {post_dir}")
-        print("Use update_post.py to update an existing post")
-        sys.exit(1)
+    if content_store:
+        with timings.stage('write'):
+            content_store.add(Post(post_type, current_year, post_name), content)
+        return post_dir
 
-    # Create directory and copy file
-    post_dir.mkdir(parents=True)
-    if not convert_to_utf8(source_file, post_dir / 'source.txt'):
-        print("Error: Could not read file with any known encoding")
+    # mkdir fails atomically if another draft in the batch claimed the slug
+    try:
+        post_dir.mkdir(parents=True)
+    except FileExistsError:
+        raise ValueError(f"Post already exists at {post_dir}\n"
+                         "Use update_post.py to update an existing post")
+
+    try:
+        with timings.stage('write', writes=[post_dir / 'source.txt']):
+            with open(post_dir / 'source.txt', 'w', encoding='utf-8') as out:
+                out.write(content)
+    except OSError:
         shutil.rmtree(post_dir)  # Clean up
+        raise
+    return post_dir
+
+def create_post(post_type, source_file, content_store=None):
+    """Create a new post directory and copy source file."""
+    try:
+        with timings.stage('read', reads=[source_file]):
+            data = source_file.read_bytes()
+        post_dir = import_post(post_type, source_file.name, data, content_store)
+    except ValueError as e:
+        print(f"Error: {e}")
         sys.exit(1)
 
+    # Keep the index in sync; the post is listed once it has been rendered
+    write_index(post_type, [post_dir.as_posix()], store=content_store)
+
     print(f"\nPost directory created successfully!")
-    print(f"- Location: {post_dir}")
-    print(f"- Title: {post_name.replace('-', ' ').title()}")
+    print(f"- Location: {post_dir}" + (f" in {content_store.path}" if content_store else ""))
+    print(f"- Title: {post_dir.name.replace('-', ' ').title()}")
     print("\nNext steps:")
+    if content_store:
+        print(f"1. Run update.py with --store {content_store.path} to create the HTML version")
+        return
     print("1. Add date.txt with YYYY-MM-DD format (optional)")
     print("2. Run generate_html.py to create the HTML version")
 
+def iter_drafts(target):
+    """Yield (file name, function returning its bytes) for each draft in target.
+
+    target may be a directory, a glob pattern or a .zip archive; only .txt
+    files are imported.
+    """
+    path = Path(target).expanduser()
+    if path.suffix.lower() == '.zip' and path.is_file():
+        # Members are read up front: a ZipFile handle is not safe to share
+        with zipfile.ZipFile(path) as archive:
+            for info in sorted(archive.infolist(), key=lambda i: i.filename):
+                if not info.is_dir() and info.filename.lower().endswith('.txt'):
+                    data = archive.read(info)
+                    yield Path(info.filename).name, lambda data=data: data
+        return
+
+    if path.is_dir():
+        files = sorted(path.glob('*.txt'))
+    else:
+        files = sorted(Path(p) for p in glob(str(path)) if p.lower().endswith('.txt'))
+    for file in files:
+        yield file.name, file.read_bytes
+
+def bulk_import(post_type, target, jobs=None, content_store=None):
+    """Import every draft in target concurrently. Returns the number of failures."""
+    drafts = list(iter_drafts(target))
+    if not drafts:
+        print(f"Error: No .txt drafts found in {target}")
+        sys.exit(1)
+
+    def run(draft):
+        file_name, read = draft
+        try:
+            with timings.stage('read') as stage:
+                data = read()
+                stage.read(len(data))
+            return file_name, import_post(post_type, file_name, data, content_store), None
+        except (ValueError, OSError) as e:
+            return file_name, None, str(e)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(run, drafts))
+
+    # One index update for the whole batch
+    write_index(post_type, [post_dir.as_posix() for _, post_dir, _ in results if post_dir],
+                store=content_store)
+
+    failures = 0
+    print(f"\nImported {len(drafts)} draft(s) from {target}:")
+    for file_name, post_dir, error in results:
+        if error:
+            failures += 1
+            print(f"❌ {file_name}: {error.splitlines()[0]}")
+        else:
+            print(f"✅ {file_name} -> {post_dir}")
+    print(f"\n{len(results) - failures} created, {failures} failed")
+    return failures
+
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: python create.py <type> <path-to-txt-file>")
+    args = timings.parse_args(sys.argv[1:])
+    args, content_store = store.parse_args(args)
+    jobs = None
+    if '--jobs' in args:
+        i = args.index('--jobs')
+        if i + 1 >= len(args) or not args[i + 1].isdigit() or int(args[i + 1]) < 1:
+            print("Error: --jobs needs a positive number")
+            sys.exit(1)
+        jobs = int(args[i + 1])
+        del args[i:i + 2]
+
+    if len(args) < 2:
+        print("Usage: python create.py <type> <path-to-txt-file|directory|glob|zip> [--jobs N]")
+        print("       [--store FILE] [--timings] [--trace FILE]")
         print("Example: python create.py essay ~/Downloads/My-Post.txt")
         print("Example: python create.py book ~/Downloads/Book-Review.txt")
+        print("Example: python create.py essay ~/Downloads/drafts/ --jobs 8")
+        print("Example: python create.py essay '~/Downloads/*.txt'")
         sys.exit(1)
 
-    post_type = sys.argv[1].lower()
-    source_file = Path(sys.argv[2]).expanduser()
-    
-    if not source_file.exists():
+    post_type = args[0].lower()
+    source_file = Path(args[1]).expanduser()
+
+    if source_file.is_file() and source_file.suffix.lower() != '.zip':
+        create_post(post_type, source_file, content_store)
+        return
+
+    if not source_file.exists() and not glob(str(source_file)):
         print(f"Error: File not found: {source_file}")
         sys.exit(1)
-    
-    create_post(post_type, source_file)
+
+    if post_type not in ("essay", "book"):
+        print(f"Error: Invalid post type '{post_type}'")
+        sys.exit(1)
+
+    if bulk_import(post_type, args[1], jobs, content_store):
+        sys.exit(1)
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
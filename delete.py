@@ -4,37 +4,19 @@ from pathlib import Path
 import shutil
 import re
 
+import timings
+import delete1
+from backup import BATCH_ID
+
 def remove_from_index(post_url):
-    """Remove post entry from essays/index.html"""
-    index_path = Path('essays/index.html')
-    
-    # Create backup
-    shutil.copy(index_path, index_path.with_suffix('.html.bak'))
-    
-    with open(index_path, 'r') as f:
-        content = f.read()
-    
-    # Remove post entry
-    pattern = re.compile(
-        f'<article class="post-preview">.*?href="/{post_url}".*?</article>',
-        re.DOTALL
-    )
-    updated_content = pattern.sub('', content)
-    
-    # Remove empty year sections
-    year_pattern = re.compile(
-        '<section class="year-section">.*?<div class="post-list">\s*</div>\s*</section>',
-        re.DOTALL
-    )
-    updated_content = year_pattern.sub('', updated_content)
-    
-    # Save updated index
-    with open(index_path, 'w') as f:
-        f.write(updated_content)
+    """Remove post entry from the essays index pages"""
+    # The same index, tag, search, feed and related updates as delete1.py
+    delete1.remove_from_index([post_url])
 
 def main():
+    sys.argv[1:] = timings.parse_args(sys.argv[1:])
     if len(sys.argv) != 2:
-        print("Usage: python delete_post.py <year/post-name>")
+        print("Usage: python delete_post.py <year/post-name> [--timings] [--trace FILE]")
         print("Example: python delete_post.py 2024/my-first-post")
         sys.exit(1)
     
@@ -68,13 +50,15 @@ def main():
     
     if confirmation == "DELETE POST":
         # Delete post directory
-        shutil.rmtree(post_dir)
+        with timings.stage('remove'):
+            shutil.rmtree(post_dir)
         
         # Remove from index
         remove_from_index(f'essays/posts/{post_path}')
         
         print("\n✅ Post deleted successfully!")
-        print("Note: A backup of essays/index.html was created before modification.")
+        print("Note: The index, tag and series pages were backed up before modification.")
+        print(f"To undo the index change, run: python backup.py restore --batch {BATCH_ID}")
     else:
         print("\n❌ Deletion cancelled. Post was not deleted.")
 
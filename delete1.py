@@ -2,89 +2,140 @@
 import sys
 from pathlib import Path
 import shutil
-import re
 
-def remove_from_index(post_url):
-    """Remove post entry from index.html"""
-    # Extract type from URL (essays or books)
-    post_type = post_url.split('/')[0]
-    index_path = Path(f'{post_type}/index.html')
-    
-    # Create backup
-    shutil.copy(index_path, index_path.with_suffix('.html.bak'))
-    
-    with open(index_path, 'r') as f:
-        content = f.read()
-    
-    # Remove post entry
-    pattern = re.compile(
-        f'<article class="post-preview">.*?href="/{post_url}".*?</article>',
-        re.DOTALL
-    )
-    updated_content = pattern.sub('', content)
-    
-    # Remove empty year sections
-    year_pattern = re.compile(
-        '<section class="year-section">.*?<div class="post-list">\s*</div>\s*</section>',
-        re.DOTALL
-    )
-    updated_content = year_pattern.sub('', updated_content)
-    
-    # Save updated index
-    with open(index_path, 'w') as f:
-        f.write(updated_content)
+import search
+import feeds
+import related
+import metadata
+import taxonomy
+import timings
+import store
+from backup import backup_files, BATCH_ID
+from posts import SECTIONS, post_from_key
+from site_index import write_index
+from update1 import post_titles, write_related_pages
+
+def remove_from_index(post_urls, content_store=None):
+    """Update the index, tag and series pages, search index and feeds after posts were removed.
+
+    post_urls are post keys ('essays/posts/2024/my-first-post'); however many
+    there are, each page is rewritten at most once. Posts that listed a
+    removed post as related are re-rendered without it.
+    """
+    if isinstance(post_urls, str):
+        post_urls = [post_urls]
+    post_urls = list(post_urls)
+    metadata.record(dict.fromkeys(post_urls))
+    for post_type in sorted({post_from_key(url).post_type for url in post_urls}):
+        write_index(post_type, post_urls, backup=True, store=content_store)
+    taxonomy.update_taxonomy(post_urls, store=content_store, backup=True)
+    lists, changed = related.update_related(post_urls, store=content_store)
+    write_related_pages(changed - set(post_urls), lists, content_store)
+    search.update_index({}, removed=post_urls)
+    feeds.write_feeds(post_urls, store=content_store)
+
+def read_targets(list_file):
+    """year/post-name targets from a list file: one per line, '#' starts a comment."""
+    with open(list_file, 'r', encoding='utf-8') as f:
+        lines = (line.split('#', 1)[0].strip() for line in f)
+        return [line for line in lines if line]
+
+def post_title(post_type, post_name):
+    try:
+        title, author = post_titles(post_type, post_name)
+    except ValueError:
+        return post_name.replace('-', ' ').title()
+    return f'{title} by {author}' if author else title
+
+def usage():
+    print("Usage: python delete.py <type> <year/post-name>... [--from LIST] [--store FILE]")
+    print("       [--timings] [--trace FILE]")
+    print("Example: python delete.py essay 2024/my-first-post")
+    print("Example: python delete.py book 2024/book-review")
+    print("Example: python delete.py essay 2023/draft-one 2023/draft-two")
+    print("Example: python delete.py essay --from stale-drafts.txt")
+    sys.exit(1)
 
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: python delete.py <type> <year/post-name>")
-        print("Example: python delete.py essay 2024/my-first-post")
-        print("Example: python delete.py book 2024/book-review")
-        sys.exit(1)
-    
-    post_type = sys.argv[1].lower()
+    args = timings.parse_args(sys.argv[1:])
+    args, content_store = store.parse_args(args)
+    if '--from' in args:
+        i = args.index('--from')
+        if i + 1 >= len(args):
+            usage()
+        list_file = args[i + 1]
+        del args[i:i + 2]
+        try:
+            args += read_targets(list_file)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error: Could not read {list_file}: {e}")
+            sys.exit(1)
+    if len(args) < 2:
+        usage()
+
+    post_type = args[0].lower()
     if post_type not in ["essay", "book"]:
         print(f"Error: Invalid post type '{post_type}'")
         sys.exit(1)
 
-    # Get post directory
-    post_path = sys.argv[2].rstrip('/')
-    year, post_name = post_path.split('/')
-    post_dir = Path(f'{post_type}s/posts/{year}/{post_name}')
-    
-    # Check if post exists
-    if not post_dir.exists():
-        print(f"Error: Post not found at {post_dir}")
+    # Validate every target before touching anything
+    post_dirs = {}
+    problems = []
+    for target in args[1:]:
+        parts = target.rstrip('/').split('/')
+        if len(parts) != 2 or not all(parts):
+            problems.append(f"{target}: expected year/post-name")
+            continue
+        post_dir = Path(f'{SECTIONS[post_type]}/posts/{parts[0]}/{parts[1]}')
+        if content_store and content_store.row(post_dir.as_posix()) is None:
+            problems.append(f"Post not found at {post_dir} in {content_store.path}")
+            continue
+        if not content_store and not post_dir.is_dir():
+            problems.append(f"Post not found at {post_dir}")
+            continue
+        post_dirs[post_dir.as_posix()] = post_dir
+    if problems:
+        print("Error: Nothing was deleted:")
+        for problem in problems:
+            print(f"  {problem}")
         sys.exit(1)
-    
-    # Get post title
-    try:
-        with open(post_dir / 'index.html', 'r') as f:
-            content = f.read()
-            title_match = re.search(r'<h2>(.*?)</h2>', content)
-            title = title_match.group(1) if title_match else post_name.replace('-', ' ').title()
-    except:
-        title = post_name.replace('-', ' ').title()
-    
-    # Show warning and get confirmation
-    print(f"\n⚠️  WARNING: You are about to delete the following {post_type}:")
-    print(f"Title: {title}")
-    print(f"Path: {post_type}s/posts/{post_path}")
-    print("\nThis action cannot be undone!")
-    print(f'\nTo confirm deletion, type "DELETE {post_type.upper()}" (all caps):')
-    
+    post_dirs = list(post_dirs.values())
+
+    # Show warning and get one confirmation for the whole batch
+    count = len(post_dirs)
+    noun = post_type if count == 1 else f'{count} {post_type}s'
+    print(f"\n⚠️  WARNING: You are about to delete the following {noun}:")
+    for post_dir in post_dirs[:20]:
+        print(f"- {post_title(post_type, post_dir.name)} ({post_dir})")
+    if count > 20:
+        print(f"- ... and {count - 20} more")
+    print("\nThe posts will be removed from the site (a backup is kept).")
+    phrase = f"DELETE {post_type.upper()}" if count == 1 else f"DELETE {count} {post_type.upper()}S"
+    print(f'\nTo confirm deletion, type "{phrase}" (all caps):')
+
     confirmation = input("> ")
-    
-    if confirmation == f"DELETE {post_type.upper()}":
-        # Delete post directory
-        shutil.rmtree(post_dir)
-        
-        # Remove from index
-        remove_from_index(f'{post_type}s/posts/{post_path}')
-        
-        print("\n✅ Post deleted successfully!")
-        print(f"Note: A backup of {post_type}s/index.html was created before modification.")
+
+    if confirmation == phrase:
+        # Back up every file of every post in one go, then delete the directories
+        backup_files(sorted(path for post_dir in post_dirs
+                            for path in post_dir.rglob('*') if path.is_file()))
+        with timings.stage('remove'):
+            if content_store:
+                content_store.delete(post_dir.as_posix() for post_dir in post_dirs)
+            for post_dir in post_dirs:
+                if post_dir.is_dir():
+                    shutil.rmtree(post_dir)
+
+        # One index, search and feed update for the whole batch
+        remove_from_index([post_dir.as_posix() for post_dir in post_dirs], content_store)
+
+        print(f"\n✅ Deleted {noun} successfully!")
+        print(f"Note: The posts and the {post_type}s index pages were backed up. To undo, run:")
+        print(f"python backup.py restore --batch {BATCH_ID}")
+        if content_store:
+            print(f"python store.py restore {content_store.path} --batch {BATCH_ID}")
     else:
-        print("\n❌ Deletion cancelled. Post was not deleted.")
+        print("\n❌ Deletion cancelled. Nothing was deleted.")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
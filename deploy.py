@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Plan a deploy: only the output files that changed since the last one.
+
+    python update.py deploy-plan [--stage DIR|FILE.tar.gz] [--mark-deployed]
+
+Compares a {path: [size, hash]} manifest of the output with the one
+recorded at the last deploy (.build/deployed.json).
+"""
+import sys
+import os
+import io
+import json
+import shutil
+import hashlib
+import tarfile
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import timings
+
+OUTPUT_PATH = Path('.build/output.json')
+DEPLOYED_PATH = Path('.build/deployed.json')
+PLAN_NAME = 'deploy-plan.json'
+# Dotfiles the site needs; every other dotfile and dot-directory is repo state
+KEPT_DOTFILES = {'.nojekyll'}
+# Sources, tooling and build leftovers that are in the tree but not served
+EXCLUDED_NAMES = {'README.md', 'requests.jsonl', 'bench.json', 'source.txt', 'date.txt'}
+EXCLUDED_SUFFIXES = {'.py', '.pyc', '.tmp', '.bak'}
+EXCLUDED_DIRS = {'__pycache__'}
+TARBALL_SUFFIXES = {'.tar': 'w', '.tar.gz': 'w:gz', '.tgz': 'w:gz'}
+
+def is_output(name):
+    if name.startswith('.'):
+        return name in KEPT_DOTFILES
+    return name not in EXCLUDED_NAMES and Path(name).suffix not in EXCLUDED_SUFFIXES
+
+def iter_output_files(root='.'):
+    """Every file the site serves, as a POSIX path relative to root."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.') and d not in EXCLUDED_DIRS)
+        for name in sorted(filenames):
+            if is_output(name):
+                yield Path(dirpath, name).relative_to(root).as_posix()
+
+def in_output(target, root='.'):
+    """Whether target lies where iter_output_files() would pick it up."""
+    try:
+        parts = Path(target).resolve().relative_to(Path(root).resolve()).parts
+    except ValueError:
+        return False
+    return not any(part.startswith('.') or part in EXCLUDED_DIRS for part in parts)
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_json(path):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def output_manifest(root='.', jobs=None):
+    """{path: [size, sha256]} of the site output.
+
+    A file whose size and mtime match the cache keeps its cached hash; the
+    rest are hashed in parallel.
+    """
+    with timings.stage('manifest') as stage:
+        cache = load_json(OUTPUT_PATH)
+        entries = {}  # path -> [size, mtime_ns, sha256 or None]
+        for path in iter_output_files(root):
+            stat = os.stat(Path(root, path))
+            cached = cache.get(path)
+            if cached and cached[:2] == [stat.st_size, stat.st_mtime_ns]:
+                entries[path] = cached
+            else:
+                entries[path] = [stat.st_size, stat.st_mtime_ns, None]
+
+        todo = [path for path, entry in entries.items() if entry[2] is None]
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            for path, digest in zip(todo, pool.map(lambda p: file_digest(Path(root, p)), todo)):
+                entries[path][2] = digest
+                stage.read(entries[path][0])
+
+        save_json(OUTPUT_PATH, entries)
+    return {path: [size, digest] for path, (size, _, digest) in entries.items()}
+
+def plan_deploy(current, deployed):
+    """(added, changed, removed) paths, each sorted, going from deployed to current."""
+    added = sorted(current.keys() - deployed.keys())
+    removed = sorted(deployed.keys() - current.keys())
+    changed = sorted(path for path in current.keys() & deployed.keys() if current[path] != deployed[path])
+    return added, changed, removed
+
+def plan_document(added, changed, removed, current):
+    return {
+        'added': {path: current[path] for path in added},
+        'changed': {path: current[path] for path in changed},
+        'removed': removed,
+    }
+
+def tarball_mode(target):
+    for suffix, mode in TARBALL_SUFFIXES.items():
+        if target.name.endswith(suffix):
+            return mode
+    return None
+
+def stage_files(target, paths, plan, root='.'):
+    """Copy paths (and the plan) into a directory, or pack them into a tarball."""
+    target = Path(target)
+    plan_bytes = (json.dumps(plan, indent=1, sort_keys=True) + '\n').encode('utf-8')
+    mode = tarball_mode(target)
+    with timings.stage('stage') as stage:
+        if mode:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_name(target.name + '.tmp')
+            with tarfile.open(tmp_path, mode) as tar:
+                for path in paths:
+                    tar.add(Path(root, path), arcname=path, recursive=False)
+                    stage.wrote(timings.file_size(Path(root, path)))
+                info = tarfile.TarInfo(PLAN_NAME)
+                info.size = len(plan_bytes)
+                tar.addfile(info, io.BytesIO(plan_bytes))
+            os.replace(tmp_path, target)
+            return
+
+        for path in paths:
+            destination = target / path
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(Path(root, path), destination)
+            stage.wrote(timings.file_size(destination))
+        (target / PLAN_NAME).write_bytes(plan_bytes)
+
+def usage():
+    print("Usage: python update.py deploy-plan [--stage DIR|FILE.tar.gz] [--mark-deployed] [--jobs N]")
+    print("Lists the output files added, changed and removed since the last deploy.")
+    sys.exit(1)
+
+def main(args=None):
+    args = timings.parse_args(list(sys.argv[1:] if args is None else args))
+    stage_target, mark, jobs = None, False, None
+    while args:
+        arg = args.pop(0)
+        if arg == '--stage' and args:
+            stage_target = Path(args.pop(0))
+        elif arg == '--mark-deployed':
+            mark = True
+        elif arg == '--jobs' and args and args[0].isdigit() and int(args[0]) > 0:
+            jobs = int(args.pop(0))
+        else:
+            usage()
+
+    if stage_target:
+        if in_output(stage_target):
+            # The staged copies would count as site output in the next plan
+            print(f"Error: {stage_target} is inside the site; stage outside it or under a dot-directory")
+            sys.exit(1)
+        if not tarball_mode(stage_target) and stage_target.exists() and \
+                (not stage_target.is_dir() or any(stage_target.iterdir())):
+            print(f"Error: {stage_target} is not an empty directory")
+            sys.exit(1)
+
+    current = output_manifest(jobs=jobs)
+    deployed = load_json(DEPLOYED_PATH)
+    if not deployed:
+        print(f"No deploy recorded in {DEPLOYED_PATH} yet; every file counts as added.")
+    added, changed, removed = plan_deploy(current, deployed)
+
+    for mark_char, paths in (('+', added), ('~', changed), ('-', removed)):
+        for path in paths:
+            print(f"{mark_char} {path}")
+    upload = sum(current[path][0] for path in added + changed)
+    unchanged = len(current) - len(added) - len(changed)
+    print(f"Deploy plan: {len(added)} added, {len(changed)} changed, {len(removed)} removed "
+          f"({timings.format_bytes(upload)} to upload), {unchanged} unchanged")
+
+    if stage_target:
+        stage_files(stage_target, added + changed, plan_document(added, changed, removed, current))
+        print(f"Staged {len(added) + len(changed)} file(s) in {stage_target}")
+    if mark:
+        save_json(DEPLOYED_PATH, current)
+        print(f"Recorded {len(current)} file(s) as deployed in {DEPLOYED_PATH}")
+
+if __name__ == '__main__':
+    main()
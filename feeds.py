@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""Atom feeds for each section and a site-wide sitemap, streamed with XMLWriter.
+
+Source hashes and change times are kept in .build/feeds.json for each
+post's last-modified date; write_feeds() only regenerates the feeds of the
+sections whose posts changed.
+"""
+import sys
+import os
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+import update1
+import compress
+import metadata
+import taxonomy
+from posts import SECTIONS, iter_posts, post_from_key, file_hash
+from site_index import INDEX_HEADINGS, load_entries, latest_path, year_path, LATEST_PAGES, PAGE_SIZE
+from templates import STATIC_PAGES
+
+SITE_URL = 'https://' + Path('CNAME').read_text().strip() if Path('CNAME').exists() else ''
+STATE_PATH = Path('.build/feeds.json')
+SITEMAP_PATH = 'sitemap.xml'
+SITEMAP_DIR = Path('sitemaps')
+FEED_SIZE = 20
+MAX_SITEMAP_URLS = 50000  # the limit per file in the sitemap protocol
+
+class XMLWriter:
+    """Writes indented XML to a file element by element."""
+
+    def __init__(self, f):
+        self.f = f
+        self.open_tags = []
+        f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+
+    def _open_tag(self, tag, attrs):
+        attributes = ''.join(f' {name}={quoteattr(str(value))}' for name, value in attrs.items())
+        return f'{"  " * len(self.open_tags)}<{tag}{attributes}'
+
+    def start(self, tag, attrs={}):
+        self.f.write(self._open_tag(tag, attrs) + '>\n')
+        self.open_tags.append(tag)
+
+    def end(self):
+        tag = self.open_tags.pop()
+        self.f.write(f'{"  " * len(self.open_tags)}</{tag}>\n')
+
+    def element(self, tag, text=None, attrs={}):
+        """A leaf element; text may be a string or an iterable of strings to stream."""
+        if text is None:
+            self.f.write(self._open_tag(tag, attrs) + '/>\n')
+            return
+        self.f.write(self._open_tag(tag, attrs) + '>')
+        for chunk in [text] if isinstance(text, str) else text:
+            self.f.write(escape(chunk))
+        self.f.write(f'</{tag}>\n')
+
+def load_state():
+    try:
+        with open(STATE_PATH, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_state(state):
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(STATE_PATH, 'w') as f:
+        json.dump(state, f, separators=(',', ':'), sort_keys=True)
+
+def update_state(state, keys, store=None):
+    """Record a change time for every post whose source hash changed."""
+    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    for key in keys:
+        if store:
+            digest = store.source_hash(key)
+        else:
+            digest = file_hash(post_from_key(key).dir / 'source.txt')
+        if digest is None:
+            state.pop(key, None)
+        elif key not in state:
+            # First sighting (e.g. a fresh clone): date.txt is all we know
+            state[key] = [digest, None]
+        elif state[key][0] != digest:
+            state[key] = [digest, now]
+
+def last_modified(entry, state):
+    """The later of the post's date and the last change to its source."""
+    updated = entry.date.replace(tzinfo=timezone.utc)
+    changed = state.get(entry.post.key, [None, None])[1]
+    if changed:
+        updated = max(updated, datetime.strptime(changed, '%Y-%m-%dT%H:%M:%SZ').replace(tzinfo=timezone.utc))
+    return updated
+
+def atom_time(moment):
+    return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+def iter_fragments(lines, signoff=False):
+    for i, fragment in enumerate(update1.iter_html(lines, signoff=signoff)):
+        yield '\n' + fragment if i else fragment
+
+def iter_content(post, store=None):
+    """The post body as HTML fragments, read line by line from its source."""
+    signoff = post.post_type == 'essay'
+    if store:
+        yield from iter_fragments(store.source(post.key).split('\n'), signoff)
+        return
+    with open(post.dir / 'source.txt', 'r', encoding='utf-8') as source:
+        yield from iter_fragments(source, signoff)
+
+def write_atomically(path, write):
+    """Call write(XMLWriter) on a temporary file, then move it into place."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            write(XMLWriter(f))
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
+    compress.refresh_sidecars(path)
+    return str(path)
+
+def feed_path(post_type):
+    return f'{SECTIONS[post_type]}/feed.xml'
+
+def write_feed(post_type, entries, state, store=None):
+    """Write a section's Atom feed from its entries, newest first."""
+    section_url = f'{SITE_URL}/{SECTIONS[post_type]}/'
+    entries = entries[:FEED_SIZE]
+    details = metadata.lookup([entry.post.key for entry in entries], store)
+    updated = max((last_modified(entry, state) for entry in entries),
+                  default=datetime(1970, 1, 1, tzinfo=timezone.utc))
+
+    def write(xml):
+        xml.start('feed', {'xmlns': 'http://www.w3.org/2005/Atom'})
+        xml.element('title', f'{INDEX_HEADINGS[post_type]} - Kevin Liu')
+        xml.element('id', section_url)
+        xml.element('link', attrs={'href': section_url})
+        xml.element('link', attrs={'rel': 'self', 'href': f'{SITE_URL}/{feed_path(post_type)}'})
+        xml.element('updated', atom_time(updated))
+        xml.start('author')
+        xml.element('name', 'Kevin Liu')
+        xml.end()
+        for entry in entries:
+            url = SITE_URL + entry.post.url
+            xml.start('entry')
+            xml.element('title', f'{entry.title} by {entry.author}' if entry.author else entry.title)
+            xml.element('id', url)
+            xml.element('link', attrs={'href': url})
+            xml.element('published', atom_time(entry.date))
+            xml.element('updated', atom_time(last_modified(entry, state)))
+            if details.get(entry.post.key, {}).get('excerpt'):
+                xml.element('summary', details[entry.post.key]['excerpt'])
+            xml.element('content', iter_content(entry.post, store), {'type': 'html'})
+            xml.end()
+        xml.end()
+    return write_atomically(feed_path(post_type), write)
+
+def taxonomy_pages():
+    """The tag and series pages (taxonomy.py) on disk."""
+    return sorted(path.as_posix() for kind in taxonomy.KINDS for path in Path(kind).glob('**/index.html'))
+
+def iter_urls(entries_by_type, state):
+    """(url, lastmod or None) for every page of the site."""
+    for page in STATIC_PAGES + taxonomy_pages():
+        yield SITE_URL + '/' + page[:-len('index.html')], None
+    for post_type, entries in entries_by_type.items():
+        latest = entries[:PAGE_SIZE * LATEST_PAGES]
+        newest = max((last_modified(entry, state).strftime('%Y-%m-%d') for entry in latest), default=None)
+        for page in range(1, max(1, -(-len(latest) // PAGE_SIZE)) + 1):
+            yield SITE_URL + '/' + latest_path(post_type, page)[:-len('index.html')], newest
+        years = {}
+        for entry in entries:
+            lastmod = last_modified(entry, state).strftime('%Y-%m-%d')
+            years[entry.date.year] = max(years.get(entry.date.year, lastmod), lastmod)
+        for year, lastmod in years.items():
+            yield SITE_URL + '/' + year_path(post_type, year)[:-len('index.html')], lastmod
+        for entry in entries:
+            yield SITE_URL + entry.post.url, last_modified(entry, state).strftime('%Y-%m-%d')
+
+def write_urlset(path, urls):
+    def write(xml):
+        xml.start('urlset', {'xmlns': 'http://www.sitemaps.org/schemas/sitemap/0.9'})
+        for url, lastmod in urls:
+            xml.start('url')
+            xml.element('loc', url)
+            if lastmod:
+                xml.element('lastmod', lastmod)
+            xml.end()
+        xml.end()
+    return write_atomically(path, write)
+
+def write_sitemap(entries_by_type, state):
+    """Write sitemap.xml, split behind a sitemap index if it is too large."""
+    total = len(STATIC_PAGES) + len(taxonomy_pages()) + sum(len(entries) + LATEST_PAGES + len({e.date.year for e in entries})
+                                    for entries in entries_by_type.values())
+    for path in SITEMAP_DIR.glob('*.xml'):
+        path.unlink()
+        compress.refresh_sidecars(path)
+    if total <= MAX_SITEMAP_URLS:
+        if SITEMAP_DIR.exists():
+            SITEMAP_DIR.rmdir()
+        return [write_urlset(SITEMAP_PATH, iter_urls(entries_by_type, state))]
+
+    # Stream the URLs into consecutive files of at most MAX_SITEMAP_URLS
+    urls = iter_urls(entries_by_type, state)
+    written = []
+    while True:
+        first = next(urls, None)
+        if first is None:
+            break
+        chunk = (first, *(url for _, url in zip(range(MAX_SITEMAP_URLS - 1), urls)))
+        written.append(write_urlset(SITEMAP_DIR / f'{len(written) + 1}.xml', chunk))
+
+    def write(xml):
+        xml.start('sitemapindex', {'xmlns': 'http://www.sitemaps.org/schemas/sitemap/0.9'})
+        for path in written:
+            xml.start('sitemap')
+            xml.element('loc', f'{SITE_URL}/{Path(path).as_posix()}')
+            xml.end()
+        xml.end()
+    return written + [write_atomically(SITEMAP_PATH, write)]
+
+def write_feeds(keys=None, store=None):
+    """Regenerate the feeds of the sections with a changed post, and the sitemap.
+
+    keys are the posts that were added, changed or removed; without them
+    every feed is regenerated. Sources are read from store if given.
+    Returns the paths written.
+    """
+    state = load_state()
+    if keys is None:
+        keys = store.keys() if store else [post.key for post in iter_posts()]
+        current = set(keys)
+        state = {key: value for key, value in state.items() if key in current}
+        post_types = list(SECTIONS)
+    else:
+        post_types = sorted({post_from_key(key).post_type for key in keys})
+    update_state(state, keys, store)
+
+    entries_by_type = {post_type: load_entries(post_type) for post_type in SECTIONS}
+    written = [write_feed(post_type, entries_by_type[post_type], state, store) for post_type in post_types]
+    if post_types:
+        written.extend(write_sitemap(entries_by_type, state))
+    save_state(state)
+    return written
+
+def main():
+    if sys.argv[1:]:
+        print("Usage: python feeds.py")
+        print("Regenerates every section feed and the sitemap.")
+        sys.exit(1)
+    for path in write_feeds():
+        print(f"Updated {path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""The markup of post sources, rendered to HTML in one pass.
+
+Every non-blank line is a block of its own, as it always has been:
+
+    # Heading / ## Heading      <h3> / <h4>
+    - item, * item, 1. item     list items; consecutive ones share a list
+    > quote                     a paragraph of a block quote
+    ```                         fences a code block, kept verbatim
+    anything else               a paragraph
+
+A source may open with a front-matter block of FRONT_MATTER_FIELDS, which
+is not part of the body (see split_front_matter()):
+
+    ---
+    tags: writing, habits
+    series: Typewriter Diaries
+    ---
+
+Within a line, **strong**, *emphasis*, `code` and [text](url) are
+recognised, and a backslash makes the next character literal. All other
+text is HTML-escaped, and a byte order mark at the start of the source is
+dropped. Each line is scanned once, so rendering is linear in its length.
+"""
+import re
+from itertools import chain
+from collections import deque
+from html import escape
+
+BOM = '\ufeff'
+SPECIAL = re.compile(r'[*`\[\]\\]')
+LINK_TARGET = re.compile(r'\(([^\s()]+)\)')
+HEADINGS = {'#': 'h3', '##': 'h4'}
+# How many lines from the end a signoff may start
+SIGNOFF_LINES = 3
+FRONT_MATTER_FENCE = '---'
+FRONT_MATTER_FIELDS = {'tags', 'series'}
+# A longer opening is body text that happens to start with '---'
+MAX_FRONT_MATTER_LINES = 10
+
+# Lines that mark the start of a signoff when found near the end of a post
+SIGNOFF_PATTERNS = [
+    'See ya!', 'Until next time', 'Best', 'Sincerely', 'Cheers', '-', '—'
+]
+
+def is_signoff(line):
+    line = line.strip()
+    return any(line.startswith(pattern) for pattern in SIGNOFF_PATTERNS) or (
+        len(line) < 30 and any(name in line.lower() for name in ['kevin', 'kev']))
+
+def signoff_start(tail, in_list=False):
+    """Index of the first signoff line in tail, or len(tail) if there is none.
+
+    A '- ' line right after another one continues a list rather than
+    starting a signoff.
+    """
+    for i, line in enumerate(tail):
+        line = line.strip()
+        continues_list = line.startswith('- ') and (tail[i - 1].strip().startswith('- ') if i else in_list)
+        if is_signoff(line) and not continues_list:
+            return i
+    return len(tail)
+
+def front_matter_field(line):
+    """(name, value) of a 'name: value' front-matter line, or None if it is not one."""
+    name, colon, value = line.partition(':')
+    name = name.strip().lower()
+    if not colon or name not in FRONT_MATTER_FIELDS:
+        return None
+    return name, value.strip()
+
+def split_front_matter(lines):
+    """(fields, body lines) of a source that may open with a front-matter block.
+
+    fields maps 'tags' to a list of names and 'series' to a name; it is
+    empty without a block. Only the block's lines are read ahead, so lines
+    may be an open file. A block that is not closed by a fence within
+    MAX_FRONT_MATTER_LINES, or holds any other line, is left in the body.
+    """
+    lines = iter(lines)
+    head = []
+    fields = {}
+    for line in lines:
+        head.append(line)
+        text = line.lstrip(BOM).strip() if len(head) == 1 else line.strip()
+        if len(head) == 1:
+            if text != FRONT_MATTER_FENCE:
+                break
+            continue
+        if text == FRONT_MATTER_FENCE:
+            return fields, lines
+        field = front_matter_field(text) if text else ('', '')
+        if field is None or len(head) > MAX_FRONT_MATTER_LINES:
+            break
+        name, value = field
+        if name == 'tags':
+            names = (tag.strip() for tag in value.split(','))
+            fields['tags'] = list(dict.fromkeys(tag for tag in names if tag))
+        elif name == 'series' and value:
+            fields['series'] = value
+    return {}, chain(head, lines)
+
+def link_target(text, start):
+    """(url, end) for the '(url)' right at text[start], or None if there is none.
+
+    The URL cannot hold whitespace or parentheses, so the runs tried for
+    different links never overlap.
+    """
+    match = LINK_TARGET.match(text, start)
+    return (match.group(1), match.end()) if match else None
+
+def render_inline(text):
+    """Render one line of inline markup. Returns (html, plain text).
+
+    Opening delimiters go on a stack as literal text; when their closer
+    turns up, the opener is swapped for its tag and anything still open
+    above it is left literal. Each character is looked at a bounded number
+    of times, so there is no backtracking.
+    """
+    html = []   # escaped text and tags
+    plain = []  # the text alone, for the search index; parallel to html
+    stack = []  # (delimiter, index in html) of the open delimiters
+    open_count = {'*': 0, '**': 0, '[': 0}
+    pos = 0
+    no_closing_backtick = False
+
+    def literal(s):
+        html.append(escape(s, quote=False))
+        plain.append(s)
+
+    def element(s):
+        html.append(s)
+        plain.append('')
+
+    def push(delimiter):
+        stack.append((delimiter, len(html)))
+        open_count[delimiter] += 1
+        literal(delimiter)
+
+    def close(delimiter, open_tag, close_tag):
+        # Unwind to the matching opener; unmatched ones above it stay literal
+        while True:
+            opener, index = stack.pop()
+            open_count[opener] -= 1
+            if opener == delimiter:
+                html[index] = open_tag
+                plain[index] = ''
+                element(close_tag)
+                return
+
+    for match in SPECIAL.finditer(text):
+        i = match.start()
+        if i < pos:
+            continue  # inside a code span, link target or run already consumed
+        if i > pos:
+            literal(text[pos:i])
+        c = text[i]
+        pos = i + 1
+
+        if c == '\\':
+            if pos < len(text):
+                literal(text[pos])
+                pos += 1
+            else:
+                literal('\\')
+        elif c == '`':
+            end = -1 if no_closing_backtick else text.find('`', pos)
+            if end == -1:
+                no_closing_backtick = True
+                literal('`')
+            else:
+                code = text[pos:end]
+                element('<code>')
+                literal(code)
+                element('</code>')
+                pos = end + 1
+        elif c == '*':
+            delimiter = '**' if text.startswith('**', i) else '*'
+            pos = i + len(delimiter)
+            tag = 'strong' if delimiter == '**' else 'em'
+            before = text[i - 1] if i else ' '
+            after = text[pos] if pos < len(text) else ' '
+            if open_count[delimiter] and not before.isspace():
+                close(delimiter, f'<{tag}>', f'</{tag}>')
+            elif not after.isspace():
+                push(delimiter)
+            else:
+                literal(delimiter)
+        elif c == '[':
+            push('[')
+        elif c == ']':
+            target = link_target(text, pos) if open_count['['] else None
+            if target:
+                url, pos = target
+                close('[', f'<a href="{escape(url)}">', '</a>')
+            else:
+                literal(']')
+
+    if pos < len(text):
+        literal(text[pos:])
+    return ''.join(html), ''.join(plain)
+
+class BlockRenderer:
+    """Turns source lines into HTML fragments, one call to feed() per line."""
+
+    def __init__(self, on_text=None):
+        self.on_text = on_text
+        self.open_list = None   # 'ul' or 'ol' while inside a list
+        self.in_quote = False
+        self.in_code = False
+        self.code_started = False
+        self.first_line = True
+
+    def inline(self, text):
+        html, plain = render_inline(text)
+        if self.on_text:
+            self.on_text(plain)
+        return html
+
+    def close_blocks(self):
+        if self.open_list:
+            yield f'</{self.open_list}>'
+            self.open_list = None
+        if self.in_quote:
+            yield '</blockquote>'
+            self.in_quote = False
+
+    def feed(self, line):
+        """Yield the fragments completed by one more source line."""
+        if self.first_line:
+            line = line.lstrip(BOM)
+            self.first_line = False
+
+        if self.in_code:
+            code = line.rstrip('\r\n')
+            if code.strip() == '```':
+                self.in_code = False
+                yield '</code></pre>' if self.code_started else '<pre><code></code></pre>'
+                return
+            if self.on_text:
+                self.on_text(code)
+            prefix = '' if self.code_started else '<pre><code>'
+            self.code_started = True
+            yield prefix + escape(code, quote=False)
+            return
+
+        line = line.strip()
+        if not line:
+            yield from self.close_blocks()
+            return
+        if line.startswith('```'):
+            yield from self.close_blocks()
+            self.in_code = True
+            self.code_started = False
+            return
+
+        marker, _, rest = line.partition(' ')
+        if marker in ('-', '*') and rest or marker[:-1].isdigit() and marker.endswith('.') and rest:
+            kind = 'ul' if marker in ('-', '*') else 'ol'
+            if self.open_list != kind:
+                yield from self.close_blocks()
+                self.open_list = kind
+                yield f'<{kind}>'
+            yield f'<li>{self.inline(rest.strip())}</li>'
+            return
+        if line.startswith('>'):
+            if not self.in_quote:
+                yield from self.close_blocks()
+                self.in_quote = True
+                yield '<blockquote>'
+            yield f'<p>{self.inline(line[1:].strip())}</p>'
+            return
+
+        yield from self.close_blocks()
+        if marker in HEADINGS and rest:
+            tag = HEADINGS[marker]
+            yield f'<{tag}>{self.inline(rest.strip())}</{tag}>'
+        else:
+            yield f'<p>{self.inline(line)}</p>'
+
+    def close(self):
+        """Yield whatever is still open at the end of the source."""
+        if self.in_code:
+            self.in_code = False
+            yield '</code></pre>' if self.code_started else '<pre><code></code></pre>'
+        yield from self.close_blocks()
+
+def iter_html(lines, on_text=None, signoff=False, front_matter=True):
+    """Yield the HTML fragments of a post, one source line at a time.
+
+    Works on any iterable of lines (e.g. an open file). If given, on_text is
+    called with the plain text of every block as it goes past. With signoff,
+    only the last SIGNOFF_LINES lines are held back to look for a signoff,
+    so memory stays flat however long the source is. A front-matter block is
+    skipped, unless front_matter is False (lines are already a body).
+    """
+    if front_matter:
+        _, lines = split_front_matter(lines)
+    renderer = BlockRenderer(on_text)
+    if not signoff:
+        for line in lines:
+            yield from renderer.feed(line)
+        yield from renderer.close()
+        return
+
+    window = deque()
+    blank_run = 0  # blank lines seen since the last non-blank one
+    for line in lines:
+        if not line.strip():
+            blank_run += 1
+            continue
+        # Blank lines only count towards the window once content follows them;
+        # trailing ones are dropped.
+        for pending in [''] * min(blank_run, SIGNOFF_LINES) + [line]:
+            window.append(pending)
+            if len(window) > SIGNOFF_LINES:
+                yield from renderer.feed(window.popleft())
+        blank_run = 0
+
+    tail = list(window)
+    start = len(tail)
+    if not renderer.in_code:
+        start = signoff_start(tail, renderer.open_list == 'ul')
+    for line in tail[:start]:
+        yield from renderer.feed(line)
+    yield from renderer.close()
+
+    if start < len(tail):
+        signoff_lines = [renderer.inline(line.strip()) for line in tail[start:] if line.strip()]
+        yield f'<p class="signoff">{"<br>".join(signoff_lines)}</p>'
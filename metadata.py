@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Per-post metadata, gathered while a post is rendered.
+
+The text update1.iter_post() walks for the search index also gives each
+post's word count, reading time and excerpt. With its title, author and
+date they are cached in .build/metadata.json along with the hash of the
+source they came from, and the listing pages, feeds and search results
+take them from there instead of opening post bodies. Every render records
+fresh metadata; a full build also re-collects any entry whose source hash
+no longer matches. A post with no entry (e.g. on a fresh clone) is walked
+once, without rendering, to fill it in.
+"""
+import os
+import json
+from pathlib import Path
+
+import markup
+import timings
+from posts import post_from_key, file_hash, read_post_date
+
+CACHE_PATH = Path('.build/metadata.json')
+WORDS_PER_MINUTE = 230
+EXCERPT_WORDS = 40
+
+_loaded = None  # (stat of CACHE_PATH, cache) from the last load_cache() or save_cache()
+
+class MetadataCollector:
+    """on_text callback that counts a post's words and keeps the first EXCERPT_WORDS.
+
+    iter_post() passes the title before the body; it is not counted. If
+    given, on_text (e.g. a search.TermCollector) is called with every text
+    too, so one walk feeds both.
+    """
+
+    def __init__(self, on_text=None):
+        self.on_text = on_text
+        self.words = 0
+        self.excerpt = []
+        self.title_seen = False
+
+    def __call__(self, text):
+        if self.on_text:
+            self.on_text(text)
+        if not self.title_seen:
+            self.title_seen = True
+            return
+        words = text.split()
+        if len(self.excerpt) < EXCERPT_WORDS:
+            self.excerpt.extend(words[:EXCERPT_WORDS - len(self.excerpt)])
+        self.words += len(words)
+
+    def metadata(self, post, date, source_hash):
+        """The cache entry of a post this collector walked."""
+        # Imported here: update1 imports site_index, which imports this module
+        from update1 import post_titles
+        title, author = post_titles(post.post_type, post.name)
+        excerpt = ' '.join(self.excerpt)
+        if self.words > len(self.excerpt):
+            excerpt += '…'
+        return {
+            'source': source_hash,
+            'title': title,
+            'author': author,
+            'date': date.strftime('%Y-%m-%d') if date else None,
+            'words': self.words,
+            'minutes': max(1, round(self.words / WORDS_PER_MINUTE)),
+            'excerpt': excerpt,
+        }
+
+def load_cache():
+    global _loaded
+    try:
+        stat = os.stat(CACHE_PATH)
+    except FileNotFoundError:
+        return {}
+    key = (stat.st_mtime_ns, stat.st_size)
+    if _loaded and _loaded[0] == key:
+        return _loaded[1]
+    try:
+        with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except json.JSONDecodeError:
+        return {}
+    _loaded = (key, cache)
+    return cache
+
+def save_cache(cache):
+    global _loaded
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = CACHE_PATH.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(cache, separators=(',', ':'), sort_keys=True, ensure_ascii=False))
+    os.replace(tmp_path, CACHE_PATH)
+    stat = os.stat(CACHE_PATH)
+    _loaded = ((stat.st_mtime_ns, stat.st_size), cache)
+
+def record(entries, keep=None):
+    """Store {key: metadata} entries; None drops a post.
+
+    With keep (every current post key, in a full build) entries of posts
+    not in it are dropped too.
+    """
+    cache = dict(load_cache())
+    for key, entry in entries.items():
+        if entry is None:
+            cache.pop(key, None)
+        else:
+            cache[key] = entry
+    if keep is not None:
+        keep = set(keep)
+        cache = {key: entry for key, entry in cache.items() if key in keep}
+    save_cache(cache)
+
+def collect(key, store=None):
+    """Walk a post's source (without rendering it) for its metadata, or None if it has none."""
+    post = post_from_key(key)
+    collector = MetadataCollector()
+    collector.title_seen = True  # markup.iter_html() starts straight with the body
+    try:
+        if store:
+            source = store.source(key)
+            if source is None:
+                return None
+            for _ in markup.iter_html(source.split('\n'), collector):
+                pass
+            return collector.metadata(post, store.date(key), store.source_hash(key))
+        with open(post.dir / 'source.txt', 'r', encoding='utf-8') as source:
+            for _ in markup.iter_html(source, collector):
+                pass
+        return collector.metadata(post, read_post_date(post.dir), file_hash(post.dir / 'source.txt'))
+    except (OSError, ValueError, UnicodeDecodeError):
+        return None
+
+def lookup(keys, store=None, sources=None):
+    """{key: metadata} for the posts in keys that have a source.
+
+    Entries missing from the cache, or whose source hash differs from the
+    one given in sources ({key: hash}, when the caller has them), are
+    collected from the source and cached.
+    """
+    cache = load_cache()
+    found, missing = {}, []
+    for key in keys:
+        entry = cache.get(key)
+        if entry is None or (sources and key in sources and entry['source'] != sources[key]):
+            missing.append(key)
+        else:
+            found[key] = entry
+    if missing:
+        with timings.stage('metadata'):
+            collected = {key: collect(key, store) for key in missing}
+            collected = {key: entry for key, entry in collected.items() if entry}
+            if collected:
+                record(collected)
+        found.update(collected)
+    return found
@@ -5,6 +5,8 @@ from pathlib import Path
 from datetime import datetime
 import re
 
+import timings
+
 def slugify(title):
     """Convert title to URL-friendly slug."""
     return re.sub(r'[^\w\s-]', '', title.lower().strip()).replace(' ', '-')
@@ -25,8 +27,9 @@ def convert_to_utf8(source_file, dest_file):
     return False
 
 def main():
+    sys.argv[1:] = timings.parse_args(sys.argv[1:])
     if len(sys.argv) != 2:
-        print("Usage: python new_post.py <path-to-txt-file>")
+        print("Usage: python new_post.py <path-to-txt-file> [--timings] [--trace FILE]")
         print("Example: python new_post.py ~/Downloads/My-Post.txt")
         sys.exit(1)
 
@@ -49,7 +52,9 @@ def main():
 
     # Create directory and copy file
     post_dir.mkdir(parents=True)
-    if not convert_to_utf8(source_file, post_dir / 'source.txt'):
+    with timings.stage('convert', reads=[source_file], writes=[post_dir / 'source.txt']):
+        converted = convert_to_utf8(source_file, post_dir / 'source.txt')
+    if not converted:
         print("Error: Could not read file with any known encoding")
         shutil.rmtree(post_dir)  # Clean up
         sys.exit(1)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Shared helpers for finding posts and reading their metadata."""
+import hashlib
+from pathlib import Path
+from datetime import datetime
+from typing import NamedTuple
+
+# Post type (as used on the command line) -> top-level section directory
+SECTIONS = {'essay': 'essays', 'book': 'books'}
+
+class Post(NamedTuple):
+    """A post directory: <section>/posts/<year>/<name>."""
+    post_type: str
+    year: str
+    name: str
+
+    @property
+    def section(self):
+        return SECTIONS[self.post_type]
+
+    @property
+    def key(self):
+        return f'{self.section}/posts/{self.year}/{self.name}'
+
+    @property
+    def dir(self):
+        return Path(self.key)
+
+    @property
+    def url(self):
+        return f'/{self.key}/'
+
+def iter_posts(post_types=SECTIONS):
+    """Yield every post that has a source.txt, in a stable order."""
+    for post_type in post_types:
+        section = SECTIONS[post_type]
+        for source_path in sorted(Path(section).glob('posts/*/*/source.txt')):
+            post_dir = source_path.parent
+            yield Post(post_type, post_dir.parent.name, post_dir.name)
+
+def post_from_key(key):
+    """Build a Post from a '<section>/posts/<year>/<name>' key."""
+    section, _, year, name = key.strip('/').split('/')
+    post_type = next(t for t, s in SECTIONS.items() if s == section)
+    return Post(post_type, year, name)
+
+def book_title_and_author(post_name):
+    """Split a 'book-title-by-author' post name into (title, author)."""
+    parts = post_name.split('-by-')
+    if len(parts) != 2:
+        raise ValueError("Book post name must be in format: book-title-by-author")
+    return parts[0].replace('-', ' ').title(), parts[1].replace('-', ' ').title()
+
+def read_post_date(post_dir):
+    """Return the date from date.txt, or None if the file is missing.
+
+    Raises ValueError if date.txt exists but is not YYYY-MM-DD.
+    """
+    date_file = Path(post_dir) / 'date.txt'
+    if not date_file.exists():
+        return None
+    with open(date_file, 'r') as f:
+        return datetime.strptime(f.read().strip(), '%Y-%m-%d')
+
+def file_hash(path):
+    """SHA-256 of a file's bytes, or None if it does not exist."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
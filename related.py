@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""Related posts, by TF-IDF similarity to the other posts of a section.
+
+Vectors and lists are cached in .build/related.json, so when a few posts
+change only their rows are scored again. Uses numpy when it is installed.
+"""
+import os
+import json
+import math
+import heapq
+from collections import Counter
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import markup
+import timings
+from search import tokenize
+from posts import SECTIONS, iter_posts, post_from_key, file_hash
+from update1 import post_titles
+
+STATE_PATH = Path('.build/related.json')
+RELATED_COUNT = 3
+MAX_DF = 0.5
+MIN_POSTS = 20  # below this, frequencies say too little to drop any term
+MAX_TERMS = 50  # a post's highest-weighted terms; the rest barely move its scores
+REFRESH_RATIO = 0.1
+BATCH_CELLS = 1 << 22  # scores held in memory at once when scoring a batch with numpy
+
+def term_counts(post, lines):
+    """{term: count} over a post's title and the text of its source lines."""
+    counts = Counter()
+    try:
+        counts.update(tokenize(' '.join(t for t in post_titles(post.post_type, post.name) if t)))
+    except ValueError:
+        pass
+    for _ in markup.iter_html(lines, lambda text: counts.update(tokenize(text))):
+        pass
+    return dict(counts)
+
+def weigh(counts, df, n):
+    """A post's unit-length vector of its MAX_TERMS highest TF-IDF weights.
+
+    df are the document frequencies among n posts; a term they do not know
+    counts as found in this post alone.
+    """
+    weights = {}
+    for term, count in counts.items():
+        frequency = df.get(term, 1)
+        if frequency <= MAX_DF * n or n < MIN_POSTS:
+            weights[term] = (1 + math.log(count)) * (math.log((1 + n) / (1 + frequency)) + 1)
+    if len(weights) > MAX_TERMS:
+        weights = dict(heapq.nlargest(MAX_TERMS, weights.items(), key=lambda item: item[1]))
+    norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+    return {term: round(w / norm, 6) for term, w in weights.items()}
+
+class Corpus:
+    """Unit-length TF-IDF vectors of a set of posts, indexed by term."""
+
+    def __init__(self, vectors):
+        """vectors maps post keys to their {term: weight} (see weigh())."""
+        self.keys = sorted(vectors)
+        self.rows = {key: i for i, key in enumerate(self.keys)}
+        self.sections = [post_from_key(key).post_type for key in self.keys]
+        self.weights = [vectors[key] for key in self.keys]
+        self.postings = {}  # term -> (rows, weights), built on demand by index()
+        if np is not None:
+            self.section_ids = np.array([list(SECTIONS).index(s) for s in self.sections])
+
+    def index(self, terms):
+        """Build the postings of the terms not indexed yet, in one pass over the posts."""
+        terms = set(terms) - self.postings.keys()
+        if not terms:
+            return
+        postings = {term: ([], []) for term in terms}
+        for i, weights in enumerate(self.weights):
+            for term in weights.keys() & terms:
+                rows, ws = postings[term]
+                rows.append(i)
+                ws.append(weights[term])
+        if np is not None:
+            postings = {term: (np.array(rows, dtype=np.int64), np.array(ws))
+                        for term, (rows, ws) in postings.items()}
+        self.postings.update(postings)
+
+    def score(self, rows):
+        """Yield (row, scores) with each row's similarity to every post.
+
+        scores is an array over all rows with numpy, else {row: score} of
+        the rows with a term in common.
+        """
+        rows = list(rows)
+        self.index(term for row in rows for term in self.weights[row])
+        if np is None:
+            for row in rows:
+                scores = {}
+                for term, weight in self.weights[row].items():
+                    for other, w in zip(*self.postings[term]):
+                        scores[other] = scores.get(other, 0.0) + weight * w
+                yield row, scores
+            return
+
+        n = len(self.keys)
+        batch_size = max(1, BATCH_CELLS // max(n, 1))
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            targets, values = [], []
+            for i, row in enumerate(batch):
+                for term, weight in self.weights[row].items():
+                    other, w = self.postings[term]
+                    targets.append(other + i * n)
+                    values.append(w * weight)
+            if targets:
+                flat = np.bincount(np.concatenate(targets), np.concatenate(values), minlength=len(batch) * n)
+            else:
+                flat = np.zeros(len(batch) * n)
+            for i, row in enumerate(batch):
+                yield row, flat[i * n:(i + 1) * n]
+
+    def top(self, row, scores):
+        """The RELATED_COUNT most similar posts of row's section, as [[key, score]]."""
+        if np is None:
+            candidates = ((score, other) for other, score in scores.items()
+                          if other != row and score > 0 and self.sections[other] == self.sections[row])
+            best = heapq.nlargest(RELATED_COUNT, candidates, key=lambda c: (c[0], -c[1]))
+        else:
+            scores = np.where(self.section_ids == self.section_ids[row], scores, 0.0)
+            scores[row] = 0.0
+            count = min(RELATED_COUNT, len(scores))
+            picked = np.argpartition(-scores, count - 1)[:count] if count else []
+            best = sorted(((float(scores[i]), int(i)) for i in picked if scores[i] > 0),
+                          key=lambda c: (-c[0], c[1]))
+        return [[self.keys[other], round(score, 6)] for score, other in best]
+
+    def similar(self, row, scores):
+        """(key, score) of every post of row's section with a positive score against it."""
+        if np is None:
+            pairs = scores.items()
+        else:
+            nonzero = np.flatnonzero(scores)
+            pairs = zip(nonzero.tolist(), scores[nonzero].tolist())
+        for other, score in pairs:
+            if other != row and score > 0 and self.sections[other] == self.sections[row]:
+                yield self.keys[other], round(score, 6)
+
+def load_state():
+    try:
+        with open(STATE_PATH, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {'vectors': {}, 'related': {}, 'df': {}, 'n': 0}
+
+def save_state(state):
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = STATE_PATH.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        # dumps() encodes in one go in C; dump() would stream it through Python
+        f.write(json.dumps(state, separators=(',', ':'), sort_keys=True))
+    os.replace(tmp_path, STATE_PATH)
+
+def source_digest(key, store=None):
+    if store:
+        return store.source_hash(key)
+    return file_hash(post_from_key(key).dir / 'source.txt')
+
+def source_lines(key, store=None):
+    if store:
+        return store.source(key).split('\n')
+    with open(post_from_key(key).dir / 'source.txt', 'r', encoding='utf-8') as f:
+        return f.read().split('\n')
+
+def published_keys(store=None):
+    """Keys of the posts that have a page, the ones a list may link to."""
+    if store:
+        return [entry.post.key for post_type in SECTIONS for entry in store.entries(post_type)]
+    return [post.key for post in iter_posts() if (post.dir / 'index.html').exists()]
+
+def insert(related, key, score):
+    """Put key into a related list at its score, keeping the best RELATED_COUNT."""
+    related = [item for item in related if item[0] != key] + [[key, score]]
+    related.sort(key=lambda item: (-item[1], item[0]))
+    return related[:RELATED_COUNT]
+
+def update_related(keys=None, force=False, store=None):
+    """Bring the related lists up to date.
+
+    keys are the posts that were added, changed or removed; without them
+    every post with a source is checked (a build renders them all). With
+    force every list is computed from scratch. Returns ({key: [related
+    keys]}, set of keys whose list changed).
+    """
+    with timings.stage('related'):
+        state = load_state()
+        vectors, old = state['vectors'], state['related']
+        if keys is None:
+            candidates = set(store.keys() if store else (post.key for post in iter_posts()))
+            candidates |= set(vectors)
+        elif not vectors:
+            # Nothing cached yet: start from every published post
+            candidates = set(published_keys(store)) | set(keys)
+        else:
+            candidates = set(keys)
+
+        # Tokenize the posts whose source changed; drop the ones that are gone
+        changed = set()
+        counts = {}  # key -> (source hash, term counts)
+        for key in sorted(candidates):
+            digest = source_digest(key, store)
+            if digest is None:
+                if vectors.pop(key, None):
+                    changed.add(key)
+                continue
+            if key in vectors and vectors[key][0] == digest:
+                continue
+            try:
+                lines = source_lines(key, store)
+            except (OSError, UnicodeDecodeError):
+                continue
+            counts[key] = (digest, term_counts(post_from_key(key), lines))
+            changed.add(key)
+
+        if not changed and not force and set(old) == set(vectors):
+            return {key: [other for other, _ in value] for key, value in old.items()}, set()
+
+        total = len(set(vectors) | set(counts))
+        full = (force or not old or len(changed) * 4 > total
+                or abs(total - state['n']) > REFRESH_RATIO * state['n'])
+        if full:
+            # Fresh document frequencies, so every post is weighed again
+            for key in sorted(set(vectors) - set(counts)):
+                try:
+                    counts[key] = (vectors[key][0], term_counts(post_from_key(key), source_lines(key, store)))
+                except (OSError, UnicodeDecodeError):
+                    continue
+            state['df'] = dict(Counter(term for _, post_counts in counts.values() for term in post_counts))
+            state['n'] = len(counts)
+            vectors.clear()
+        for key, (digest, post_counts) in counts.items():
+            vectors[key] = [digest, weigh(post_counts, state['df'], state['n'])]
+
+        corpus = Corpus({key: value[1] for key, value in vectors.items()})
+        if full:
+            related = {corpus.keys[row]: corpus.top(row, scores)
+                       for row, scores in corpus.score(range(len(corpus.keys)))}
+        else:
+            related = {key: value for key, value in old.items() if key in corpus.rows}
+            # A list holding a changed post has to be scored again; the rest
+            # only take changed posts in or out, using the changed posts' rows
+            rescore = {key for key, value in related.items()
+                       if key not in changed and any(other in changed for other, _ in value)}
+            rescore |= set(corpus.rows) - set(related) - changed
+            changed_rows = [corpus.rows[key] for key in sorted(changed) if key in corpus.rows]
+            for row, scores in corpus.score(changed_rows):
+                related[corpus.keys[row]] = corpus.top(row, scores)
+                for other, score in corpus.similar(row, scores):
+                    if other in changed or other in rescore:
+                        continue
+                    value = related[other]
+                    if len(value) < RELATED_COUNT or score > value[-1][1]:
+                        related[other] = insert(value, corpus.keys[row], score)
+            for row, scores in corpus.score(sorted(corpus.rows[key] for key in rescore)):
+                related[corpus.keys[row]] = corpus.top(row, scores)
+
+        lists = {key: [other for other, _ in value] for key, value in related.items()}
+        updated = {key for key in lists
+                   if lists[key] != [other for other, _ in old.get(key, [])]}
+        state['related'] = related
+        save_state(state)
+    return lists, updated
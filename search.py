@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Build-time full-text search index.
+
+The text that update1.iter_html walks while rendering is tokenized into an
+inverted index of term -> {doc id: [word positions]}. It is written as small
+JSON shards under assets/search/, one per two-character term prefix, and
+assets/search.js only fetches the shards for the terms a reader types.
+Document URLs, titles and excerpts (from the metadata cache, metadata.py)
+live in separate buckets of DOCS_PER_BUCKET ids.
+
+Each post's term list is remembered in .build/search.json, so when a post
+changes only the shards holding its old or new terms are rewritten.
+"""
+import sys
+import os
+import re
+import json
+from string import ascii_lowercase, digits
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+import update1
+import templates
+import assets
+import timings
+import compress
+import metadata
+from posts import iter_posts, post_from_key, read_post_date
+
+SEARCH_DIR = Path('assets/search')
+STATE_PATH = Path('.build/search.json')
+SEARCH_PAGE = 'search/index.html'
+DOCS_PER_BUCKET = 500
+TOKEN = re.compile(r'\w+')
+SHARD_CHARS = set(ascii_lowercase + digits)
+
+SEARCH_BODY = '''            <h2>Search</h2>
+            <input type="search" id="search-input" class="search-input" placeholder="Search essays and books" aria-label="Search" autofocus>
+            <p id="search-status" class="search-status"></p>
+            <div id="search-results" class="post-list"></div>
+            <script src="/assets/search.js"></script>'''
+
+def tokenize(text):
+    """Lowercased word tokens. Must match tokenize() in assets/search.js."""
+    return TOKEN.findall(text.lower())
+
+def shard_name(term):
+    """Shard holding a term: its first two characters, non [a-z0-9] as '_'."""
+    return ''.join(c if c in SHARD_CHARS else '_' for c in term[:2])
+
+class TermCollector:
+    """on_text callback that records the word positions of every term."""
+
+    def __init__(self):
+        self.terms = {}
+        self.position = 0
+
+    def __call__(self, text):
+        for term in tokenize(text):
+            self.terms.setdefault(term, []).append(self.position)
+            self.position += 1
+
+def doc_title(post):
+    title, author = update1.post_titles(post.post_type, post.name)
+    return f'{title} by {author}' if author else title
+
+def doc_entry(post, details=None):
+    """A post's [url, title, excerpt] in a docs bucket; without metadata, [url, title]."""
+    if details is None:
+        return [post.url, doc_title(post)]
+    title = f"{details['title']} by {details['author']}" if details['author'] else details['title']
+    return [post.url, title, details['excerpt']]
+
+def index_post(post):
+    """Tokenize a post that was not rendered in this run. Returns its terms."""
+    collector = TermCollector()
+    date = read_post_date(post.dir) or datetime.now()
+    with open(post.dir / 'source.txt', 'r', encoding='utf-8') as source:
+        for _ in update1.iter_post(post.post_type, post.name, source, date, collector):
+            pass
+    return collector.terms
+
+def load_state():
+    try:
+        with open(STATE_PATH, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {'ids': {}, 'next_id': 0, 'terms': {}}
+
+def write_json(path, data):
+    """Write compact, deterministic JSON atomically, or remove path if data is empty."""
+    path = Path(path)
+    if not data:
+        path.unlink(missing_ok=True)
+        compress.refresh_sidecars(path)
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'), sort_keys=True, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    compress.refresh_sidecars(path)
+
+def load_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def update_index(changed, removed=(), all_keys=None):
+    """Apply changed posts ({key: terms}) and removed post keys to the index.
+
+    If all_keys is given (a full build), posts missing from the index are
+    tokenized and posts no longer present are dropped, so the index heals
+    itself after being deleted or falling out of step.
+    """
+    with timings.stage('search') as stage:
+        state = load_state()
+        if not state['ids']:
+            # No record of what the existing shards contain (e.g. a fresh clone):
+            # start them over from every post rather than leave stale postings
+            # behind or keep only the posts passed in
+            for path in SEARCH_DIR.glob('**/*.json'):
+                path.unlink()
+                compress.refresh_sidecars(path)
+            if all_keys is None:
+                all_keys = [post.key for post in iter_posts()]
+        ids, old_terms = state['ids'], state['terms']
+        changed = dict(changed)
+        removed = set(removed)
+        if all_keys is not None:
+            all_keys = set(all_keys)
+            removed |= set(ids) - all_keys
+            for key in sorted(all_keys - set(ids) - set(changed)):
+                try:
+                    changed[key] = index_post(post_from_key(key))
+                except (ValueError, UnicodeDecodeError, FileNotFoundError):
+                    continue
+        removed -= set(changed)
+        if not changed and not removed:
+            return
+
+        # Old postings to drop and new ones to add, grouped by shard
+        drop = defaultdict(dict)
+        add = defaultdict(dict)
+        touched_ids = set()
+        for key in changed.keys() | removed:
+            if key in ids:
+                touched_ids.add(ids[key])
+                for term in old_terms.get(key, []):
+                    drop[shard_name(term)].setdefault(term, []).append(str(ids[key]))
+
+        for key in removed:
+            ids.pop(key, None)
+            old_terms.pop(key, None)
+        for key, terms in sorted(changed.items()):
+            if key not in ids:
+                ids[key] = state['next_id']
+                state['next_id'] += 1
+            touched_ids.add(ids[key])
+            old_terms[key] = sorted(terms)
+            for term, positions in terms.items():
+                add[shard_name(term)].setdefault(term, {})[str(ids[key])] = positions
+
+        for shard in sorted(drop.keys() | add.keys()):
+            path = SEARCH_DIR / f'{shard}.json'
+            postings = load_json(path)
+            if postings:
+                stage.read(timings.file_size(path))
+            for term, doc_ids in drop[shard].items():
+                for doc_id in doc_ids:
+                    postings.get(term, {}).pop(doc_id, None)
+                if not postings.get(term, True):
+                    del postings[term]
+            for term, docs in add[shard].items():
+                postings.setdefault(term, {}).update(docs)
+            write_json(path, postings)
+            if postings:
+                stage.wrote(timings.file_size(path))
+
+        # URLs, titles and excerpts, bucketed so results only fetch the buckets they need
+        buckets = {doc_id // DOCS_PER_BUCKET for doc_id in touched_ids}
+        for bucket in sorted(buckets):
+            path = SEARCH_DIR / 'docs' / f'{bucket}.json'
+            keys = [key for key, doc_id in ids.items() if doc_id // DOCS_PER_BUCKET == bucket]
+            details = metadata.lookup(keys)
+            docs = {str(ids[key]): doc_entry(post_from_key(key), details.get(key)) for key in keys}
+            write_json(path, docs)
+            if docs:
+                stage.wrote(timings.file_size(path))
+
+        STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(STATE_PATH, 'w') as f:
+            json.dump(state, f, separators=(',', ':'), sort_keys=True)
+
+def write_search_page():
+    """Write search/index.html. Returns True if it changed."""
+    html = templates.render_page('Search - Kevin Liu', assets.rewrite_refs(SEARCH_BODY))
+    try:
+        with open(SEARCH_PAGE, 'r', encoding='utf-8') as f:
+            if f.read() == html:
+                return False
+    except FileNotFoundError:
+        Path(SEARCH_PAGE).parent.mkdir(parents=True, exist_ok=True)
+    with open(SEARCH_PAGE, 'w', encoding='utf-8') as f:
+        f.write(html)
+    compress.refresh_sidecars(SEARCH_PAGE)
+    return True
+
+def main():
+    if sys.argv[1:] not in ([], ['--rebuild']):
+        print("Usage: python search.py [--rebuild]")
+        print("Brings the search index up to date; --rebuild starts from scratch.")
+        sys.exit(1)
+
+    if '--rebuild' in sys.argv:
+        STATE_PATH.unlink(missing_ok=True)
+    update_index({}, all_keys=[post.key for post in iter_posts()])
+    write_search_page()
+    print(f"Search index is up to date in {SEARCH_DIR}")
+
+if __name__ == '__main__':
+    main()
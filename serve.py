@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""Local preview server for the site, with optional live reload.
+
+Serves the repository root like GitHub Pages does, with keep-alive,
+sendfile(), ETags, byte ranges and the .br/.gz sidecars. With a Reloader
+(see watch.py), HTML pages get a script that reloads them after a rebuild.
+"""
+import sys
+import os
+import queue
+import hashlib
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from functools import partial
+from http import HTTPStatus
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from pathlib import Path
+from urllib.parse import urlsplit
+
+LIVERELOAD_PATH = '/__livereload'
+IMMUTABLE_PREFIX = '/assets/dist/'
+LIVERELOAD_SCRIPT = (
+    f"<script>new EventSource('{LIVERELOAD_PATH}')"
+    ".onmessage = () => location.reload();</script>\n"
+).encode()
+WORKERS = 32
+KEEP_ALIVE_TIMEOUT = 5  # seconds an idle connection may hold a worker
+# Sidecars in order of preference, by Accept-Encoding token
+SIDECARS = (('br', '.br'), ('gzip', '.gz'))
+CONTENT_TYPES = {
+    '.wasm': 'application/wasm',
+    '.js': 'text/javascript; charset=utf-8',
+    '.mjs': 'text/javascript; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.html': 'text/html; charset=utf-8',
+    '.json': 'application/json',
+    '.xml': 'application/xml',
+    '.txt': 'text/plain; charset=utf-8',
+    '.svg': 'image/svg+xml',
+}
+
+class Reloader:
+    """Broadcasts a 'reload' to every connected browser tab."""
+
+    def __init__(self):
+        self.version = 0
+        self.condition = threading.Condition()
+
+    def notify(self):
+        with self.condition:
+            self.version += 1
+            self.condition.notify_all()
+
+    def wait(self, version, timeout):
+        """Block until a reload newer than version happens. Returns the latest version."""
+        with self.condition:
+            self.condition.wait_for(lambda: self.version > version, timeout)
+            return self.version
+
+class PooledHTTPServer(HTTPServer):
+    """An HTTPServer that hands accepted connections to a fixed pool of worker threads.
+
+    The workers are daemon threads, so a server left running (as watch.py
+    does) never keeps the process alive.
+    """
+    request_queue_size = 128
+
+    def __init__(self, address, handler, workers=WORKERS):
+        super().__init__(address, handler)
+        self.connections = queue.Queue()
+        self.etags = {}  # path -> ((mtime_ns, size, inode), etag)
+        for _ in range(workers):
+            threading.Thread(target=self.work, daemon=True).start()
+
+    def process_request(self, request, client_address):
+        self.connections.put((request, client_address))
+
+    def busy(self):
+        """Whether connections are waiting for a worker."""
+        return not self.connections.empty()
+
+    def work(self):
+        while True:
+            request, client_address = self.connections.get()
+            try:
+                self.finish_request(request, client_address)
+            except Exception:
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    def etag(self, path, f, stat):
+        """Strong ETag of an open file: a hash of its bytes, reused until it changes."""
+        key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cached = self.etags.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+        f.seek(0)
+        etag = f'"{digest.hexdigest()[:32]}"'
+        self.etags[path] = (key, etag)
+        return etag
+
+def accepted_encodings(header):
+    """The content codings an Accept-Encoding header allows (q > 0)."""
+    accepted = set()
+    for part in (header or '').split(','):
+        name, *params = part.split(';')
+        q = 1.0
+        for param in params:
+            key, _, value = param.strip().partition('=')
+            if key == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name.strip() and q > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+def parse_range(header, size):
+    """(first, last) byte, inclusive, of a single 'bytes=' range.
+
+    Returns None when the header should be ignored and the whole file sent
+    (another unit, several ranges, or a malformed one). Raises ValueError
+    if the range lies past the end of the file.
+    """
+    unit, _, spec = header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in spec:
+        return None
+    first, dash, last = spec.strip().partition('-')
+    try:
+        first = int(first) if first else None
+        last = int(last) if last else None
+    except ValueError:
+        return None
+    if not dash or (first is None and last is None) or (last is not None and last < 0):
+        return None
+    if first is None:
+        # The last `last` bytes
+        if last == 0 or size == 0:
+            raise ValueError(f"Unsatisfiable range {header!r}")
+        return max(0, size - last), size - 1
+    if last is not None and last < first:
+        return None
+    if first >= size:
+        raise ValueError(f"Unsatisfiable range {header!r}")
+    return first, size - 1 if last is None else min(last, size - 1)
+
+def etag_matches(header, etag):
+    """Whether an If-None-Match header lists etag (weak comparison, as RFC 9110 asks)."""
+    tags = [tag.strip() for tag in header.split(',')]
+    return '*' in tags or any(tag.removeprefix('W/') == etag for tag in tags)
+
+class PreviewHandler(SimpleHTTPRequestHandler):
+    reloader = None
+    protocol_version = 'HTTP/1.1'
+    timeout = KEEP_ALIVE_TIMEOUT
+    # Headers and a sendfile() body are separate writes; without this the
+    # body waits on the client's delayed ACK on a kept-alive connection
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def end_headers(self):
+        # The name changes with the content, so these never need revalidating
+        if self.path.startswith(IMMUTABLE_PREFIX):
+            self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
+        if self.server.busy() and not self.close_connection:
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        super().end_headers()
+
+    def do_GET(self):
+        if self.reloader and self.path == LIVERELOAD_PATH:
+            return self.stream_reloads()
+        self.send_file()
+
+    def do_HEAD(self):
+        self.send_file(head=True)
+
+    def send_file(self, head=False):
+        url = urlsplit(self.path)
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            if not url.path.endswith('/'):
+                location = url.path + '/' + (f'?{url.query}' if url.query else '')
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                self.send_header('Location', location)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            path = path / 'index.html'
+        if not path.is_file():
+            self.send_error(HTTPStatus.NOT_FOUND, 'File not found')
+            return
+        if self.reloader and path.suffix == '.html':
+            return self.send_html(path, head)
+
+        # Sidecars older than the file are stale and never served
+        mtime = path.stat().st_mtime_ns
+        sidecars = [(name, path.with_name(path.name + suffix)) for name, suffix in SIDECARS]
+        sidecars = [(name, sidecar) for name, sidecar in sidecars
+                    if sidecar.is_file() and sidecar.stat().st_mtime_ns >= mtime]
+        encoding, body_path = None, path
+        # A Range names bytes of the representation; keep it to the file itself
+        if 'Range' not in self.headers:
+            accepted = accepted_encodings(self.headers.get('Accept-Encoding'))
+            encoding, body_path = next(((name, sidecar) for name, sidecar in sidecars
+                                        if name in accepted), (None, path))
+
+        try:
+            f = open(body_path, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, 'File not found')
+            return
+        with f:
+            stat = os.fstat(f.fileno())
+            size = stat.st_size
+            etag = self.server.etag(str(body_path), f, stat)
+            last_modified = formatdate(stat.st_mtime, usegmt=True)
+
+            if 'If-None-Match' in self.headers:
+                not_modified = etag_matches(self.headers['If-None-Match'], etag)
+            else:
+                not_modified = self.not_modified_since(stat.st_mtime)
+            if not_modified:
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_validators(etag, last_modified, bool(sidecars))
+                self.end_headers()
+                return
+
+            status, first, count = HTTPStatus.OK, 0, size
+            byte_range = self.headers.get('Range')
+            if byte_range and self.headers.get('If-Range', etag) in (etag, last_modified):
+                try:
+                    selected = parse_range(byte_range, size)
+                except ValueError:
+                    self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                    self.send_header('Content-Range', f'bytes */{size}')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                if selected:
+                    status, first, count = HTTPStatus.PARTIAL_CONTENT, selected[0], selected[1] - selected[0] + 1
+
+            self.send_response(status)
+            self.send_header('Content-Type', self.content_type(path))
+            self.send_header('Content-Length', str(count))
+            if status == HTTPStatus.PARTIAL_CONTENT:
+                self.send_header('Content-Range', f'bytes {first}-{first + count - 1}/{size}')
+            if encoding:
+                self.send_header('Content-Encoding', encoding)
+            self.send_validators(etag, last_modified, bool(sidecars))
+            self.end_headers()
+            if not head and count:
+                self.send_body(f, first, count)
+
+    def send_validators(self, etag, last_modified, varies):
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', last_modified)
+        self.send_header('Accept-Ranges', 'bytes')
+        if varies:
+            self.send_header('Vary', 'Accept-Encoding')
+        if not self.path.startswith(IMMUTABLE_PREFIX):
+            # Cheap to revalidate with the ETag, and never stale while previewing
+            self.send_header('Cache-Control', 'no-cache')
+
+    def not_modified_since(self, mtime):
+        try:
+            since = parsedate_to_datetime(self.headers['If-Modified-Since'])
+        except (KeyError, TypeError, ValueError, IndexError):
+            return False
+        return since is not None and int(mtime) <= since.timestamp()
+
+    def content_type(self, path):
+        return CONTENT_TYPES.get(path.suffix.lower()) or self.guess_type(str(path))
+
+    def send_body(self, f, offset, count):
+        """Copy count bytes of f from offset to the client, in the kernel where it can."""
+        try:
+            # socket.sendfile() loops over os.sendfile() and copies in user
+            # space only where the platform has no sendfile
+            self.wfile.flush()
+            self.connection.sendfile(f, offset, count)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def send_html(self, path, head=False):
+        """Send a page with the reload listener injected; HEAD gets the same headers."""
+        body = path.read_bytes()
+        # Inject the live reload listener just before </body>
+        marker = body.rfind(b'</body>')
+        if marker == -1:
+            marker = len(body)
+        body = body[:marker] + LIVERELOAD_SCRIPT + body[marker:]
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def stream_reloads(self):
+        """Server-sent events: one 'reload' message per rebuild."""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-store')
+        # The stream has no length, so it ends with the connection
+        self.send_header('Connection', 'close')
+        self.close_connection = True
+        self.end_headers()
+        self.connection.settimeout(None)
+        version = self.reloader.version
+        try:
+            while True:
+                latest = self.reloader.wait(version, timeout=15)
+                # Comments keep idle connections alive; messages trigger a reload
+                self.wfile.write(b'data: reload\n\n' if latest > version else b': ping\n\n')
+                self.wfile.flush()
+                version = latest
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+def make_server(port=8000, root='.', reloader=None, workers=WORKERS):
+    """Create (but do not start) a preview server with a pool of worker threads."""
+    handler = partial(type('Handler', (PreviewHandler,), {'reloader': reloader}),
+                      directory=str(root))
+    return PooledHTTPServer(('127.0.0.1', port), handler, workers)
+
+def usage():
+    print("Usage: python serve.py [port] [--workers N]")
+    sys.exit(1)
+
+def main(args=None):
+    args = list(sys.argv[1:] if args is None else args)
+    port, workers = 8000, WORKERS
+    while args:
+        arg = args.pop(0)
+        if arg == '--workers' and args and args[0].isdigit() and int(args[0]) > 0:
+            workers = int(args.pop(0))
+        elif arg.isdigit():
+            port = int(arg)
+        else:
+            usage()
+
+    server = make_server(port, workers=workers)
+    print(f"Serving the site at http://127.0.0.1:{port}/ with {workers} workers (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
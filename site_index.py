@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""Generate the essays/ and books/ listing pages from post metadata.
+
+Each section gets a paginated latest page (<section>/index.html,
+<section>/page/<n>/index.html) and a page per year (<section>/<year>/index.html).
+Entries are cached in .build/index.json, so only the pages holding changed
+posts are rewritten.
+"""
+import sys
+import os
+import json
+from itertools import groupby
+from typing import NamedTuple
+from datetime import datetime
+from pathlib import Path
+from html import escape
+
+import templates
+import timings
+import compress
+import metadata
+from backup import backup_files
+from posts import SECTIONS, iter_posts, post_from_key, read_post_date, book_title_and_author
+
+INDEX_HEADINGS = {'essay': 'Essays', 'book': 'Book Reviews'}
+CACHE_PATH = Path('.build/index.json')
+PAGE_SIZE = 20
+LATEST_PAGES = 5  # older posts are only reachable through the year pages
+
+class Entry(NamedTuple):
+    post: object
+    title: str
+    author: str
+    date: datetime
+
+def post_entry(post):
+    """Index entry for a published post, or None if it should not be listed."""
+    if not (post.dir / 'index.html').exists():
+        return None
+    try:
+        date = read_post_date(post.dir)
+    except ValueError:
+        return None
+    if date is None:
+        return None
+
+    if post.post_type == 'book':
+        try:
+            title, author = book_title_and_author(post.name)
+        except ValueError:
+            return None
+    else:
+        title, author = post.name.replace('-', ' ').title(), None
+    return Entry(post, title, author, date)
+
+def collect_entries(post_type):
+    entries = (post_entry(post) for post in iter_posts([post_type]))
+    return [entry for entry in entries if entry]
+
+def load_cache():
+    try:
+        with open(CACHE_PATH, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_cache(cache):
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = CACHE_PATH.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f, separators=(',', ':'), sort_keys=True)
+    os.replace(tmp_path, CACHE_PATH)
+
+def entry_from_cache(key, cached):
+    date, title, author = cached
+    return Entry(post_from_key(key), title, author, datetime.strptime(date, '%Y-%m-%d'))
+
+def entry_to_cache(entry):
+    return [entry.date.strftime('%Y-%m-%d'), entry.title, entry.author]
+
+def load_entries(post_type):
+    """A section's entries, newest first, from the cache if there is one."""
+    cached = load_cache().get(post_type)
+    if cached is None:
+        return sort_entries(collect_entries(post_type))
+    return sort_entries(entry_from_cache(key, value) for key, value in cached.items())
+
+def render_entry(entry, details=None):
+    """One post's preview; details is its metadata.py entry, if it has one."""
+    time = f'<time datetime="{entry.date.strftime("%Y-%m-%d")}">{entry.date.strftime("%B %d, %Y")}</time>'
+    if details:
+        time += f' <span class="reading-time">· {details["minutes"]} min read</span>'
+    lines = [
+        '                    <article class="post-preview">',
+        f'                        {time}',
+        f'                        <h4><a href="{entry.post.url}">{entry.title}</a></h4>',
+    ]
+    if entry.author:
+        lines.append(f'                        <p class="book-author">by {entry.author}</p>')
+    if details and details['excerpt']:
+        lines.append(f'                        <p class="excerpt">{escape(details["excerpt"])}</p>')
+    lines.append('                    </article>')
+    return '\n'.join(lines)
+
+def sort_entries(entries):
+    return sorted(entries, key=lambda e: (e.date, e.post.name), reverse=True)
+
+def render_sections(entries, details={}):
+    """Year sections, newest first, from entries already in sort_entries() order."""
+    sections = []
+    for year, year_entries in groupby(entries, key=lambda e: e.date.year):
+        articles = '\n'.join(render_entry(entry, details.get(entry.post.key)) for entry in year_entries)
+        sections.append(f'''            <section class="year-section">
+                <h3>{year}</h3>
+                <div class="post-list">
+{articles}
+                </div>
+            </section>''')
+    return '\n\n'.join(sections)
+
+def latest_url(post_type, page):
+    return f'/{SECTIONS[post_type]}/' if page == 1 else f'/{SECTIONS[post_type]}/page/{page}/'
+
+def latest_path(post_type, page):
+    return latest_url(post_type, page).lstrip('/') + 'index.html'
+
+def year_path(post_type, year):
+    return f'{SECTIONS[post_type]}/{year}/index.html'
+
+def render_navigation(post_type, years, page=None, pages=0):
+    """Newer/older links between the latest pages, and links to every year page."""
+    links = []
+    if page and page > 1:
+        links.append(f'                <a href="{latest_url(post_type, page - 1)}">← Newer</a>')
+    if page and page < pages:
+        links.append(f'                <a href="{latest_url(post_type, page + 1)}">Older →</a>')
+    if not page:
+        links.append(f'                <a href="{latest_url(post_type, 1)}">← Latest</a>')
+    parts = []
+    if links:
+        parts.append('            <nav class="pagination">\n' + '\n'.join(links) + '\n            </nav>')
+    if years:
+        year_links = '\n'.join(f'                <a href="/{SECTIONS[post_type]}/{year}/">{year}</a>'
+                               for year in years)
+        parts.append('            <nav class="archive-years">\n'
+                     f'                <h3>Archive</h3>\n{year_links}\n            </nav>')
+    return ''.join('\n\n' + part for part in parts)
+
+def render_index(post_type, entries, years, page=None, pages=0, year=None, details={}):
+    """Generate the HTML for one listing page of a section.
+
+    details maps post keys to their metadata (see metadata.lookup()).
+    """
+    heading = INDEX_HEADINGS[post_type]
+    if year:
+        heading = f'{heading} from {year}'
+    body = templates.INDEX.iter_render(
+        heading=heading,
+        sections=render_sections(entries, details),
+        navigation=render_navigation(post_type, years, page, pages),
+    )
+    return templates.render_page(f'{heading} - Kevin Liu', body)
+
+def page_changed(path, html):
+    """Whether writing html (or removing the page, if html is None) changes path."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return html is None or f.read() != html
+    except FileNotFoundError:
+        return html is not None
+
+def apply_update(path, html):
+    """Write a listing page atomically, or remove it (and its directory) if html is None."""
+    if html is None:
+        os.remove(path)
+        # Precompressed sidecars would otherwise keep serving it
+        compress.refresh_sidecars(path)
+        try:
+            os.removedirs(os.path.dirname(path))
+        except OSError:
+            pass
+        return
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    os.replace(tmp_path, path)
+    compress.refresh_sidecars(path)
+
+def write_index(post_type, keys=None, backup=False, store=None):
+    """Bring a section's listing pages up to date. Returns the paths written or removed.
+
+    keys are the posts that were added, changed or removed since the last
+    call; without them (or without a cache) every post of the section is
+    re-read. With backup, pages are backed up before being replaced. With a
+    store (store.ContentStore), entries are looked up there instead of on disk.
+    """
+    lookup = store.entry if store else lambda key: post_entry(post_from_key(key))
+    collect = store.entries if store else collect_entries
+    with timings.stage('index') as stage:
+        cache = load_cache()
+        cached = cache.get(post_type)
+        old_entries = {key: entry_from_cache(key, value) for key, value in (cached or {}).items()}
+        if cached is None or keys is None:
+            entries = {entry.post.key: entry for entry in collect(post_type)}
+            stale_years = None
+        else:
+            entries = dict(old_entries)
+            stale_years = set()
+            for key in keys:
+                post = post_from_key(key)
+                if post.post_type != post_type:
+                    continue
+                if key in entries:
+                    stale_years.add(entries.pop(key).date.year)
+                entry = lookup(key)
+                if entry:
+                    entries[key] = entry
+                    stale_years.add(entry.date.year)
+
+        ordered = sort_entries(entries.values())
+        by_year = {year: list(group) for year, group in groupby(ordered, key=lambda e: e.date.year)}
+        years = list(by_year)
+        old_years = sorted({entry.date.year for entry in old_entries.values()}, reverse=True)
+        if stale_years is None or years != old_years:
+            # Every page links every year, so a new or emptied year touches them all
+            stale_years = set(years) | set(old_years)
+
+        # The metadata of every post on a page about to be rendered
+        latest = ordered[:PAGE_SIZE * LATEST_PAGES]
+        shown = latest + [entry for year in stale_years for entry in by_year.get(year, [])]
+        details = metadata.lookup(dict.fromkeys(entry.post.key for entry in shown), store)
+
+        # (path, html) for every page that changes; html None removes the page
+        updates = []
+        for year in sorted(stale_years, reverse=True):
+            html = None
+            if year in by_year:
+                html = render_index(post_type, by_year[year], years, year=year, details=details)
+            updates.append((year_path(post_type, year), html))
+
+        # The latest pages shift with every new post; unchanged ones are not rewritten
+        pages = max(1, -(-len(latest) // PAGE_SIZE))
+        for page in range(1, LATEST_PAGES + 1):
+            html = None
+            if page <= pages:
+                html = render_index(post_type, latest[(page - 1) * PAGE_SIZE:page * PAGE_SIZE],
+                                    years, page, pages, details=details)
+            updates.append((latest_path(post_type, page), html))
+
+        updates = [(path, html) for path, html in updates if page_changed(path, html)]
+        if backup:
+            backup_files([path for path, _ in updates])
+        for path, html in updates:
+            apply_update(path, html)
+            if html is not None:
+                stage.wrote(len(html.encode('utf-8')))
+        written = [path for path, _ in updates]
+
+        cache[post_type] = {key: entry_to_cache(entry) for key, entry in entries.items()}
+        save_cache(cache)
+    return written
+
+def main():
+    post_types = [t.lower() for t in sys.argv[1:]] or list(SECTIONS)
+    for post_type in post_types:
+        if post_type not in SECTIONS:
+            print("Usage: python site_index.py [essay] [book]")
+            sys.exit(1)
+        for path in write_index(post_type):
+            print(f"Updated {path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""Posts kept in a single SQLite file instead of the directory tree.
+
+    python store.py import FILE
+    python store.py export FILE
+    python store.py restore FILE --batch ID
+
+The create, update and delete scripts use it when given --store FILE.
+"""
+import sys
+import os
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import timings
+from backup import BATCH_ID
+from posts import SECTIONS, Post, iter_posts, post_from_key, read_post_date
+from site_index import Entry
+from update1 import post_titles
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS posts (
+    key TEXT PRIMARY KEY,
+    post_type TEXT NOT NULL,
+    year TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    title TEXT,
+    author TEXT,
+    date TEXT,
+    source TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    html TEXT,
+    html_version TEXT
+);
+CREATE INDEX IF NOT EXISTS posts_by_date ON posts (post_type, date DESC, slug DESC);
+CREATE TABLE IF NOT EXISTS deleted (
+    batch TEXT NOT NULL,
+    key TEXT NOT NULL,
+    post_type TEXT NOT NULL,
+    year TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    title TEXT,
+    author TEXT,
+    date TEXT,
+    source TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    html TEXT,
+    html_version TEXT
+);
+CREATE INDEX IF NOT EXISTS deleted_by_batch ON deleted (batch);
+'''
+COLUMNS = ('key, post_type, year, slug, title, author, date, source, source_hash, '
+           'html, html_version')
+
+def source_hash(source):
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+def titles(post):
+    """(title, author) as listed in the index, or (None, None) for a malformed book name."""
+    try:
+        return post_titles(post.post_type, post.name)
+    except ValueError:
+        return None, None
+
+class ContentStore:
+    """A connection to a content store. Safe to share between threads."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def _query(self, sql, params=()):
+        with self.lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def row(self, key):
+        rows = self._query(f'SELECT {COLUMNS} FROM posts WHERE key = ?', (key,))
+        return rows[0] if rows else None
+
+    def keys(self, post_types=SECTIONS):
+        placeholders = ', '.join('?' * len(post_types))
+        return [row['key'] for row in self._query(
+            f'SELECT key FROM posts WHERE post_type IN ({placeholders}) ORDER BY key', list(post_types))]
+
+    def source(self, key):
+        row = self.row(key)
+        return row['source'] if row else None
+
+    def source_hash(self, key):
+        rows = self._query('SELECT source_hash FROM posts WHERE key = ?', (key,))
+        return rows[0]['source_hash'] if rows else None
+
+    def date(self, key):
+        row = self.row(key)
+        return datetime.strptime(row['date'], '%Y-%m-%d') if row and row['date'] else None
+
+    def _entry(self, row):
+        if row is None or row['html'] is None or not row['date'] or not row['title']:
+            return None
+        post = Post(row['post_type'], row['year'], row['slug'])
+        return Entry(post, row['title'], row['author'], datetime.strptime(row['date'], '%Y-%m-%d'))
+
+    def entry(self, key):
+        """Index entry for a published post (one with a date and a rendered page), or None."""
+        return self._entry(self.row(key))
+
+    def entries(self, post_type):
+        """Every published post of a section, newest first."""
+        rows = self._query(f'SELECT {COLUMNS} FROM posts WHERE post_type = ? AND date IS NOT NULL '
+                           'AND html IS NOT NULL ORDER BY date DESC, slug DESC', (post_type,))
+        return [entry for entry in map(self._entry, rows) if entry]
+
+    def add(self, post, source, date=None, html=None, html_version=None):
+        """Insert a new post. Raises ValueError if the key is taken."""
+        title, author = titles(post)
+        try:
+            with self.lock, self.conn:
+                self.conn.execute(
+                    f'INSERT INTO posts ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (post.key, post.post_type, post.year, post.name, title, author,
+                     date.strftime('%Y-%m-%d') if date else None,
+                     source, source_hash(source), html, html_version))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Post already exists at {post.key} in {self.path}")
+
+    def set_source(self, key, source):
+        """Replace a post's source; its cached page is kept but marked stale."""
+        with self.lock, self.conn:
+            self.conn.execute('UPDATE posts SET source = ?, source_hash = ?, html_version = NULL '
+                              'WHERE key = ? AND source_hash != ?',
+                              (source, source_hash(source), key, source_hash(source)))
+
+    def set_date(self, key, date):
+        """Set a post's date; the cached page shows the date, so it goes stale."""
+        with self.lock, self.conn:
+            self.conn.execute('UPDATE posts SET date = ?, html_version = NULL WHERE key = ?',
+                              (date.strftime('%Y-%m-%d'), key))
+
+    def set_html(self, key, html, version):
+        with self.lock, self.conn:
+            self.conn.execute('UPDATE posts SET html = ?, html_version = ? WHERE key = ?',
+                              (html, version, key))
+
+    def delete(self, keys, batch=BATCH_ID):
+        """Move posts to the deleted table under batch."""
+        keys = list(keys)
+        with self.lock, self.conn:
+            self.conn.executemany(f'INSERT INTO deleted (batch, {COLUMNS}) '
+                                  f'SELECT ?, {COLUMNS} FROM posts WHERE key = ?',
+                                  [(batch, key) for key in keys])
+            self.conn.executemany('DELETE FROM posts WHERE key = ?', [(key,) for key in keys])
+
+    def restore(self, batch):
+        """Put back the posts a batch deleted. Returns their keys."""
+        with self.lock, self.conn:
+            keys = [row['key'] for row in self.conn.execute(
+                'SELECT key FROM deleted WHERE batch = ? ORDER BY key', (batch,))]
+            if not keys:
+                raise ValueError(f"No posts were deleted in batch {batch}")
+            self.conn.execute(f'INSERT OR REPLACE INTO posts ({COLUMNS}) '
+                              f'SELECT {COLUMNS} FROM deleted WHERE batch = ?', (batch,))
+            self.conn.execute('DELETE FROM deleted WHERE batch = ?', (batch,))
+        return keys
+
+    def import_tree(self):
+        """Copy every post in the tree into the store. Returns the number imported.
+
+        A post already in the store is overwritten. Existing pages are kept
+        as the cached render, marked stale since they may predate the templates.
+        """
+        count = 0
+        with timings.stage('import') as stage:
+            rows = []
+            for post in iter_posts():
+                source_path = post.dir / 'source.txt'
+                source = source_path.read_text(encoding='utf-8')
+                stage.read(timings.file_size(source_path))
+                date = read_post_date(post.dir)
+                html_path = post.dir / 'index.html'
+                html = html_path.read_text(encoding='utf-8') if html_path.exists() else None
+                title, author = titles(post)
+                rows.append((post.key, post.post_type, post.year, post.name, title, author,
+                             date.strftime('%Y-%m-%d') if date else None,
+                             source, source_hash(source), html, None))
+                count += 1
+            with self.lock, self.conn:
+                self.conn.executemany(
+                    f'INSERT OR REPLACE INTO posts ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+        return count
+
+    def export_tree(self):
+        """Write every post in the store into the tree. Returns the paths written.
+
+        Files already holding the same content are left alone.
+        """
+        written = []
+        with timings.stage('export') as stage:
+            for row in self._query(f'SELECT {COLUMNS} FROM posts ORDER BY key'):
+                post_dir = post_from_key(row['key']).dir
+                files = {'source.txt': row['source'], 'date.txt': row['date'], 'index.html': row['html']}
+                for name, content in files.items():
+                    if content is None:
+                        continue
+                    path = post_dir / name
+                    try:
+                        existing = path.read_text(encoding='utf-8')
+                    except FileNotFoundError:
+                        existing = None
+                    if existing == content or (name == 'date.txt' and existing and existing.strip() == content):
+                        continue
+                    post_dir.mkdir(parents=True, exist_ok=True)
+                    tmp_path = path.with_name(name + '.tmp')
+                    with open(tmp_path, 'w', encoding='utf-8') as f:
+                        f.write(content)
+                    os.replace(tmp_path, path)
+                    stage.wrote(len(content.encode('utf-8')))
+                    written.append(str(path))
+        return written
+
+def parse_args(args):
+    """Strip --store FILE from args. Returns (remaining args, ContentStore or None).
+
+    The file must exist; only 'store.py import' creates one.
+    """
+    args = list(args)
+    if '--store' not in args:
+        return args, None
+    i = args.index('--store')
+    if i + 1 >= len(args):
+        print("Error: --store needs a file name")
+        sys.exit(1)
+    path = args[i + 1]
+    del args[i:i + 2]
+    if not Path(path).exists():
+        print(f"Error: No content store at {path}")
+        print("Create one with: python store.py import <file>")
+        sys.exit(1)
+    return args, ContentStore(path)
+
+def usage():
+    print("Usage: python store.py import <file>")
+    print("       python store.py export <file>")
+    print("       python store.py restore <file> --batch <batch-id>")
+    sys.exit(1)
+
+def main():
+    args = timings.parse_args(sys.argv[1:])
+    if len(args) < 2:
+        usage()
+    command, path, args = args[0], args[1], args[2:]
+    if command != 'import' and not Path(path).exists():
+        print(f"Error: No content store at {path}")
+        sys.exit(1)
+
+    store = ContentStore(path)
+    if command == 'import' and not args:
+        print(f"Imported {store.import_tree()} post(s) into {path}")
+    elif command == 'export' and not args:
+        written = store.export_tree()
+        for file in written:
+            print(f"Wrote {file}")
+        print(f"Exported {path}: {len(written)} file(s) changed")
+    elif command == 'restore' and len(args) == 2 and args[0] == '--batch':
+        try:
+            keys = store.restore(args[1])
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        for key in keys:
+            print(f"Restored {key}")
+        print(f"Run python backup.py restore --batch {args[1]} to bring back their pages too.")
+    else:
+        usage()
+    store.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Tag and series pages, from the front matter of post sources.
+
+Tag and series postings are kept in .build/taxonomy.json, so only the
+pages of the names a changed post entered, left or stayed in are rendered.
+"""
+import sys
+import re
+import json
+import os
+from glob import glob
+from html import escape
+from pathlib import Path
+
+import markup
+import metadata
+import templates
+import timings
+from backup import backup_files
+from posts import SECTIONS, iter_posts, post_from_key, file_hash
+from site_index import load_entries, sort_entries, render_sections, page_changed, apply_update
+
+STATE_PATH = Path('.build/taxonomy.json')
+KINDS = {'tags': 'Tags', 'series': 'Series'}
+
+def slug(name):
+    """URL-friendly form of a tag or series name; names that differ only in case or punctuation share it."""
+    return re.sub(r'[\s_-]+', '-', re.sub(r'[^\w\s-]', '', name.lower())).strip('-')
+
+def page_url(kind, name):
+    return f'/{kind}/{slug(name)}/'
+
+def page_path(kind, name_slug=None):
+    """A tag's or series' page, or the kind's overview page without a slug."""
+    return f'{kind}/{name_slug}/index.html' if name_slug else f'{kind}/index.html'
+
+def post_names(fields):
+    """{kind: [names]} of a post's front-matter fields, keeping names that have a slug."""
+    names = {'tags': fields.get('tags', []), 'series': [fields['series']] if fields.get('series') else []}
+    return {kind: [name for name in values if slug(name)] for kind, values in names.items()}
+
+def links(fields):
+    """(tag links, series link or None) for a post page, as (url, name) pairs."""
+    names = post_names(fields)
+    tags = [(page_url('tags', name), name) for name in names['tags']]
+    series = [(page_url('series', name), name) for name in names['series']]
+    return tags, series[0] if series else None
+
+def read_fields(key, store=None):
+    """A post's front-matter fields, read without its body."""
+    if store:
+        fields, _ = markup.split_front_matter(store.source(key).split('\n'))
+        return fields
+    with open(post_from_key(key).dir / 'source.txt', 'r', encoding='utf-8') as source:
+        fields, _ = markup.split_front_matter(source)
+    return fields
+
+def load_state():
+    try:
+        with open(STATE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def save_state(state):
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = STATE_PATH.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(state, separators=(',', ':'), sort_keys=True, ensure_ascii=False))
+    os.replace(tmp_path, STATE_PATH)
+
+def display_name(state, kind, name_slug):
+    """The name a tag or series is shown by: the first, in sort order, of its posts' spellings."""
+    return min(name for key in state[kind][name_slug]
+               for name in state['posts'][key][kind] if slug(name) == name_slug)
+
+def render_listing(state, kind, name_slug, entries, details):
+    """A tag's or series' page, or None if none of its posts are published."""
+    listed = [entries[key] for key in state[kind].get(name_slug, []) if key in entries]
+    if not listed:
+        return None
+    name = display_name(state, kind, name_slug)
+    if kind == 'series':
+        listed = sort_entries(listed)[::-1]
+        heading = f'Series: {name}'
+    else:
+        listed = sort_entries(listed)
+        heading = f'Tagged {name}'
+    heading = escape(heading, quote=False)
+    body = templates.INDEX.iter_render(
+        heading=heading,
+        sections=render_sections(listed, details),
+        navigation=f'\n\n            <nav class="pagination">\n'
+                   f'                <a href="/{kind}/">← All {KINDS[kind].lower()}</a>\n'
+                   f'            </nav>',
+    )
+    return templates.render_page(f'{heading} - Kevin Liu', body)
+
+def render_overview(kind, counts):
+    """The page linking every tag or series with a page, or None if there are none.
+
+    counts maps slugs to (display name, number of published posts).
+    """
+    if not counts:
+        return None
+    ordered = sorted(counts.items(), key=lambda item: (item[1][0].lower(), item[0]))
+    items = '\n'.join(f'                <a href="/{kind}/{name_slug}/">{escape(name, quote=False)} ({count})</a>'
+                      for name_slug, (name, count) in ordered)
+    body = templates.INDEX.iter_render(
+        heading=KINDS[kind],
+        sections=f'            <nav class="archive-years">\n{items}\n            </nav>',
+        navigation='',
+    )
+    return templates.render_page(f'{KINDS[kind]} - Kevin Liu', body)
+
+def update_taxonomy(keys=None, store=None, backup=False):
+    """Bring the tag and series pages up to date. Returns the paths written or removed.
+
+    keys are the posts that were added, changed or removed since the last
+    call; without them (or without an index) every post is read. Call it
+    after site_index.write_index(), whose entries it lists. With backup,
+    pages are backed up before being replaced or removed.
+    """
+    with timings.stage('taxonomy') as stage:
+        state = load_state()
+        full = keys is None or state is None
+        if state is None:
+            state = {'posts': {}, 'tags': {}, 'series': {}}
+        posts = state['posts']
+        if full:
+            candidates = set(store.keys() if store else (post.key for post in iter_posts())) | set(posts)
+        else:
+            candidates = set(keys)
+
+        # Move the changed posts between the postings of their old and new names
+        touched = {kind: set() for kind in KINDS}
+        for key in sorted(candidates):
+            digest = store.source_hash(key) if store else file_hash(post_from_key(key).dir / 'source.txt')
+            old = posts.get(key)
+            if old and old['source'] == digest:
+                new = old
+            elif digest is None:
+                new = None
+            else:
+                try:
+                    new = {'source': digest, **post_names(read_fields(key, store))}
+                except (OSError, UnicodeDecodeError):
+                    new = old
+            for kind in KINDS:
+                old_slugs = {slug(name) for name in (old or {}).get(kind, [])}
+                new_slugs = {slug(name) for name in (new or {}).get(kind, [])}
+                for name_slug in old_slugs - new_slugs:
+                    state[kind][name_slug].remove(key)
+                    if not state[kind][name_slug]:
+                        del state[kind][name_slug]
+                for name_slug in new_slugs - old_slugs:
+                    state[kind][name_slug] = sorted(state[kind].get(name_slug, []) + [key])
+                # A post that stayed may still have a new date, title or excerpt
+                touched[kind] |= old_slugs | new_slugs
+            if new is None:
+                posts.pop(key, None)
+            else:
+                posts[key] = new
+
+        if full:
+            # Pages of every name, and of names that are gone
+            for kind in KINDS:
+                touched[kind] |= set(state[kind])
+                touched[kind] |= {Path(path).parent.name for path in glob(f'{kind}/*/index.html')}
+
+        updates = []
+        if any(touched.values()):
+            entries = {entry.post.key: entry for post_type in SECTIONS for entry in load_entries(post_type)}
+            shown = {key for kind in KINDS for name_slug in touched[kind]
+                     for key in state[kind].get(name_slug, []) if key in entries}
+            details = metadata.lookup(sorted(shown), store)
+            for kind in KINDS:
+                for name_slug in sorted(touched[kind]):
+                    html = render_listing(state, kind, name_slug, entries, details)
+                    updates.append((page_path(kind, name_slug), html))
+                # Counts change with any post entering or leaving; unchanged pages are not rewritten
+                counts = {}
+                for name_slug, keys_of_name in state[kind].items():
+                    count = sum(key in entries for key in keys_of_name)
+                    if count:
+                        counts[name_slug] = (display_name(state, kind, name_slug), count)
+                updates.append((page_path(kind), render_overview(kind, counts)))
+
+        updates = [(path, html) for path, html in updates if page_changed(path, html)]
+        if backup:
+            backup_files([path for path, _ in updates])
+        for path, html in updates:
+            apply_update(path, html)
+            if html is not None:
+                stage.wrote(len(html.encode('utf-8')))
+        save_state(state)
+    return [path for path, _ in updates]
+
+def main():
+    if sys.argv[1:]:
+        print("Usage: python taxonomy.py")
+        print("Rebuilds every tag and series page from the posts' front matter.")
+        sys.exit(1)
+    for path in update_taxonomy():
+        print(f"Updated {path}")
+
+if __name__ == '__main__':
+    main()
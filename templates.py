@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""Page templates shared by every generated page.
+
+Templates are compiled once, at import time, into a list of literal strings
+and placeholder names. Partials ({{> name}}) are inlined during compilation,
+so the page chrome (head, header/nav and footer) ends up as a few constant
+strings and rendering a page only splices in its variable pieces.
+
+A placeholder's value may be a string or any iterable of strings, which is
+streamed through unchanged; nested templates are passed as iter_render().
+Asset URLs in the literals are resolved to their fingerprinted files
+(assets.py) at compile time, so rendering never consults the manifest.
+"""
+import re
+import os
+from html import escape
+
+import assets
+import compress
+
+PLACEHOLDER = re.compile(r'\{\{\s*(>?)\s*(\w+)\s*\}\}')
+
+PARTIALS = {
+    'head': '''    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{title}}</title>
+    <link rel="stylesheet" href="/assets/css/styles.css">
+    <link rel="alternate" type="application/atom+xml" title="Essays - Kevin Liu" href="/essays/feed.xml">
+    <link rel="alternate" type="application/atom+xml" title="Book Reviews - Kevin Liu" href="/books/feed.xml">''',
+
+    'header': '''        <header class="header">
+            <div>
+                <h1>Kevin Liu</h1>
+                <nav>
+                    <a href="/">Home</a>
+                    <a href="/essays">Essays</a>
+                    <a href="/books">Books</a>
+                    <a href="/engineering">Engineering</a>
+                    <a href="/games">Games</a>
+                    <a href="/about">About</a>
+                    <a href="/search">Search</a>
+                </nav>
+            </div>
+            <button class="theme-toggle" aria-label="Toggle dark mode">Toggle theme</button>
+        </header>''',
+
+    'footer': '''        <footer class="footer">
+            © 2024 Kevin Liu. All rights reserved.
+        </footer>''',
+}
+
+class Template:
+    """A template compiled into alternating literal and placeholder parts."""
+
+    def __init__(self, source, partials=PARTIALS, asset_manifest=None):
+        self.parts = []
+        literal = []
+        self._compile(source, partials, literal)
+        self.parts.append(''.join(literal))
+        manifest = assets.load_manifest() if asset_manifest is None else asset_manifest
+        self.parts[::2] = [assets.rewrite_refs(part, manifest=manifest) for part in self.parts[::2]]
+
+    def _compile(self, source, partials, literal):
+        pos = 0
+        for match in PLACEHOLDER.finditer(source):
+            literal.append(source[pos:match.start()])
+            is_partial, name = match.groups()
+            if is_partial:
+                self._compile(partials[name], partials, literal)
+            else:
+                # Adjacent literals are merged, so parts alternate literal/name
+                self.parts.append(''.join(literal))
+                self.parts.append(name)
+                literal.clear()
+            pos = match.end()
+        literal.append(source[pos:])
+
+    def iter_render(self, **context):
+        """Yield the rendered page piece by piece."""
+        for i, part in enumerate(self.parts):
+            if i % 2 == 0:
+                if part:
+                    yield part
+                continue
+            value = context[part]
+            if isinstance(value, str):
+                yield value
+            else:
+                yield from value
+
+    def render(self, **context):
+        return ''.join(self.iter_render(**context))
+
+LAYOUT_SOURCE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+{{> head}}
+</head>
+<body>
+    <div class="container">
+{{> header}}
+
+        <main{{main_class}}>
+{{body}}
+        </main>
+
+{{> footer}}
+    </div>
+
+    <script src="/assets/theme.js"></script>
+</body>
+</html>
+'''
+
+LAYOUT = Template(LAYOUT_SOURCE)
+
+POST = Template('''            <article>
+                <header class="post-header">
+                    <h2>{{title}}</h2>{{byline}}
+                    <time datetime="{{date_iso}}">{{date_long}}</time>{{taxonomy}}
+                </header>
+
+                <section class="post-body">
+                    {{content}}
+                </section>{{related}}
+            </article>
+
+            <nav class="post-navigation">
+                <a href="/{{section}}">← Back to {{section_name}}</a>
+            </nav>''')
+
+INDEX = Template('''            <h2>{{heading}}</h2>
+
+{{sections}}{{navigation}}''')
+
+# Hand-written pages that only borrow the layout; their <main> is kept as is
+STATIC_PAGES = ['index.html', 'about/index.html', 'engineering/index.html', 'games/index.html']
+
+def compile_layout():
+    """Recompile the layout after assets.py wrote a new manifest."""
+    global LAYOUT
+    LAYOUT = Template(LAYOUT_SOURCE)
+
+def iter_layout(title, body, main_class=''):
+    """Yield a full page: shared chrome around body (a string or iterable)."""
+    return LAYOUT.iter_render(
+        title=title,
+        main_class=f' class="{main_class}"' if main_class else '',
+        body=body,
+    )
+
+def render_page(title, body, main_class=''):
+    return ''.join(iter_layout(title, body, main_class))
+
+def render_related(heading, links):
+    """The related-posts block for a post page from (url, label) links, or '' if there are none."""
+    if not links:
+        return ''
+    items = '\n'.join(f'                        <li><a href="{url}">{escape(label, quote=False)}</a></li>'
+                      for url, label in links)
+    return f'''
+
+                <aside class="related-posts">
+                    <h3>{heading}</h3>
+                    <ul>
+{items}
+                    </ul>
+                </aside>'''
+
+def render_taxonomy(tags, series=None):
+    """The series and tag links under a post's date, from (url, name) links, or '' if there are none."""
+    lines = []
+    if series:
+        url, name = series
+        lines.append(f'\n                    <p class="post-series">Part of the series '
+                     f'<a href="{url}">{escape(name, quote=False)}</a></p>')
+    if tags:
+        links = ', '.join(f'<a href="{url}">{escape(name, quote=False)}</a>' for url, name in tags)
+        lines.append(f'\n                    <p class="post-tags">Tagged {links}</p>')
+    return ''.join(lines)
+
+def iter_post_page(page_title, title, chunks, date, section, author=None, related='', taxonomy=''):
+    """Yield a post page, streaming the body fragments from chunks."""
+    def content():
+        for i, chunk in enumerate(chunks):
+            yield '\n' + chunk if i else chunk
+
+    body = POST.iter_render(
+        title=title,
+        byline=f'\n                    <h3 class="book-author">by {author}</h3>' if author else '',
+        date_iso=date.strftime('%Y-%m-%d'),
+        date_long=date.strftime('%B %d, %Y'),
+        content=content(),
+        section=section,
+        section_name=section.title(),
+        related=related,
+        taxonomy=taxonomy,
+    )
+    return iter_layout(page_title, body, main_class='post-content')
+
+def refresh_static_page(path):
+    """Re-wrap a hand-written page's <title> and <main> in the shared layout.
+
+    Returns True if the file changed.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        html = f.read()
+    title = re.search(r'<title>(.*?)</title>', html, re.DOTALL)
+    main = re.search(r'<main[^>]*>\n(.*?)\n        </main>', html, re.DOTALL)
+    if not (title and main):
+        raise ValueError(f"{path}: could not find <title> and <main>")
+
+    body = assets.rewrite_refs(main.group(1), assets.page_url(path))
+    updated = render_page(title.group(1), body)
+    if updated == html:
+        return False
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(updated)
+    os.replace(tmp_path, path)
+    compress.refresh_sidecars(path)
+    return True
+
+def main():
+    for path in STATIC_PAGES:
+        if refresh_static_page(path):
+            print(f"Updated {path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The scripts are run from the repository root and import each other as top-level modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+@pytest.fixture
+def site(tmp_path, monkeypatch):
+    """An empty site in a temporary directory, made the working directory.
+
+    Returns a function that adds a post: site('essays/posts/2024/name', source, date).
+    """
+    import metadata
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(metadata, '_loaded', None)
+
+    def add_post(key, source, date='2024-01-01'):
+        post_dir = tmp_path / key
+        post_dir.mkdir(parents=True, exist_ok=True)
+        (post_dir / 'source.txt').write_text(source, encoding='utf-8')
+        if date:
+            (post_dir / 'date.txt').write_text(date)
+        return post_dir
+    return add_post
@@ -0,0 +1,43 @@
+import gzip
+import json
+from pathlib import Path
+
+import assets
+
+def test_rewrite_page_points_at_fingerprints_and_refreshes_sidecars(site):
+    page = Path('games/pong/index.html')
+    page.parent.mkdir(parents=True)
+    body = '<p>Pong</p>\n' * 40  # past compress.MIN_SIZE
+    page.write_text('<link href="/assets/css/styles.css"><script src="pong.js"></script>\n' + body)
+    Path(f'{page}.gz').write_bytes(gzip.compress(b'stale'))
+    assets.DIST_DIR.mkdir(parents=True)
+    assets.MANIFEST_PATH.write_text(json.dumps({
+        '/assets/css/styles.css': '/assets/dist/styles.0123456789.css',
+        '/games/pong/pong.js': '/assets/dist/pong.abcdef0123.js',
+    }))
+
+    assert assets.rewrite_page(page)
+
+    html = page.read_text()
+    assert html == ('<link href="/assets/dist/styles.0123456789.css">'
+                    '<script src="/assets/dist/pong.abcdef0123.js"></script>\n' + body)
+    assert gzip.decompress(Path(f'{page}.gz').read_bytes()) == html.encode()
+    # Already fingerprinted: nothing to rewrite
+    assert not assets.rewrite_page(page)
+
+def test_minify_js_drops_comments_and_indentation():
+    source = '// header\nfunction f(a) {\n    /* note */\n    return a   + 1;\n\n}\n'
+    assert assets.minify_js(source) == 'function f(a) {\nreturn a + 1;\n}\n'
+
+def test_minify_js_keeps_literals_verbatim():
+    source = ("const t = `one\n    two   ${a  +  `in ${ b }  `}\n  three`;\n"
+              "    const s = 'it\\'s  // not a comment', d = \"x  /* y */\";\n"
+              "    const r = /[/]  \"/g, q = a / b / c;\n")
+    assert assets.minify_js(source) == (
+        "const t = `one\n    two   ${a + `in ${ b }  `}\n  three`;\n"
+        "const s = 'it\\'s  // not a comment', d = \"x  /* y */\";\n"
+        "const r = /[/]  \"/g, q = a / b / c;\n")
+
+def test_minify_js_keeps_line_breaks_between_statements():
+    # Joining these lines would change what automatic semicolon insertion does
+    assert assets.minify_js('let a = b\n  (c)\nreturn\n  x\n') == 'let a = b\n(c)\nreturn\nx\n'
@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+
+import backup
+
+def write_versions(path, count, batch='b'):
+    """Back up count versions of path, then leave it holding one more."""
+    for n in range(count):
+        path.write_text(f'version {n}')
+        backup.backup_file(path, batch=f'{batch}{n}')
+    path.write_text('current')
+
+def test_backup_skips_unchanged_content(site):
+    path = Path('page.html')
+    path.write_text('same')
+    first = backup.backup_file(path)
+    assert backup.backup_file(path) == first
+    assert len(backup.load_index()['page.html']) == 1
+
+def test_generations_are_capped_and_collected(site):
+    path = Path('page.html')
+    write_versions(path, backup.KEEP_GENERATIONS + 2)
+    generations = backup.load_index()['page.html']
+    assert [backup.object_path(entry['hash']).read_text() for entry in generations] == [
+        f'version {n}' for n in range(2, backup.KEEP_GENERATIONS + 2)]
+    assert len(list(backup.OBJECTS_DIR.glob('*/*'))) == backup.KEEP_GENERATIONS
+
+def test_restore_oldest_generation_at_the_limit(site):
+    path = Path('page.html')
+    write_versions(path, backup.KEEP_GENERATIONS)
+    entry = backup.restore_file(path, backup.KEEP_GENERATIONS)
+    assert path.read_text() == 'version 0'
+    assert entry['batch'] == 'b0'
+    # The content it replaced was backed up, so the restore can be undone
+    backup.restore_file(path, 1)
+    assert path.read_text() == 'current'
+
+def test_restore_missing_generation(site):
+    with pytest.raises(ValueError):
+        backup.restore_file('page.html')
+
+def test_restore_batch_at_the_limit(site):
+    path = Path('page.html')
+    write_versions(path, backup.KEEP_GENERATIONS)
+    assert backup.restore_batch('b0') == ['page.html']
+    assert path.read_text() == 'version 0'
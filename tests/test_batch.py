@@ -0,0 +1,50 @@
+from pathlib import Path
+
+import pytest
+
+import batch
+import build
+import feeds
+
+def snapshot():
+    return {path: Path(path).read_bytes() for path in batch.iter_site_files()}
+
+def fail(*args, **kwargs):
+    raise OSError('disk full')
+
+def test_failure_mid_plan_rolls_everything_back(site, monkeypatch, tmp_path):
+    site('essays/posts/2024/apples', 'Apples are red.')
+    pears = site('essays/posts/2024/pears', 'Pears are green.')
+    build.build_posts(['essays/posts/2024/apples', 'essays/posts/2024/pears'])
+    (tmp_path / 'new.txt').write_text('A new post.', encoding='utf-8')
+    (tmp_path / 'edit.txt').write_text('Pears are yellow.', encoding='utf-8')
+    before = snapshot()
+
+    operations = [batch.parse_operation(line.split()) for line in (
+        'create essay new.txt 2024-02-01',
+        'update essay 2024/pears edit.txt',
+        'delete essay 2024/apples',
+    )]
+    drafts, problems = batch.validate(operations)
+    assert not problems
+    # Posts are changed and rendered, index and search written; then the feeds fail
+    monkeypatch.setattr(feeds, 'write_feeds', fail)
+    transaction = batch.Transaction()
+    with pytest.raises(OSError):
+        batch.apply_plan(operations, drafts, transaction)
+    assert (pears / 'source.txt').read_text(encoding='utf-8') == 'Pears are yellow.'
+
+    transaction.rollback()
+    assert snapshot() == before
+
+def test_only_render_outputs_are_protected(site):
+    assert batch.is_listing_file('essays/index.html')
+    assert batch.is_listing_file('essays/page/2/index.html')
+    assert batch.is_listing_file('tags/fruit/index.html')
+    assert batch.is_listing_file('assets/search/docs/0.json')
+    assert batch.is_listing_file('.build/manifest.json')
+    assert not batch.is_listing_file('.build/batch.lock')
+    assert not batch.is_listing_file('essays/posts/2024/apples/index.html')
+    assert not batch.is_listing_file('assets/dist/site.css')
+    assert not batch.is_listing_file('about/index.html')
+    assert not batch.is_listing_file('essays/index.html.gz')
@@ -0,0 +1,14 @@
+import pytest
+
+import build
+from posts import post_from_key
+
+def test_failed_write_keeps_the_old_page(site):
+    post_dir = site('essays/posts/2024/apples', 'Apples are red.')
+    (post_dir / 'index.html').write_text('<p>old</p>', encoding='utf-8')
+
+    with pytest.raises(UnicodeEncodeError):
+        build.write_page(post_from_key('essays/posts/2024/apples'), '<p>new</p>' * 1000 + '\ud800')
+
+    assert (post_dir / 'index.html').read_text(encoding='utf-8') == '<p>old</p>'
+    assert not (post_dir / 'index.html.tmp').exists()
@@ -0,0 +1,43 @@
+import os
+from pathlib import Path
+
+import deploy
+
+def write(path, text):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(text, encoding='utf-8')
+
+def test_manifest_lists_only_served_files(site):
+    site('essays/posts/2024/apples', 'Apples are red.')
+    write('essays/posts/2024/apples/index.html', '<p>Apples</p>')
+    write('.build/manifest.json', '{}')
+    write('.nojekyll', '')
+    write('build.py', '')
+    write('__pycache__/build.cpython-312.pyc', '')
+
+    manifest = deploy.output_manifest()
+
+    assert sorted(manifest) == ['.nojekyll', 'essays/posts/2024/apples/index.html']
+    assert manifest['essays/posts/2024/apples/index.html'][0] == len('<p>Apples</p>')
+
+def test_plan_diffs_against_the_deployed_manifest(site):
+    write('index.html', 'home')
+    write('old.html', 'gone soon')
+    write('same.html', 'same')
+    deployed = deploy.output_manifest()
+
+    write('index.html', 'new home')
+    os.remove('old.html')
+    write('new.html', 'new')
+    write('same.html', 'same')  # rewritten with the same bytes
+    current = deploy.output_manifest()
+
+    assert deploy.plan_deploy(current, deployed) == (['new.html'], ['index.html'], ['old.html'])
+    assert deploy.plan_deploy(current, current) == ([], [], [])
+
+def test_cached_hash_is_refreshed_when_the_file_changes(site):
+    write('index.html', 'one')
+    first = deploy.output_manifest()['index.html']
+    write('index.html', 'two')
+    os.utime('index.html', ns=(1, 1))
+    assert deploy.output_manifest()['index.html'] != first
@@ -0,0 +1,60 @@
+import markup
+
+def html(source, **options):
+    return list(markup.iter_html(source.split('\n'), **options))
+
+def test_paragraphs_and_headings():
+    assert html('# Title\n\nOne\n## Sub\nTwo') == ['<h3>Title</h3>', '<p>One</p>', '<h4>Sub</h4>', '<p>Two</p>']
+
+def test_text_is_escaped():
+    assert html('a < b & "c"') == ['<p>a &lt; b &amp; "c"</p>']
+    assert html('```\n<b>&\n```') == ['<pre><code>&lt;b&gt;&amp;', '</code></pre>']
+
+def test_inline_markup():
+    assert markup.render_inline('**bold** and *em* and `a*b*`') == (
+        '<strong>bold</strong> and <em>em</em> and <code>a*b*</code>', 'bold and em and a*b*')
+    assert markup.render_inline('[site](https://x.dev/?a=1&b=2)')[0] == \
+        '<a href="https://x.dev/?a=1&amp;b=2">site</a>'
+
+def test_unmatched_delimiters_stay_literal():
+    assert markup.render_inline('a * b, **c, [d] and `e')[0] == 'a * b, **c, [d] and `e'
+    assert markup.render_inline(r'\*not em\*')[0] == '*not em*'
+
+def test_lists_and_quotes():
+    assert html('- a\n- b\n1. c\n> q') == [
+        '<ul>', '<li>a</li>', '<li>b</li>', '</ul>', '<ol>', '<li>c</li>', '</ol>',
+        '<blockquote>', '<p>q</p>', '</blockquote>']
+
+def test_byte_order_mark_is_dropped():
+    assert html('﻿Hello') == ['<p>Hello</p>']
+
+def test_signoff_is_set_apart():
+    source = 'Body text.\n\nUntil next time,\nKevin\n'
+    assert html(source, signoff=True) == ['<p>Body text.</p>', '<p class="signoff">Until next time,<br>Kevin</p>']
+    assert html(source) == ['<p>Body text.</p>', '<p>Until next time,</p>', '<p>Kevin</p>']
+
+def test_list_items_are_not_a_signoff():
+    assert html('- a\n- b\n- c\n- d', signoff=True) == [
+        '<ul>', '<li>a</li>', '<li>b</li>', '<li>c</li>', '<li>d</li>', '</ul>']
+    assert html('Text\n- Kevin', signoff=True) == ['<p>Text</p>', '<p class="signoff">- Kevin</p>']
+
+def test_front_matter_is_parsed_and_stripped():
+    fields, body = markup.split_front_matter(['---', 'tags: a, b, a', 'series: S', '---', 'Body'])
+    assert fields == {'tags': ['a', 'b'], 'series': 'S'}
+    assert list(body) == ['Body']
+    assert html('﻿---\ntags: x\n---\nBody') == ['<p>Body</p>']
+
+def test_other_openings_stay_in_the_body():
+    fields, body = markup.split_front_matter(['---', 'not a field', '---', 'Body'])
+    assert fields == {}
+    assert list(body) == ['---', 'not a field', '---', 'Body']
+    assert html('---\nunclosed') == ['<p>---</p>', '<p>unclosed</p>']
+
+def test_essay_pages_set_their_signoff_apart():
+    from datetime import datetime
+    import update1
+    source = 'Body text.\nUntil next time,\nKevin'
+    essay = update1.render_post('essay', 'a-post', source, datetime(2024, 1, 1))
+    book = update1.render_post('book', 'a-book-by-an-author', source, datetime(2024, 1, 1))
+    assert '<p class="signoff">Until next time,<br>Kevin</p>' in essay
+    assert 'class="signoff"' not in book
@@ -0,0 +1,52 @@
+import json
+
+import search
+from posts import post_from_key
+
+def docs(bucket=0):
+    return json.loads((search.SEARCH_DIR / 'docs' / f'{bucket}.json').read_text(encoding='utf-8'))
+
+def shard(term):
+    """The shard a term would be in; {} once it was emptied and removed."""
+    return search.load_json(search.SEARCH_DIR / f'{search.shard_name(term)}.json')
+
+def terms_of(key):
+    return search.index_post(post_from_key(key))
+
+def test_missing_state_indexes_every_post(site):
+    site('essays/posts/2024/apples', 'Apples are red.')
+    site('essays/posts/2024/pears', 'Pears are green.')
+    # Shards from a previous run, with no .build/search.json (e.g. a fresh clone)
+    search.SEARCH_DIR.mkdir(parents=True)
+    (search.SEARCH_DIR / 'zz.json').write_text('{"zzz":{"7":[0]}}')
+
+    search.update_index({'essays/posts/2024/apples': terms_of('essays/posts/2024/apples')})
+
+    assert sorted(url for url, *_ in docs().values()) == [
+        '/essays/posts/2024/apples/', '/essays/posts/2024/pears/']
+    assert 'green' in shard('green')
+    assert not (search.SEARCH_DIR / 'zz.json').exists()
+
+def test_update_with_state_only_touches_changed_posts(site):
+    apples = site('essays/posts/2024/apples', 'Apples are red.')
+    site('essays/posts/2024/pears', 'Pears are green.')
+    search.update_index({}, all_keys=['essays/posts/2024/apples', 'essays/posts/2024/pears'])
+    pears_id = json.loads(search.STATE_PATH.read_text())['ids']['essays/posts/2024/pears']
+
+    (apples / 'source.txt').write_text('Apples are yellow.', encoding='utf-8')
+    search.update_index({'essays/posts/2024/apples': terms_of('essays/posts/2024/apples')})
+
+    assert 'red' not in shard('red')
+    assert 'yellow' in shard('yellow')
+    assert list(shard('green')['green']) == [str(pears_id)]
+    assert len(docs()) == 2
+
+def test_removed_post_is_dropped(site):
+    site('essays/posts/2024/apples', 'Apples are red.')
+    site('essays/posts/2024/pears', 'Pears are green.')
+    search.update_index({}, all_keys=['essays/posts/2024/apples', 'essays/posts/2024/pears'])
+
+    search.update_index({}, removed=['essays/posts/2024/pears'])
+
+    assert 'green' not in shard('green')
+    assert [url for url, *_ in docs().values()] == ['/essays/posts/2024/apples/']
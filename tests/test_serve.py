@@ -0,0 +1,60 @@
+import threading
+from http.client import HTTPConnection
+
+import pytest
+
+import serve
+
+@pytest.mark.parametrize('header, expected', [
+    ('bytes=0-99', (0, 99)),
+    ('bytes=10-', (10, 999)),
+    ('bytes=990-5000', (990, 999)),
+    ('bytes=-100', (900, 999)),
+    ('bytes=-5000', (0, 999)),
+    ('bytes=999-999', (999, 999)),
+    (' Bytes = 5-6', (5, 6)),
+])
+def test_parse_range(header, expected):
+    assert serve.parse_range(header, 1000) == expected
+
+@pytest.mark.parametrize('header', [
+    'items=0-10',      # another unit
+    'bytes=0-1,5-6',   # several ranges
+    'bytes=5',         # no dash
+    'bytes=-',         # neither end
+    'bytes=a-b',
+    'bytes=10-5',      # last before first
+])
+def test_parse_range_ignored(header):
+    assert serve.parse_range(header, 1000) is None
+
+@pytest.mark.parametrize('header, size', [
+    ('bytes=1000-', 1000),
+    ('bytes=1000-2000', 1000),
+    ('bytes=-0', 1000),
+    ('bytes=-10', 0),
+    ('bytes=0-', 0),
+])
+def test_parse_range_unsatisfiable(header, size):
+    with pytest.raises(ValueError):
+        serve.parse_range(header, size)
+
+def test_head_matches_get_with_live_reload(tmp_path):
+    (tmp_path / 'index.html').write_text('<html><body>Hi</body></html>')
+    server = serve.make_server(0, tmp_path, serve.Reloader(), workers=2)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        headers = {}
+        for method in ('HEAD', 'GET'):
+            connection = HTTPConnection(*server.server_address, timeout=5)
+            connection.request(method, '/')
+            response = connection.getresponse()
+            body = response.read()
+            headers[method] = dict(response.getheaders())
+            connection.close()
+        assert serve.LIVERELOAD_SCRIPT in body
+        assert headers['HEAD']['Content-Length'] == headers['GET']['Content-Length'] == str(len(body))
+        assert headers['HEAD']['Content-Type'] == headers['GET']['Content-Type']
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,28 @@
+import sys
+
+import update
+
+def run_update(monkeypatch, target):
+    monkeypatch.setattr(sys, 'argv', ['update.py', target])
+    update.main()
+
+def test_update_keeps_related_posts(site, monkeypatch):
+    apples = site('essays/posts/2024/apples', 'Apples and pears grow in the orchard.')
+    site('essays/posts/2024/pears', 'Pears and apples grow in the orchard.')
+    run_update(monkeypatch, '2024/pears')
+    run_update(monkeypatch, '2024/apples')
+
+    html = (apples / 'index.html').read_text(encoding='utf-8')
+    assert '<aside class="related-posts">' in html
+    assert '<a href="/essays/posts/2024/pears/">Pears</a>' in html
+
+def test_update_keeps_tag_and_series_links(site, monkeypatch):
+    post = site('essays/posts/2024/apples', '---\ntags: Fruit, Orchards\nseries: Harvest\n---\nApples are red.')
+    run_update(monkeypatch, '2024/apples')
+
+    html = (post / 'index.html').read_text(encoding='utf-8')
+    assert '<p class="post-series">Part of the series <a href="/series/harvest/">Harvest</a></p>' in html
+    assert ('<p class="post-tags">Tagged <a href="/tags/fruit/">Fruit</a>, '
+            '<a href="/tags/orchards/">Orchards</a></p>') in html
+    assert 'tags:' not in html
+    assert '/essays/posts/2024/apples/' in open('tags/fruit/index.html', encoding='utf-8').read()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Opt-in per-stage timings for the publishing scripts.
+
+Every entry point accepts --timings (print a summary table on exit) and
+--trace FILE (write a Chrome trace-event JSON file, which chrome://tracing
+and ui.perfetto.dev can load). Code marks its stages with
+
+    with timings.stage('render', reads=[source_path], writes=[html_path]):
+        ...
+
+which records the wall time and the number and size of the files read and
+written. Files that only pass through memory are counted through the
+yielded stage's read()/wrote(). Without either option stage() does nothing.
+"""
+import sys
+import os
+import json
+import time
+import atexit
+import threading
+from contextlib import contextmanager
+
+class Stage:
+    """File counters for one run of a stage."""
+
+    def __init__(self):
+        self.files_read = self.bytes_read = 0
+        self.files_written = self.bytes_written = 0
+
+    def read(self, nbytes, files=1):
+        self.files_read += files
+        self.bytes_read += nbytes
+
+    def wrote(self, nbytes, files=1):
+        self.files_written += files
+        self.bytes_written += nbytes
+
+class NullStage:
+    def read(self, nbytes, files=1):
+        pass
+
+    def wrote(self, nbytes, files=1):
+        pass
+
+NULL_STAGE = NullStage()
+
+class Recorder:
+    """Collects stage runs from any thread."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.events = []
+        self.threads = {}
+        self.lock = threading.Lock()
+
+    def record(self, name, start, end, counters):
+        with self.lock:
+            tid = self.threads.setdefault(threading.get_ident(), len(self.threads) + 1)
+            self.events.append((name, start, end, tid, counters))
+
+    def summary(self):
+        """Per-stage totals, in the order the stages first ran."""
+        rows = {}
+        for name, start, end, _, counters in self.events:
+            row = rows.setdefault(name, {'calls': 0, 'seconds': 0.0, 'files_read': 0,
+                                         'bytes_read': 0, 'files_written': 0, 'bytes_written': 0})
+            row['calls'] += 1
+            row['seconds'] += end - start
+            for field in ('files_read', 'bytes_read', 'files_written', 'bytes_written'):
+                row[field] += getattr(counters, field)
+        return rows
+
+    def print_summary(self):
+        total = time.perf_counter() - self.start
+        print(f"\n{'stage':<10} {'calls':>6} {'wall ms':>10} {'%':>6} {'files r':>8} "
+              f"{'read':>10} {'files w':>8} {'written':>10}")
+        for name, row in self.summary().items():
+            print(f"{name:<10} {row['calls']:>6} {row['seconds'] * 1000:>10.2f} "
+                  f"{row['seconds'] / total * 100:>6.1f} {row['files_read']:>8} "
+                  f"{format_bytes(row['bytes_read']):>10} {row['files_written']:>8} "
+                  f"{format_bytes(row['bytes_written']):>10}")
+        print(f"{'total':<10} {'':>6} {total * 1000:>10.2f}")
+
+    def write_trace(self, path):
+        """Write the runs as Chrome trace-event 'complete' events."""
+        pid = os.getpid()
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                   'args': {'name': os.path.basename(sys.argv[0])}}]
+        for name, start, end, tid, counters in self.events:
+            events.append({
+                'name': name,
+                'ph': 'X',
+                'ts': round((start - self.start) * 1e6, 3),
+                'dur': round((end - start) * 1e6, 3),
+                'pid': pid,
+                'tid': tid,
+                'args': vars(counters),
+            })
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+_recorder = None
+
+def format_bytes(n):
+    for unit in ('B', 'KiB', 'MiB'):
+        if n < 1024 or unit == 'MiB':
+            return f'{n:.0f} {unit}' if unit == 'B' else f'{n:.1f} {unit}'
+        n /= 1024
+
+def file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+@contextmanager
+def stage(name, reads=(), writes=()):
+    """Time the enclosed block as a run of stage name.
+
+    reads are measured on entry and writes on exit; missing files are skipped.
+    """
+    if _recorder is None:
+        yield NULL_STAGE
+        return
+    counters = Stage()
+    for path in reads:
+        size = file_size(path)
+        if size is not None:
+            counters.read(size)
+    start = time.perf_counter()
+    try:
+        yield counters
+    finally:
+        end = time.perf_counter()
+        for path in writes:
+            size = file_size(path)
+            if size is not None:
+                counters.wrote(size)
+        _recorder.record(name, start, end, counters)
+
+def enable(show_summary=True, trace_path=None):
+    """Start recording; the summary and trace are written when the process exits."""
+    global _recorder
+    _recorder = recorder = Recorder()
+
+    def report():
+        if show_summary:
+            recorder.print_summary()
+        if trace_path:
+            recorder.write_trace(trace_path)
+            print(f"Trace written to {trace_path}")
+    atexit.register(report)
+
+def parse_args(args):
+    """Strip --timings and --trace FILE from args, enabling recording if present.
+
+    Returns the remaining arguments.
+    """
+    args = list(args)
+    show_summary = '--timings' in args
+    while '--timings' in args:
+        args.remove('--timings')
+    trace_path = None
+    if '--trace' in args:
+        i = args.index('--trace')
+        if i + 1 >= len(args):
+            print("Error: --trace needs a file name")
+            sys.exit(1)
+        trace_path = args[i + 1]
+        del args[i:i + 2]
+    if show_summary or trace_path:
+        enable(show_summary, trace_path)
+    return args
@@ -3,6 +3,18 @@ import sys
 from pathlib import Path
 from datetime import datetime
 import re
+import os
+
+import templates
+import markup
+import timings
+import compress
+import search
+import related
+import metadata
+import taxonomy
+import update1
+from posts import Post, file_hash
 
 def get_post_date(post_dir):
     """Get post date from date.txt if it exists, otherwise use current date."""
@@ -17,100 +29,52 @@ def get_post_date(post_dir):
                 return datetime.now()
     return datetime.now()
 
+def iter_html(lines, on_text=None, front_matter=True):
+    """Yield HTML fragments for the source lines, setting a trailing signoff apart."""
+    return markup.iter_html(lines, on_text, signoff=True, front_matter=front_matter)
+
 def text_to_html(content):
     """Convert text content to HTML paragraphs."""
-    lines = content.strip().split('\n')
-    
-    # Look for signoff
-    signoff_patterns = [
-        'See ya!', 'Until next time', 'Best', 'Sincerely', 'Cheers', '-', '—'
-    ]
-    
-    signoff_start = -1
-    for i in range(len(lines) - 3, len(lines)):
-        if i >= 0:
-            line = lines[i].strip()
-            if any(line.startswith(pattern) for pattern in signoff_patterns) or (
-                len(line) < 30 and any(name in line.lower() for name in ['kevin', 'kev'])):
-                signoff_start = i
-                break
-    
-    html_parts = []
-    
-    if signoff_start != -1:
-        # Main content
-        for line in lines[:signoff_start]:
-            if line.strip():
-                if line.strip().startswith('# '):
-                    html_parts.append(f'<h3>{line.strip()[2:].strip()}</h3>')
-                else:
-                    html_parts.append(f'<p>{line.strip()}</p>')
-        
-        # Signoff
-        signoff = '<br>'.join(line.strip() for line in lines[signoff_start:] if line.strip())
-        html_parts.append(f'<p class="signoff">{signoff}</p>')
-    else:
-        for line in lines:
-            if line.strip():
-                if line.strip().startswith('# '):
-                    html_parts.append(f'<h3>{line.strip()[2:].strip()}</h3>')
-                else:
-                    html_parts.append(f'<p>{line.strip()}</p>')
-    
-    return '\n'.join(html_parts)
-
-def generate_html(title, content, date):
+    return '\n'.join(iter_html(content.split('\n')))
+
+def iter_page(title, chunks, date, related=(), fields={}):
+    """Yield the HTML for a post, with the body fragments streamed from chunks.
+
+    related are the keys of the posts to link at the end (see related.py);
+    fields are the post's front-matter fields, whose tags and series are linked.
+    """
+    return templates.iter_post_page(f'{title} - Kevin Liu', title, chunks, date, 'essays',
+                                    related=update1.related_block('essay', related),
+                                    taxonomy=templates.render_taxonomy(*taxonomy.links(fields)))
+
+def generate_html(title, content, date, related=(), fields={}):
     """Generate the HTML for a post."""
-    return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - Kevin Liu</title>
-    <link rel="stylesheet" href="/assets/css/styles.css">
-</head>
-<body>
-    <div class="container">
-        <header class="header">
-            <div>
-                <h1>Kevin Liu</h1>
-                <nav>
-                    <a href="/">Home</a>
-                    <a href="/essays">Essays</a>
-                    <a href="/engineering">Engineering</a>
-                    <a href="/games">Games</a>
-                    <a href="/about">About</a>
-                </nav>
-            </div>
-        </header>
-
-        <main class="post-content">
-            <article>
-                <header class="post-header">
-                    <h2>{title}</h2>
-                    <time datetime="{date.strftime('%Y-%m-%d')}">{date.strftime('%B %d, %Y')}</time>
-                </header>
-
-                <section class="post-body">
-                    {content}
-                </section>
-            </article>
-
-            <nav class="post-navigation">
-                <a href="/essays">← Back to Essays</a>
-            </nav>
-        </main>
-
-        <footer class="footer">
-            © 2024 Kevin Liu. All rights reserved.
-        </footer>
-    </div>
-</body>
-</html>'''
+    return ''.join(iter_page(title, [content], date, related, fields))
+
+def write_post(title, source_path, date, html_path, on_text=None, related=()):
+    """Stream source_path straight into html_path, line by line.
+
+    The page is written to a temporary file and moved into place, so a
+    failure halfway never leaves a truncated page behind.
+    """
+    tmp_path = Path(html_path).with_suffix('.html.tmp')
+    with timings.stage('render', reads=[source_path], writes=[html_path]):
+        try:
+            with open(source_path, 'r', encoding='utf-8') as source, \
+                    open(tmp_path, 'w', encoding='utf-8') as out:
+                fields, body = markup.split_front_matter(source)
+                chunks = iter_html(body, on_text, front_matter=False)
+                out.writelines(iter_page(title, chunks, date, related, fields))
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, html_path)
+        compress.refresh_sidecars(html_path)
 
 def main():
+    sys.argv[1:] = timings.parse_args(sys.argv[1:])
     if len(sys.argv) != 2:
-        print("Usage: python update_post.py <year/post-name>")
+        print("Usage: python update_post.py <year/post-name> [--timings] [--trace FILE]")
         print("Example: python update_post.py 2024/my-first-post")
         sys.exit(1)
 
@@ -130,25 +94,30 @@ def main():
     title = post_name.replace('-', ' ').title()
     date = get_post_date(post_dir)
 
-    # Read and convert content
+    # Stream the source into the page, collecting its search terms and metadata
+    key = post_dir.as_posix()
+    lists, related_changed = related.update_related([key])
+    terms = search.TermCollector()
+    collector = metadata.MetadataCollector(terms)
+    collector(title)
     try:
-        with open(source_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        write_post(title, source_path, date, post_dir / 'index.html', collector, lists.get(key, []))
     except UnicodeDecodeError:
         print("Error: source.txt must be in UTF-8 encoding")
         sys.exit(1)
 
-    html_content = text_to_html(content)
-    post_html = generate_html(title, html_content, date)
-
-    # Save HTML
-    with open(post_dir / 'index.html', 'w', encoding='utf-8') as f:
-        f.write(post_html)
+    # The same index, search, feed and related updates as update1.py
+    metadata.record({key: collector.metadata(Post('essay', year, post_name), date, file_hash(source_path))})
+    index_paths, related_pages = update1.update_listings(key, lists, related_changed, terms.terms)
 
     print(f"\nPost updated successfully!")
     print(f"- Location: {post_dir}")
     print(f"- Title: {title}")
     print(f"- Date: {date.strftime('%B %d, %Y')}")
+    for index_path in index_paths:
+        print(f"- Updated index: {index_path}")
+    for page in related_pages:
+        print(f"- Updated related posts: {page}")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -3,7 +3,31 @@ import sys
 from pathlib import Path
 from datetime import datetime
 import re
-import shutil
+import os
+import hashlib
+
+import templates
+import assets
+import markup
+import timings
+import compress
+import taxonomy
+from backup import backup_file, backup_files, BATCH_ID
+from posts import Post, book_title_and_author, post_from_key, read_post_date, file_hash
+from site_index import write_index
+
+# Files whose contents determine the rendered output of a post. Their hash is
+# recorded in the build manifest so template changes trigger a re-render.
+TEMPLATE_FILES = [Path(__file__), Path(templates.__file__), Path(markup.__file__),
+                  Path(taxonomy.__file__), assets.MANIFEST_PATH]
+
+def template_version():
+    """Hash of the rendering code, used to invalidate previously built pages."""
+    digest = hashlib.sha256()
+    for path in TEMPLATE_FILES:
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
 
 def get_post_date(post_dir):
     """Get post date from date.txt."""
@@ -23,85 +47,197 @@ def get_post_date(post_dir):
             print(f"Error: Invalid date format in date.txt")
             sys.exit(1)
 
+def iter_html(lines, on_text=None, front_matter=True, signoff=False):
+    """Yield the HTML fragments of a post's source lines (see markup.py).
+
+    Works on any iterable of lines (e.g. an open file), so a source never
+    has to be held in memory as a whole. If given, on_text is called with the
+    text of every block as it goes past (e.g. to feed the search index
+    without a second walk over the source). A front-matter block is left
+    out, unless front_matter is False (lines are already a body). With
+    signoff (essays), a trailing signoff is set apart.
+    """
+    return markup.iter_html(lines, on_text, signoff=signoff, front_matter=front_matter)
+
 def text_to_html(content):
     """Convert text content to HTML paragraphs."""
-    lines = content.strip().split('\n')
-    html_parts = []
-    
-    for line in lines:
-        if line.strip():
-            if line.strip().startswith('# '):
-                html_parts.append(f'<h3>{line.strip()[2:].strip()}</h3>')
-            else:
-                html_parts.append(f'<p>{line.strip()}</p>')
-    
-    return '\n'.join(html_parts)
-
-def generate_html(post_type, title, content, date, author=None):
-    """Generate HTML for the post."""
+    return '\n'.join(iter_html(content.split('\n')))
+
+def related_block(post_type, keys):
+    """The related-posts block of a post page, linking the posts in keys."""
+    links = []
+    for key in keys:
+        post = post_from_key(key)
+        try:
+            title, author = post_titles(post.post_type, post.name)
+        except ValueError:
+            continue
+        links.append((post.url, f'{title} by {author}' if author else title))
+    heading = 'Related Book Reviews' if post_type == 'book' else 'Related Essays'
+    return templates.render_related(heading, links)
+
+def iter_page(post_type, title, chunks, date, author=None, related=(), fields={}):
+    """Yield the HTML for the post, with the body fragments streamed from chunks.
+
+    fields are the post's front-matter fields; its tags and series are linked.
+    """
     if post_type == "book":
         page_title = f"{title} by {author} - Book Review - Kevin Liu"
     else:
         page_title = f"{title} - Kevin Liu"
+    return templates.iter_post_page(page_title, title, chunks, date, f'{post_type}s', author,
+                                    related_block(post_type, related),
+                                    templates.render_taxonomy(*taxonomy.links(fields)))
+
+def generate_html(post_type, title, content, date, author=None, related=(), fields={}):
+    """Generate HTML for the post."""
+    return ''.join(iter_page(post_type, title, [content], date, author, related, fields))
+
+def post_titles(post_type, post_name):
+    """(title, author) for a post; author is None for essays."""
+    if post_type == "book":
+        return book_title_and_author(post_name)
+    return post_name.replace('-', ' ').title(), None
+
+def iter_post(post_type, post_name, lines, date, on_text=None, related=()):
+    """Yield a post's full HTML page from its source lines.
+
+    related are the keys of the posts to link at the end (see related.py).
+    The front matter is read first, for the tag and series links.
+    """
+    title, author = post_titles(post_type, post_name)
+    fields, body = markup.split_front_matter(lines)
+    if on_text:
+        on_text(title)
+    chunks = iter_html(body, on_text, front_matter=False, signoff=post_type == 'essay')
+    return iter_page(post_type, title, chunks, date, author, related, fields)
+
+def render_post(post_type, post_name, content, date, on_text=None, related=()):
+    """Render a post's source text to a full HTML page."""
+    return ''.join(iter_post(post_type, post_name, content.split('\n'), date, on_text, related))
+
+def write_post(post_type, post_name, source_path, date, html_path, on_text=None, related=()):
+    """Stream source_path straight into html_path, line by line.
+
+    The page is written to a temporary file and moved into place, so a
+    failure halfway never leaves a truncated page behind.
+    """
+    tmp_path = Path(html_path).with_suffix('.html.tmp')
+    with timings.stage('render', reads=[source_path], writes=[html_path]):
+        try:
+            with open(source_path, 'r', encoding='utf-8') as source, \
+                    open(tmp_path, 'w', encoding='utf-8') as out:
+                out.writelines(iter_post(post_type, post_name, source, date, on_text, related))
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, html_path)
+        compress.refresh_sidecars(html_path)
 
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{page_title}</title>
-    <link rel="stylesheet" href="/assets/css/styles.css">
-</head>
-<body>
-    <div class="container">
-        <header class="header">
-            <div>
-                <h1>Kevin Liu</h1>
-                <nav>
-                    <a href="/">Home</a>
-                    <a href="/essays">Essays</a>
-                    <a href="/books">Books</a>
-                    <a href="/engineering">Engineering</a>
-                    <a href="/games">Games</a>
-                    <a href="/about">About</a>
-                </nav>
-            </div>
-        </header>
-
-        <main class="post-content">
-            <article>
-                <header class="post-header">
-                    <h2>{title}</h2>'''
-
-    if author:  # Add author line for books
-        html += f'\n                    <h3 class="book-author">by {author}</h3>'
-
-    html += f'''
-                    <time datetime="{date.strftime('%Y-%m-%d')}">{date.strftime('%B %d, %Y')}</time>
-                </header>
-
-                <section class="post-body">
-                    {content}
-                </section>
-            </article>
-
-            <nav class="post-navigation">
-                <a href="/{post_type}s">← Back to {post_type.title()}s</a>
-            </nav>
-        </main>
-
-        <footer class="footer">
-            © 2024 Kevin Liu. All rights reserved.
-        </footer>
-    </div>
-</body>
-</html>'''
-
-    return html
+def write_stored_post(content_store, post_type, post_name, key, date, html_path, on_text=None,
+                      related=()):
+    """Write a post kept in a content store to html_path.
+
+    The page cached in the store is reused if it was rendered from the same
+    source with the current templates and related posts; otherwise the post
+    is rendered and the cache refreshed. Returns whether it was rendered
+    (and on_text called).
+    """
+    row = content_store.row(key)
+    version = hashlib.sha256('\n'.join([template_version(), *related]).encode('utf-8')).hexdigest()
+    rendered = row['html'] is None or row['html_version'] != version
+    with timings.stage('render', writes=[html_path]):
+        if rendered:
+            html = render_post(post_type, post_name, row['source'], date, on_text, related)
+            content_store.set_html(key, html, version)
+        else:
+            html = row['html']
+        html_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = Path(html_path).with_suffix('.html.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as out:
+            out.write(html)
+        os.replace(tmp_path, html_path)
+        compress.refresh_sidecars(html_path)
+    return rendered
+
+def write_related_pages(keys, lists, content_store=None):
+    """Re-render the published posts among keys with their new related lists.
+
+    The pages are backed up first. Returns the paths written.
+    """
+    pages = []
+    for key in sorted(keys):
+        post = post_from_key(key)
+        html_path = post.dir / 'index.html'
+        published = content_store.entry(key) if content_store else html_path.exists()
+        if published:
+            pages.append((post, html_path))
+    backup_files([html_path for _, html_path in pages])
+    for post, html_path in pages:
+        related = lists.get(post.key, [])
+        if content_store:
+            write_stored_post(content_store, post.post_type, post.name, post.key,
+                              content_store.date(post.key), html_path, related=related)
+        else:
+            write_post(post.post_type, post.name, post.dir / 'source.txt', read_post_date(post.dir),
+                       html_path, related=related)
+    return [str(html_path) for _, html_path in pages]
+
+def update_listings(key, lists, related_changed, terms=None, content_store=None):
+    """Update everything derived from a post after its page was written.
+
+    Re-renders the posts whose related list changed with it, then its index,
+    tag and series pages, search index (unless terms is None, i.e. the page
+    was not rendered) and feeds. Returns (index paths, related pages).
+    """
+    import search
+    import feeds
+
+    related_pages = write_related_pages(related_changed - {key}, lists, content_store)
+    index_paths = write_index(post_from_key(key).post_type, [key], store=content_store)
+    index_paths += taxonomy.update_taxonomy([key], store=content_store)
+    if terms is not None:
+        search.update_index({key: terms})
+    feeds.write_feeds([key], store=content_store)
+    return index_paths, related_pages
 
 def main():
+    import search
+    import store
+    import related
+    import metadata
+
+    sys.argv[1:] = timings.parse_args(sys.argv[1:])
+    if len(sys.argv) >= 2 and sys.argv[1] == 'build':
+        import build
+        build.main(sys.argv[2:])
+        return
+    if len(sys.argv) >= 2 and sys.argv[1] == 'watch':
+        import watch
+        watch.main(sys.argv[2:])
+        return
+    if len(sys.argv) >= 2 and sys.argv[1] == 'check':
+        import check
+        check.main(sys.argv[2:])
+        return
+    if len(sys.argv) >= 2 and sys.argv[1] == 'deploy-plan':
+        import deploy
+        deploy.main(sys.argv[2:])
+        return
+    if len(sys.argv) >= 2 and sys.argv[1] == 'batch':
+        import batch
+        batch.main(sys.argv[2:])
+        return
+    sys.argv[1:], content_store = store.parse_args(sys.argv[1:])
+
     if len(sys.argv) != 3:
-        print("Usage: python update.py <type> <year/post-name>")
+        print("Usage: python update.py <type> <year/post-name> [--store FILE]")
+        print("       python update.py build [--force] [--jobs N] [--chunksize N] [--store FILE]")
+        print("       python update.py watch [--port N] [--poll] [--no-serve]")
+        print("       python update.py check [--jobs N]")
+        print("       python update.py deploy-plan [--stage DIR|FILE.tar.gz] [--mark-deployed] [--jobs N]")
+        print("       python update.py batch <plan-file> [--check]")
+        print("Add --timings for a per-stage summary, or --trace FILE for a Chrome trace.")
         print("Example: python update.py essay 2024/my-first-post")
         print("Example: python update.py book 2024/the-great-gatsby-by-f-scott-fitzgerald")
         sys.exit(1)
@@ -116,59 +252,80 @@ def main():
     year, post_name = post_path.split('/')
     post_dir = Path(f'{post_type}s/posts/{year}/{post_name}')
     source_path = post_dir / 'source.txt'
+    key = f'{post_type}s/posts/{year}/{post_name}'
 
-    # Check if source.txt exists
-    if not source_path.exists():
-        print(f"Error: source.txt not found at {source_path}")
-        print("Make sure source.txt exists in the post directory")
-        sys.exit(1)
+    if content_store:
+        if content_store.row(key) is None:
+            print(f"Error: {key} not found in {content_store.path}")
+            sys.exit(1)
+        # An edited source.txt (e.g. from store.py export) replaces the stored one
+        if source_path.exists():
+            try:
+                content_store.set_source(key, source_path.read_text(encoding='utf-8'))
+            except UnicodeDecodeError:
+                print("Error: source.txt must be in UTF-8 encoding")
+                sys.exit(1)
+        date = content_store.date(key)
+        if date is None:
+            date = datetime.now()
+            content_store.set_date(key, date)
+    else:
+        # Check if source.txt exists
+        if not source_path.exists():
+            print(f"Error: source.txt not found at {source_path}")
+            print("Make sure source.txt exists in the post directory")
+            sys.exit(1)
 
-    # Get or create the post date
-    date = get_post_date(post_dir)
+        # Get or create the post date
+        date = get_post_date(post_dir)
 
-    # Create backup of the HTML file if it exists
+    # Back up the HTML file if it exists
     html_path = post_dir / 'index.html'
-    if html_path.exists():
-        backup_path = post_dir / f'index.html.bak'
-        shutil.copy(html_path, backup_path)
-        print(f"Created backup of existing HTML at {backup_path}")
+    if backup_file(html_path):
+        print(f"Backed up existing HTML (batch {BATCH_ID})")
+
+    # The post's related list, and those of the posts it now appears in or left
+    lists, related_changed = related.update_related([key], store=content_store)
 
-    # Read and convert content
+    # Stream the source into the page, indexing it for search and
+    # collecting its metadata on the way
+    terms = search.TermCollector()
+    collector = metadata.MetadataCollector(terms)
+    rendered = True
     try:
-        with open(source_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        if content_store:
+            rendered = write_stored_post(content_store, post_type, post_name, key, date,
+                                         html_path, collector, lists.get(key, []))
+        else:
+            write_post(post_type, post_name, source_path, date, html_path, collector,
+                       lists.get(key, []))
     except UnicodeDecodeError:
         print("Error: source.txt must be in UTF-8 encoding")
         sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
-    html_content = text_to_html(content)
-
-    # Generate appropriate HTML based on post type
-    if post_type == "book":
-        parts = post_name.split('-by-')
-        if len(parts) != 2:
-            print("Error: Book post name must be in format: book-title-by-author")
-            sys.exit(1)
-        
-        book_title = parts[0].replace('-', ' ').title()
-        book_author = parts[1].replace('-', ' ').title()
-        html = generate_html(post_type, book_title, html_content, date, book_author)
-    else:
-        title = post_name.replace('-', ' ').title()
-        html = generate_html(post_type, title, html_content, date)
-
-    # Save HTML
-    with open(html_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    if rendered:
+        # A cached page means the source, and so its terms and metadata, did not change
+        source_hash = content_store.source_hash(key) if content_store else file_hash(source_path)
+        metadata.record({key: collector.metadata(Post(post_type, year, post_name), date, source_hash)})
+    index_paths, related_pages = update_listings(key, lists, related_changed,
+                                                 terms.terms if rendered else None, content_store)
 
     print(f"\n✅ Post HTML generated successfully!")
     print(f"- Location: {post_dir}")
     if post_type == "book":
+        book_title, book_author = book_title_and_author(post_name)
         print(f"- Title: {book_title}")
         print(f"- Author: {book_author}")
     else:
-        print(f"- Title: {title}")
+        print(f"- Title: {post_name.replace('-', ' ').title()}")
     print(f"- Date: {date.strftime('%B %d, %Y')}")
+    for index_path in index_paths:
+        print(f"- Updated index: {index_path}")
+    for page in related_pages:
+        print(f"- Updated related posts: {page}")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
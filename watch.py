@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Watch mode: rebuild posts as their source.txt or date.txt change.
+
+Uses inotify where available (Linux) and falls back to polling mtimes
+elsewhere. Bursts of events (editors often write a file several times per
+save) are debounced into a single rebuild of just the affected posts and
+their index pages, after which any open preview tab is told to reload.
+"""
+import sys
+import os
+import time
+import select
+import threading
+import struct
+import ctypes
+import ctypes.util
+from pathlib import Path
+
+import build
+from posts import SECTIONS
+from serve import Reloader, make_server
+
+WATCHED_FILES = ('source.txt', 'date.txt')
+WATCH_ROOTS = [Path(section) / 'posts' for section in SECTIONS.values()]
+DEBOUNCE = 0.03  # seconds of quiet that end a burst of events
+POLL_INTERVAL = 0.1
+
+class InotifyWatcher:
+    """Recursive inotify watch over the post directories."""
+
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_ISDIR = 0x40000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT = struct.Struct('iIII')
+
+    def __init__(self, roots):
+        libc_name = ctypes.util.find_library('c')
+        if not libc_name or not sys.platform.startswith('linux'):
+            raise OSError("inotify is not available")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init()
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init failed")
+        self.dirs = {}
+        for root in roots:
+            if root.is_dir():
+                self.add_tree(root)
+
+    def add_tree(self, root):
+        for dirpath, _, _ in os.walk(root):
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dirpath), self.MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"Could not watch {dirpath}")
+            self.dirs[wd] = Path(dirpath)
+
+    def changes(self, timeout):
+        """Paths changed within timeout seconds (an empty set if none)."""
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        data = os.read(self.fd, 64 * 1024)
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            if wd not in self.dirs:
+                continue
+            path = self.dirs[wd] / name
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO) and path.is_dir():
+                    # New post or year directory: watch it, and pick up files
+                    # that were written before the watch existed
+                    self.add_tree(path)
+                    changed.update(p for f in WATCHED_FILES for p in path.rglob(f))
+                continue
+            changed.add(path)
+        return changed
+
+class PollingWatcher:
+    """Portable fallback that compares mtimes and sizes every POLL_INTERVAL."""
+
+    def __init__(self, roots):
+        self.roots = roots
+        self.state = self.snapshot()
+
+    def snapshot(self):
+        state = {}
+        for root in self.roots:
+            for name in WATCHED_FILES:
+                for path in root.glob(f'*/*/{name}'):
+                    try:
+                        stat = path.stat()
+                    except FileNotFoundError:
+                        continue
+                    state[path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def changes(self, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            state = self.snapshot()
+            changed = {p for p in state.keys() | self.state.keys()
+                       if state.get(p) != self.state.get(p)}
+            self.state = state
+            remaining = deadline - time.monotonic()
+            if changed or remaining <= 0:
+                return changed
+            time.sleep(min(POLL_INTERVAL, remaining))
+
+def make_watcher(roots, poll=False):
+    if not poll:
+        try:
+            return InotifyWatcher(roots)
+        except OSError as e:
+            print(f"Warning: {e}; falling back to polling")
+    return PollingWatcher(roots)
+
+def affected_posts(paths):
+    """Map changed file paths to the keys of the posts they belong to."""
+    keys = set()
+    for path in paths:
+        if path.name not in WATCHED_FILES:
+            continue
+        parts = path.parts
+        # <section>/posts/<year>/<name>/<file>
+        if len(parts) >= 5 and parts[-4] == 'posts' and parts[-5] in SECTIONS.values():
+            keys.add('/'.join(parts[-5:-1]))
+    return keys
+
+def next_batch(watcher):
+    """Block until something changes, then collect events until DEBOUNCE of quiet."""
+    changed = set()
+    while not changed:
+        changed = watcher.changes(timeout=1.0)
+    while True:
+        more = watcher.changes(timeout=DEBOUNCE)
+        if not more:
+            return changed
+        changed |= more
+
+def watch(watcher, reloader=None):
+    while True:
+        keys = affected_posts(next_batch(watcher))
+        if not keys:
+            continue
+        start = time.perf_counter()
+        build.build_posts(keys)
+        if reloader:
+            reloader.notify()
+        print(f"Rebuilt {len(keys)} post(s) in {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+def usage():
+    print("Usage: python watch.py [--port N] [--poll] [--no-serve]")
+    sys.exit(1)
+
+def main(args=None):
+    args = list(sys.argv[1:] if args is None else args)
+    port, poll, serve = 8000, False, True
+    while args:
+        arg = args.pop(0)
+        if arg == '--poll':
+            poll = True
+        elif arg == '--no-serve':
+            serve = False
+        elif arg == '--port' and args and args[0].isdigit():
+            port = int(args.pop(0))
+        else:
+            usage()
+
+    watcher = make_watcher(WATCH_ROOTS, poll)
+    reloader = None
+    if serve:
+        reloader = Reloader()
+        server = make_server(port, reloader=reloader)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"Previewing at http://127.0.0.1:{port}/ with live reload")
+
+    print(f"Watching {', '.join(map(str, WATCH_ROOTS))} ({type(watcher).__name__}). Ctrl+C to stop.\n")
+    try:
+        watch(watcher, reloader)
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()